@@ -0,0 +1,116 @@
+"""
+Measures how many ``MESSAGE_CREATE`` events per second ``WebSocket.handle``
+processes, against the former per-event ``__import__`` lookup, both with
+and without a listener subscribed to the event, and with lazy models.
+
+Usage: python -m benchmarks.dispatch [events]
+"""
+import sys
+from asyncio import new_event_loop, set_event_loop
+from logging import CRITICAL, disable
+from time import perf_counter
+
+from orjson import dumps, loads
+
+set_event_loop(new_event_loop())
+disable(CRITICAL)
+
+from bunny.api.dispatch import Listener  # noqa: E402
+from bunny.api.gateway import WebSocket  # noqa: E402
+from bunny.api.models.intents import Intents  # noqa: E402
+
+# A recorded MESSAGE_CREATE frame, with the identifying fields scrubbed.
+FRAME: bytes = dumps(
+    {
+        "op": 0,
+        "s": 42,
+        "t": "MESSAGE_CREATE",
+        "d": {
+            "type": 0,
+            "tts": False,
+            "timestamp": "2021-11-06T18:28:32.468000+00:00",
+            "referenced_message": None,
+            "pinned": False,
+            "nonce": "906612394849779712",
+            "mentions": [],
+            "mention_roles": [],
+            "mention_everyone": False,
+            "member": {
+                "roles": ["852402668294766613"],
+                "premium_since": None,
+                "pending": False,
+                "nick": None,
+                "mute": False,
+                "joined_at": "2021-06-11T15:32:21.469000+00:00",
+                "hoisted_role": None,
+                "deaf": False,
+                "avatar": None,
+            },
+            "id": "906612395827023882",
+            "flags": 0,
+            "embeds": [],
+            "edited_timestamp": None,
+            "content": "hello world",
+            "components": [],
+            "channel_id": "852402668294766615",
+            "author": {
+                "username": "bunny",
+                "public_flags": 0,
+                "id": "242351388137488384",
+                "discriminator": "0001",
+                "avatar": None,
+            },
+            "attachments": [],
+            "guild_id": "852402668294766612",
+        },
+    }
+)
+
+
+class Sink(Listener):
+    """A listener which drops dispatched events instead of scheduling tasks."""
+
+    def dispatch(self, name: str, *args, **kwargs) -> None:
+        pass
+
+
+async def on_message_create(message) -> None:
+    pass
+
+
+def legacy_handle(ws: WebSocket, event: str, data: dict) -> None:
+    """The dispatch path prior to the event registry."""
+    if event != "TYPING_START":
+        name: str = event.lower()
+        path: str = "bunny"
+        path += ".models" if event == "INTERACTION_CREATE" else ".api.models"
+        obj = getattr(__import__(path), name.split("_")[0].capitalize())
+        ws.dispatch.dispatch(f"on_{name}", obj(**data))
+        ws.dispatch.dispatch("raw_socket_create", data)
+
+
+def run(handle, ws: WebSocket, events: int) -> float:
+    # Frames are decoded beforehand so that only the dispatch path is timed.
+    streams: list = [loads(FRAME) for _ in range(events)]
+    start: float = perf_counter()
+    for stream in streams:
+        handle(ws, stream["t"], stream["d"])
+    return events / (perf_counter() - start)
+
+
+if __name__ == "__main__":
+    events: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    ws = WebSocket(intents=Intents.DEFAULT, dispatch=Sink())
+    before: float = run(legacy_handle, ws, events)
+    unsubscribed: float = run(WebSocket.handle, ws, events)
+
+    ws.dispatch.register(on_message_create)
+    subscribed: float = run(WebSocket.handle, ws, events)
+
+    ws.lazy = True
+    lazy: float = run(WebSocket.handle, ws, events)
+
+    print(f"before:                {before:,.0f} events/s")
+    print(f"after (subscribed):    {subscribed:,.0f} events/s ({subscribed / before:.2f}x)")
+    print(f"after (lazy):          {lazy:,.0f} events/s ({lazy / before:.2f}x)")
+    print(f"after (unsubscribed):  {unsubscribed:,.0f} events/s ({unsubscribed / before:.2f}x)")
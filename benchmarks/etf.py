@@ -0,0 +1,128 @@
+"""
+Measures how long ``WebSocket.recv`` takes to decode ``READY`` and ``GUILD_CREATE``
+frames with the ``json`` encoding, decoded by orjson, and with the ``etf`` encoding.
+
+Snowflakes are strings in the JSON frames and integers in the ETF ones, as the
+gateway sends them, so the ETF path never converts them back from strings.
+Frames of a JSON recording can be measured instead with ``--path``.
+
+Usage: python -m benchmarks.etf [--path PATH] [--rounds N] [--guilds N] [--members N]
+"""
+from argparse import ArgumentParser
+from asyncio import get_event_loop
+from time import perf_counter
+from typing import Any, List
+
+from orjson import dumps, loads
+
+from benchmarks.dispatch import FRAME  # also sets up the loop and silences logging
+from bunny.api import etf
+from bunny.api.gateway import WebSocket
+from bunny.api.mock import guild_create
+from bunny.api.models.intents import Intents
+from bunny.api.replay import BINARY, CONNECT, TEXT, GatewayRecorder, ReplaySession
+
+
+def snowflakes(obj: Any) -> Any:
+    """Turns the snowflakes of a JSON payload into integers, as ETF payloads carry them."""
+    if isinstance(obj, dict):
+        return {key: snowflakes(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [snowflakes(item) for item in obj]
+    if isinstance(obj, str) and obj.isdigit() and len(obj) >= 17:
+        return int(obj)
+    return obj
+
+
+def ready(guilds: int) -> dict:
+    """Builds a ``READY`` packet of unavailable guilds."""
+    return {
+        "op": 0,
+        "s": 1,
+        "t": "READY",
+        "d": {
+            "v": 9,
+            "session_id": "0123456789abcdef0123456789abcdef",
+            "user": {"id": "242351388137488384", "username": "bunny", "discriminator": "0001"},
+            "guilds": [
+                {"id": str(852402668294766612 + guild), "unavailable": True}
+                for guild in range(guilds)
+            ],
+        },
+    }
+
+
+def large_guild(members: int) -> dict:
+    """Builds a ``GUILD_CREATE`` packet of a guild with many members and channels."""
+    data: dict = guild_create(852402668294766612)
+    data["channels"] = [
+        {"id": str(852402668294766613 + channel), "type": 0, "name": f"channel-{channel}"}
+        for channel in range(members // 10)
+    ]
+    data["members"] = [
+        {
+            "user": {
+                "id": str(242351388137488384 + member),
+                "username": f"member {member}",
+                "discriminator": "0001",
+                "avatar": None,
+            },
+            "roles": ["852402668294766613"],
+            "nick": None,
+            "joined_at": "2021-06-11T15:32:21.469000+00:00",
+            "deaf": False,
+            "mute": False,
+        }
+        for member in range(members)
+    ]
+    data["member_count"] = members
+    return {"op": 0, "s": 2, "t": "GUILD_CREATE", "d": data}
+
+
+async def measure(encoding: str, frames: List[Any], rounds: int) -> float:
+    """Returns the average time in seconds ``WebSocket.recv`` takes per frame."""
+    ws = WebSocket(intents=Intents.DEFAULT, encoding=encoding)
+    ws.session = session = ReplaySession()
+    kind: int = BINARY if encoding == "etf" else TEXT
+    elapsed: float = 0.0
+
+    for _ in range(rounds):
+        for frame in frames:
+            session.push(kind, frame)
+            start: float = perf_counter()
+            await ws.recv()
+            elapsed += perf_counter() - start
+
+    return elapsed / (rounds * len(frames))
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--path", help="a recording of uncompressed JSON frames to measure")
+    parser.add_argument("--rounds", type=int, default=20, help="times every frame is decoded")
+    parser.add_argument("--guilds", type=int, default=2500, help="guilds of the READY packet")
+    parser.add_argument("--members", type=int, default=5000, help="members of the GUILD_CREATE")
+    args = parser.parse_args()
+
+    if args.path is None:
+        packets: dict = {
+            "READY": ready(args.guilds),
+            "GUILD_CREATE": large_guild(args.members),
+            "MESSAGE_CREATE": loads(FRAME),
+        }
+    else:
+        packets = {}
+        for _, kind, data in GatewayRecorder.read(args.path):
+            if kind != CONNECT:
+                packet: dict = loads(data)
+                packets.setdefault(packet.get("t") or f"op {packet.get('op')}", packet)
+
+    loop = get_event_loop()
+    for name, packet in packets.items():
+        text: bytes = dumps(packet)
+        binary: bytes = etf.encode(snowflakes(packet))
+        json: float = loop.run_until_complete(measure("json", [text], args.rounds))
+        term: float = loop.run_until_complete(measure("etf", [binary], args.rounds))
+        print(f"{name}:")
+        print(f"  json (orjson):  {json * 1e3:,.3f}ms per frame, {len(text):,} bytes")
+        print(f"  etf:            {term * 1e3:,.3f}ms per frame, {len(binary):,} bytes")
@@ -7,6 +7,7 @@ A module for senpai that adds slash commands
 from .api import *  # noqa: F401 F403
 from .base import *  # noqa: F401 F403
 from .client import *  # noqa: F401 F403
+from .cluster import *  # noqa: F401 F403
 from .context import *  # noqa: F401 F403
 from .enums import *  # noqa: F401 F403
 from .ext import *  # noqa: F401 F403
@@ -2,6 +2,11 @@ from ..base import *  # noqa: F401 F403
 from .cache import *  # noqa: F401 F403
 from .enums import *  # noqa: F401 F403
 from .error import *  # noqa: F401 F403
+from .etf import *  # noqa: F401 F403
 from .gateway import *  # noqa: F401 F403
 from .http import *  # noqa: F401 F403
+from .identify import *  # noqa: F401 F403
 from .models import *  # noqa: F401 F403
+from .monitor import *  # noqa: F401 F403
+from .ratelimit import *  # noqa: F401 F403
+from .replay import *  # noqa: F401 F403
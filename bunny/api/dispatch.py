@@ -1,12 +1,433 @@
-from asyncio import get_event_loop
+from asyncio import Event, Future, Task, get_event_loop, iscoroutinefunction, wait_for
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial, wraps
+from itertools import count
 from logging import Logger, basicConfig, getLogger
-from typing import Coroutine, Optional
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from ..base import Data
+from .enums import OverflowPolicy
+from .models.misc import DictSerializerMixin
 
 basicConfig(level=Data.LOGGER)
 log: Logger = getLogger("dispatch")
 
+# Events about the guild or channel an ordered key stands for, which carry it as their own ID.
+OWN_EVENTS: Dict[str, FrozenSet[str]] = {
+    "guild_id": frozenset(("on_guild_create", "on_guild_update", "on_guild_delete")),
+    "channel_id": frozenset(
+        (
+            "on_channel_create",
+            "on_channel_update",
+            "on_channel_delete",
+            "on_thread_create",
+            "on_thread_update",
+            "on_thread_delete",
+        )
+    ),
+}
+
+# Where the values of fast-path keys are looked up in dispatched data,
+# tried in order. Keys missing from here are looked up by their own name.
+KEY_PATHS: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    "custom_id": (("custom_id",), ("data", "custom_id")),
+    "message_id": (("message_id",), ("message", "id")),
+    "user_id": (
+        ("user_id",),
+        ("user", "id"),
+        ("member", "user", "id"),
+        ("author", "user", "id"),
+        ("author", "id"),
+    ),
+}
+
+
+def _discard(items: Deque[tuple], item: tuple) -> bool:
+    """Removes an item from a deque by identity, returning whether it was found."""
+    for index, other in enumerate(items):
+        if other is item:
+            del items[index]
+            return True
+    return False
+
+
+class DispatchQueue:
+    """
+    A class representing a bounded queue of dispatched events, running their
+    coroutines within a global and per-event concurrency limit.
+
+    In ordered mode, coroutines of events sharing the same ``guild_id`` or
+    ``channel_id`` run one after the other in the order they were dispatched,
+    while those of different keys still run concurrently.
+
+    .. note::
+        With :attr:`bunny.api.enums.OverflowPolicy.BLOCK`, the gateway stops reading
+        while the queue is full. Handlers slow enough to keep it full for longer than
+        a heartbeat interval will therefore get the connection closed as zombied.
+
+    :ivar int max_size: The amount of events allowed to wait in the queue.
+    :ivar int concurrency: The amount of coroutines allowed to run at once.
+    :ivar typing.Dict[str, int] limits: The amount of coroutines of an event allowed to run at once.
+    :ivar bunny.api.enums.OverflowPolicy policy: What happens to events dispatched to a full queue.
+    :ivar typing.Optional[str] ordered: The key events are serialized by, ``"guild_id"`` or ``"channel_id"``.
+    :ivar int dispatched: The amount of coroutines started.
+    :ivar int dropped: The amount of coroutines dropped from a full queue.
+    :ivar int max_depth: The most events ever waiting in the queue at once.
+    :ivar typing.Optional[bunny.api.monitor.LoopMonitor] monitor: The monitor timing every started coroutine, if attached.
+    """
+
+    __slots__ = (
+        "max_size",
+        "concurrency",
+        "limits",
+        "policy",
+        "ordered",
+        "dispatched",
+        "dropped",
+        "max_depth",
+        "monitor",
+        "_queue",
+        "_deferred",
+        "_lines",
+        "_owners",
+        "_waiting",
+        "_sequence",
+        "_active",
+        "_tasks",
+        "_space",
+    )
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        concurrency: int = 1000,
+        limits: Optional[Dict[str, int]] = None,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        ordered: Optional[str] = None,
+    ) -> None:
+        """
+        :param max_size: The amount of events allowed to wait in the queue. Defaults to ``10000``.
+        :type max_size: int
+        :param concurrency: The amount of coroutines allowed to run at once. Defaults to ``1000``.
+        :type concurrency: int
+        :param limits: The amount of coroutines of an event allowed to run at once, i.e. ``{"on_message_create": 50}``. Defaults to no limit.
+        :type limits: typing.Optional[typing.Dict[str, int]]
+        :param policy: What happens to events dispatched to a full queue. Defaults to :attr:`bunny.api.enums.OverflowPolicy.BLOCK`.
+        :type policy: bunny.api.enums.OverflowPolicy
+        :param ordered: The key events are serialized by, ``"guild_id"`` or ``"channel_id"``. Defaults to ``None``, running every event concurrently.
+        :type ordered: typing.Optional[str]
+        :return: None
+        """
+        if ordered not in (None, "guild_id", "channel_id"):
+            raise ValueError(
+                f"Events can only be ordered by guild_id or channel_id, not {ordered}."
+            )
+
+        self.max_size = max_size
+        self.concurrency = concurrency
+        self.limits = {} if limits is None else limits
+        self.policy = policy
+        self.ordered = ordered
+        self.dispatched = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.monitor = None
+        self._queue: Deque[tuple] = deque()
+        self._deferred: Dict[str, Deque[tuple]] = {}
+        self._lines: Dict[str, Deque[tuple]] = {}
+        self._owners: Dict[str, tuple] = {}
+        # Every waiting event by its sequence number, so in the order they were dispatched.
+        self._waiting: Dict[int, tuple] = {}
+        self._sequence: Iterator[int] = count()
+        self._active: Dict[str, int] = {}
+        self._tasks: Set[Task] = set()
+        self._space: Optional[Event] = None
+
+    @property
+    def depth(self) -> int:
+        """
+        Returns the amount of events waiting in the queue.
+
+        :return: int
+        """
+        return len(self._waiting)
+
+    @property
+    def running(self) -> int:
+        """
+        Returns the amount of coroutines currently running.
+
+        :return: int
+        """
+        return len(self._tasks)
+
+    @property
+    def full(self) -> bool:
+        """
+        Returns whether the queue is full.
+
+        :return: bool
+        """
+        return len(self._waiting) >= self.max_size
+
+    def key(self, name: str, args: tuple) -> Optional[str]:
+        """
+        Returns the key a dispatched event is serialized by in ordered mode.
+
+        Events are keyed by their ``guild_id`` or ``channel_id``. Only the creation,
+        update and deletion of the guild or channel itself, i.e. ``on_guild_create``,
+        fall back to their ``id``, as do threads in channel mode. In guild mode,
+        events outside of a guild fall back to being keyed by their ``channel_id``.
+
+        :param name: The name of the dispatched event.
+        :type name: str
+        :param args: The arguments of the dispatched event.
+        :type args: tuple
+        :return: typing.Optional[str]
+        """
+        if self.ordered is None or not args:
+            return None
+
+        data: Any = args[0]
+        get: Callable = data.get if isinstance(data, dict) else partial(getattr, data)
+        fields: Tuple[str, ...] = (
+            ("guild_id", "channel_id") if self.ordered == "guild_id" else ("channel_id",)
+        )
+
+        if name in OWN_EVENTS[self.ordered]:
+            fields += ("id",)
+
+        for field in fields:
+            value: Any = get(field, None)
+            if value is not None:
+                return str(value)
+
+    def put(self, name: str, coro: Callable, args: tuple, kwargs: dict) -> bool:
+        """
+        Queues a coroutine of a dispatched event, starting it if allowed.
+
+        :param name: The name of the dispatched event.
+        :type name: str
+        :param coro: The coroutine function to run.
+        :type coro: typing.Callable
+        :param args: The arguments of the coroutine.
+        :type args: tuple
+        :param kwargs: The keyword-only arguments of the coroutine.
+        :type kwargs: dict
+        :return: Whether the coroutine was queued.
+        """
+        if self.full:
+            if self.policy == OverflowPolicy.DROP_NEWEST:
+                self.dropped += 1
+                log.warning(f"The dispatch queue is full, dropping {name}.")
+                return False
+            if self.policy == OverflowPolicy.DROP_OLDEST:
+                dropped: str = self._drop_oldest()
+                self.dropped += 1
+                log.warning(f"The dispatch queue is full, dropping {dropped}.")
+
+        item: tuple = (name, coro, args, kwargs, self.key(name, args), next(self._sequence))
+        self._queue.append(item)
+        self._waiting[item[5]] = item
+        self.max_depth = max(self.max_depth, len(self._waiting))
+        self._pump()
+        return True
+
+    async def wait(self) -> None:
+        """Waits until the queue has room again, when blocking on overflow."""
+        if self.policy != OverflowPolicy.BLOCK:
+            return
+        while self.full:
+            if self._space is None:
+                self._space = Event()
+            self._space.clear()
+            log.debug(f"The dispatch queue is full ({len(self._waiting)} events), waiting.")
+            await self._space.wait()
+
+    def _drop_oldest(self) -> str:
+        # Events put back at the front of the queue are not necessarily the oldest,
+        # which are found by their sequence number instead.
+        item: tuple = self._waiting.pop(next(iter(self._waiting)))
+        for lines, at in ((self._lines, item[4]), (self._deferred, item[0])):
+            line: Optional[Deque[tuple]] = lines.get(at)
+            if line is not None and _discard(line, item):
+                if not line:
+                    del lines[at]
+                break
+        else:
+            _discard(self._queue, item)
+
+        if item[4] is not None and self._owners.get(item[4]) is item:
+            self._release(item[4])
+        return item[0]
+
+    def _release(self, key: str) -> None:
+        line: Optional[Deque[tuple]] = self._lines.get(key)
+        if line:
+            # The next event of the key goes first, ahead of every other one.
+            self._owners[key] = line.popleft()
+            self._queue.appendleft(self._owners[key])
+            if not line:
+                del self._lines[key]
+        else:
+            del self._owners[key]
+
+    def _pump(self) -> None:
+        while self._queue and len(self._tasks) < self.concurrency:
+            item: tuple = self._queue.popleft()
+            name: str = item[0]
+            key: Optional[str] = item[4]
+
+            if key is not None:
+                owner: Optional[tuple] = self._owners.setdefault(key, item)
+                if owner is not item:
+                    # Waits for every earlier event of the same key to be done.
+                    self._lines.setdefault(key, deque()).append(item)
+                    continue
+
+            limit: Optional[int] = self.limits.get(name)
+            if limit is not None and self._active.get(name, 0) >= limit:
+                # Set aside until a coroutine of the same event is done,
+                # so that it does not hold back the events behind it.
+                self._deferred.setdefault(name, deque()).append(item)
+                continue
+
+            del self._waiting[item[5]]
+            self._start(item)
+
+        if self._space is not None and not self.full:
+            self._space.set()
+
+    def _start(self, item: tuple) -> None:
+        name, coro, args, kwargs = item[:4]
+        coroutine: Coroutine = coro(*args, **kwargs)
+        if self.monitor is not None:
+            coroutine = self.monitor.wrap(name, coro, coroutine)
+        task: Task = get_event_loop().create_task(coroutine)
+        self._tasks.add(task)
+        self._active[name] = self._active.get(name, 0) + 1
+        self.dispatched += 1
+        task.add_done_callback(lambda _task: self._done(item, _task))
+        log.debug("DISPATCH: %s", coro)
+
+    def _done(self, item: tuple, task: Task) -> None:
+        name: str = item[0]
+        self._tasks.discard(task)
+        self._active[name] -= 1
+
+        deferred: Optional[Deque[tuple]] = self._deferred.get(name)
+        if deferred:
+            self._queue.appendleft(deferred.popleft())
+            if not deferred:
+                del self._deferred[name]
+
+        if item[4] is not None:
+            self._release(item[4])
+
+        if not task.cancelled() and task.exception() is not None:
+            log.error(f"An error occurred while dispatching {name}.", exc_info=task.exception())
+
+        self._pump()
+
+
+class Waiter:
+    """
+    A class representing a pending :meth:`bunny.api.dispatch.Listener.wait_for`.
+
+    :ivar asyncio.Future future: The future resolved with the matching event.
+    :ivar typing.Optional[typing.Callable[..., bool]] check: The predicate the event has to pass.
+    :ivar typing.Dict[str, str] keys: The values the keys of the event have to be equal to.
+    """
+
+    __slots__ = ("future", "check", "keys")
+
+    def __init__(
+        self, future: Future, check: Optional[Callable[..., bool]], keys: Dict[str, str]
+    ) -> None:
+        """
+        :param future: The future resolved with the matching event.
+        :type future: asyncio.Future
+        :param check: The predicate the event has to pass.
+        :type check: typing.Optional[typing.Callable[..., bool]]
+        :param keys: The values the keys of the event have to be equal to.
+        :type keys: typing.Dict[str, str]
+        :return: None
+        """
+        self.future = future
+        self.check = check
+        self.keys = keys
+
+
+def lookup(data: Any, key: str) -> Optional[str]:
+    """
+    Looks up the value of a fast-path key in dispatched data.
+
+    :param data: The dispatched data, either a model or a dict.
+    :type data: typing.Any
+    :param key: The name of the key, i.e. ``"custom_id"``.
+    :type key: str
+    :return: typing.Optional[str]
+    """
+    for path in KEY_PATHS.get(key, ((key,),)):
+        value: Any = data
+        for part in path:
+            value = value.get(part) if isinstance(value, dict) else getattr(value, part, None)
+            if value is None:
+                break
+        if value is not None:
+            return str(value)
+
+
+class Payload:
+    """
+    A class representing a model sent to a process pool as its raw data,
+    to be built back into the same model in the worker process.
+
+    :ivar typing.Type cls: The class of the model.
+    :ivar dict data: The raw data of the model.
+    """
+
+    __slots__ = ("cls", "data")
+
+    def __init__(self, model: DictSerializerMixin) -> None:
+        """
+        :param model: The model to send.
+        :type model: bunny.api.models.misc.DictSerializerMixin
+        :return: None
+        """
+        self.cls = type(model)
+        self.data = model._json
+
+    def load(self) -> DictSerializerMixin:
+        """
+        Builds the model back from its raw data.
+
+        :return: bunny.api.models.misc.DictSerializerMixin
+        """
+        return self.cls(**self.data)
+
+
+def _call(func: Callable, args: tuple, kwargs: dict) -> Any:
+    """Runs a handler within a pool, building back the models sent to a process."""
+    args = tuple(arg.load() if isinstance(arg, Payload) else arg for arg in args)
+    kwargs = {
+        name: value.load() if isinstance(value, Payload) else value
+        for name, value in kwargs.items()
+    }
+    return func(*args, **kwargs)
+
 
 class Listener:
     """
@@ -14,11 +435,22 @@ class Listener:
 
     :ivar asyncio.AbstractEventLoop loop: The coroutine event loop established on.
     :ivar dict events: A list of events being dispatched.
+    :ivar bunny.api.dispatch.DispatchQueue queue: The queue running the coroutines of dispatched events.
+    :ivar dict waiters: The pending waiters of each event, by the key and value they are indexed on.
+    :ivar typing.Dict[str, concurrent.futures.Executor] executors: The pools handlers are offloaded to, created on first use.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, queue: Optional[DispatchQueue] = None) -> None:
+        """
+        :param queue: The queue running the coroutines of dispatched events. Defaults to a new one.
+        :type queue: typing.Optional[bunny.api.dispatch.DispatchQueue]
+        :return: None
+        """
         self.loop = get_event_loop()
         self.events = {}
+        self.queue = DispatchQueue() if queue is None else queue
+        self.waiters: Dict[str, Dict[Optional[str], Dict[Optional[str], Dict[Waiter, None]]]] = {}
+        self.executors: Dict[str, Executor] = {}
 
     def dispatch(self, name: str, *args, **kwargs) -> None:
         r"""
@@ -32,11 +464,181 @@ class Listener:
         :type \**kwargs: dict
         :return: None
         """
+        if name in self.waiters:
+            self.resolve(name, args)
+
         for event in self.events.get(name, []):
-            self.loop.create_task(event(*args, **kwargs))
-            log.debug(f"DISPATCH: {event}")
+            self.queue.put(name, event, args, kwargs)
+
+    def resolve(self, name: str, args: tuple) -> None:
+        """
+        Resolves the waiters of an event matching its dispatched data.
+
+        Only waiters indexed on the values of the event's keys are looked at,
+        so that a waiter only ever runs its check against likely matches.
+
+        :param name: The name of the dispatched event.
+        :type name: str
+        :param args: The arguments of the dispatched event.
+        :type args: tuple
+        :return: None
+        """
+        data: Any = args[0] if args else None
+
+        for key, values in list(self.waiters.get(name, {}).items()):
+            value: Optional[str] = None if key is None else lookup(data, key)
+            if key is not None and value is None:
+                continue
+
+            for waiter in list(values.get(value, ())):
+                if waiter.future.done():
+                    continue
+                try:
+                    if any(lookup(data, k) != v for k, v in waiter.keys.items()):
+                        continue
+                    if waiter.check is not None and not waiter.check(*args):
+                        continue
+                except Exception as exc:
+                    waiter.future.set_exception(exc)
+                else:
+                    waiter.future.set_result(data if len(args) == 1 else args or None)
+                self.discard(name, key, value, waiter)
+
+    def discard(self, name: str, key: Optional[str], value: Optional[str], waiter: Waiter) -> None:
+        """
+        Removes a waiter of an event.
+
+        :param name: The name of the event.
+        :type name: str
+        :param key: The key the waiter is indexed on.
+        :type key: typing.Optional[str]
+        :param value: The value the waiter is indexed on.
+        :type value: typing.Optional[str]
+        :param waiter: The waiter to remove.
+        :type waiter: bunny.api.dispatch.Waiter
+        :return: None
+        """
+        keys: Optional[dict] = self.waiters.get(name)
+        if keys is None or key not in keys or value not in keys[key]:
+            return
+
+        keys[key][value].pop(waiter, None)
+        if not keys[key][value]:
+            del keys[key][value]
+            if not keys[key]:
+                del keys[key]
+                if not keys:
+                    del self.waiters[name]
+
+    async def wait_for(
+        self,
+        name: str,
+        check: Optional[Callable[..., bool]] = None,
+        timeout: Optional[float] = None,
+        **keys: Any,
+    ) -> Any:
+        r"""
+        Waits for an event to be dispatched.
+
+        Keys, i.e. ``custom_id`` or ``message_id``, index the waiter so that it is only
+        looked at when an event with the same value is dispatched, letting thousands of
+        them wait at once at the cost of a single lookup per event.
+
+        i.e. : await listener.wait_for("on_interaction_create", custom_id="confirm", timeout=60)
+
+        :param name: The name of the event to wait for.
+        :type name: str
+        :param check: The predicate the arguments of the event have to pass. Defaults to ``None``.
+        :type check: typing.Optional[typing.Callable[..., bool]]
+        :param timeout: The time in seconds to wait before raising :class:`asyncio.TimeoutError`. Defaults to ``None``.
+        :type timeout: typing.Optional[float]
+        :param \**keys: The values the keys of the event have to be equal to.
+        :type \**keys: typing.Any
+        :return: The argument of the event, or a tuple of them if there are multiple.
+        """
+        _keys: Dict[str, str] = {key: str(value) for key, value in keys.items()}
+        # Indexed on the first key, the other ones are compared on a match.
+        key: Optional[str] = next(iter(_keys), None)
+        value: Optional[str] = None if key is None else _keys.pop(key)
+
+        waiter = Waiter(self.loop.create_future(), check, _keys)
+        self.waiters.setdefault(name, {}).setdefault(key, {}).setdefault(value, {})[waiter] = None
+
+        try:
+            return await wait_for(waiter.future, timeout=timeout)
+        finally:
+            self.discard(name, key, value, waiter)
+
+    def wants(self, name: str) -> bool:
+        """
+        Returns whether anything is listening to an event, so that
+        the data of unwanted events never has to be processed.
+
+        :param name: The name of the event.
+        :type name: str
+        :return: bool
+        """
+        return bool(self.events.get(name)) or name in self.waiters
+
+    def offload(self, func: Callable, executor: str) -> Callable[..., Coroutine]:
+        """
+        Wraps a handler into a coroutine running it in a thread or process pool,
+        so that CPU-bound work never blocks the event loop and its heartbeats.
+
+        .. note::
+            Handlers run in a process pool have to be picklable, module-level functions.
+            Models are sent to them as their raw data and built back in the worker.
+
+        .. warning::
+            Only plain functions can be offloaded. The session, websocket and rate limiters
+            of the client are bound to its event loop, so a coroutine function run on a loop
+            of its own in a pool would fail or deadlock on them. Do the CPU-bound work in
+            an offloaded function, and call the API from a handler on the event loop.
+
+        :param func: The handler to offload, a function which is not a coroutine function.
+        :type func: typing.Callable
+        :param executor: The pool to run the handler in, ``"thread"`` or ``"process"``.
+        :type executor: str
+        :return: typing.Callable[..., typing.Coroutine]
+        """
+        if executor not in ("thread", "process"):
+            raise ValueError(
+                f"Handlers can only be offloaded to a thread or process, not {executor}."
+            )
+        if iscoroutinefunction(func):
+            raise TypeError(
+                f"{func.__name__} is a coroutine function, only functions can be offloaded."
+            )
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            pool: Optional[Executor] = self.executors.get(executor)
+            if pool is None:
+                pool = ThreadPoolExecutor() if executor == "thread" else ProcessPoolExecutor()
+                self.executors[executor] = pool
+
+            if executor == "process":
+                args = tuple(
+                    Payload(arg) if isinstance(arg, DictSerializerMixin) else arg for arg in args
+                )
+                kwargs = {
+                    name: Payload(value) if isinstance(value, DictSerializerMixin) else value
+                    for name, value in kwargs.items()
+                }
+            # Results and errors are given back to the loop like any other handler's.
+            return await self.loop.run_in_executor(pool, _call, func, args, kwargs)
+
+        return wrapper
+
+    def shutdown(self) -> None:
+        """Shuts the pools handlers are offloaded to down, waiting for their running handlers."""
+        for pool in self.executors.values():
+            pool.shutdown()
+        self.executors.clear()
 
-    def register(self, coro: Coroutine, name: Optional[str] = None) -> None:
+    def register(
+        self, coro: Coroutine, name: Optional[str] = None, executor: Optional[str] = None
+    ) -> None:
         """
         Registers a given coroutine as an event to be listened to.
         If the name of the event is not given, it will then be
@@ -48,9 +650,13 @@ class Listener:
         :type coro: typing.Coroutine
         :param name: The name to associate the coroutine with. Defaults to None.
         :type name: typing.Optional[str]
+        :param executor: The pool to run the handler in, ``"thread"`` or ``"process"``, if it is a plain function. Defaults to the event loop.
+        :type executor: typing.Optional[str]
         :return: None
         """
         _name: str = coro.__name__ if name is None else name
+        if executor is not None:
+            coro = self.offload(coro, executor)
         event = self.events.get(_name, [])
         event.append(coro)
 
@@ -1,10 +1,131 @@
-from asyncio import AbstractEventLoop
-from typing import Any, Callable, Coroutine, Optional
+from asyncio import AbstractEventLoop, Event, Future, Task
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .enums import OverflowPolicy
+from .models.misc import DictSerializerMixin
+
+OWN_EVENTS: Dict[str, FrozenSet[str]]
+KEY_PATHS: Dict[str, Tuple[Tuple[str, ...], ...]]
+
+def _discard(items: Deque[tuple], item: tuple) -> bool: ...
+
+class DispatchQueue:
+    __slots__ = (
+        "max_size",
+        "concurrency",
+        "limits",
+        "policy",
+        "ordered",
+        "dispatched",
+        "dropped",
+        "max_depth",
+        "monitor",
+        "_queue",
+        "_deferred",
+        "_lines",
+        "_owners",
+        "_waiting",
+        "_sequence",
+        "_active",
+        "_tasks",
+        "_space",
+    )
+    max_size: int
+    concurrency: int
+    limits: Dict[str, int]
+    policy: OverflowPolicy
+    ordered: Optional[str]
+    dispatched: int
+    dropped: int
+    max_depth: int
+    monitor: Optional[Any]
+    _queue: Deque[tuple]
+    _deferred: Dict[str, Deque[tuple]]
+    _lines: Dict[str, Deque[tuple]]
+    _owners: Dict[str, tuple]
+    _waiting: Dict[int, tuple]
+    _sequence: Iterator[int]
+    _active: Dict[str, int]
+    _tasks: Set[Task]
+    _space: Optional[Event]
+    def __init__(
+        self,
+        max_size: int = 10000,
+        concurrency: int = 1000,
+        limits: Optional[Dict[str, int]] = None,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        ordered: Optional[str] = None,
+    ) -> None: ...
+    @property
+    def depth(self) -> int: ...
+    @property
+    def running(self) -> int: ...
+    @property
+    def full(self) -> bool: ...
+    def key(self, name: str, args: tuple) -> Optional[str]: ...
+    def put(self, name: str, coro: Callable, args: tuple, kwargs: dict) -> bool: ...
+    async def wait(self) -> None: ...
+    def _drop_oldest(self) -> str: ...
+    def _release(self, key: str) -> None: ...
+    def _pump(self) -> None: ...
+    def _start(self, item: tuple) -> None: ...
+    def _done(self, item: tuple, task: Task) -> None: ...
+
+class Waiter:
+    __slots__ = ("future", "check", "keys")
+    future: Future
+    check: Optional[Callable[..., bool]]
+    keys: Dict[str, str]
+    def __init__(
+        self, future: Future, check: Optional[Callable[..., bool]], keys: Dict[str, str]
+    ) -> None: ...
+
+def lookup(data: Any, key: str) -> Optional[str]: ...
+
+class Payload:
+    __slots__ = ("cls", "data")
+    cls: type
+    data: dict
+    def __init__(self, model: DictSerializerMixin) -> None: ...
+    def load(self) -> DictSerializerMixin: ...
+
+def _call(func: Callable, args: tuple, kwargs: dict) -> Any: ...
 
 class Listener:
-    __slots__ = ("loop", "events")
+    __slots__ = ("loop", "events", "queue", "waiters", "executors")
     loop: AbstractEventLoop
     events: dict
-    def __init__(self) -> None: ...
+    queue: DispatchQueue
+    waiters: Dict[str, Dict[Optional[str], Dict[Optional[str], Dict[Waiter, None]]]]
+    executors: Dict[str, Executor]
+    def __init__(self, queue: Optional[DispatchQueue] = None) -> None: ...
     def dispatch(self, name: str, *args, **kwargs) -> None: ...
-    def register(self, coro: Coroutine, name: Optional[str] = None) -> None: ...
+    def resolve(self, name: str, args: tuple) -> None: ...
+    def discard(
+        self, name: str, key: Optional[str], value: Optional[str], waiter: Waiter
+    ) -> None: ...
+    async def wait_for(
+        self,
+        name: str,
+        check: Optional[Callable[..., bool]] = None,
+        timeout: Optional[float] = None,
+        **keys: Any,
+    ) -> Any: ...
+    def wants(self, name: str) -> bool: ...
+    def offload(self, func: Callable, executor: str) -> Callable[..., Coroutine]: ...
+    def shutdown(self) -> None: ...
+    def register(
+        self, coro: Coroutine, name: Optional[str] = None, executor: Optional[str] = None
+    ) -> None: ...
@@ -75,6 +75,52 @@ class WSCloseCodeType(IntEnum):
     DISALLOWED_INTENTS = 4014
 
 
+class GatewayState(IntEnum):
+    """
+    An enumerable object for the state of a connection with the Gateway.
+
+    .. note::
+        This is not part of the senpai API, and only represents how far along
+        :class:`bunny.api.gateway.WebSocket` is in connecting.
+    """
+
+    DISCONNECTED = 0
+    CONNECTING = 1
+    IDENTIFYING = 2
+    RESUMING = 3
+    CONNECTED = 4
+    RECONNECTING = 5
+    CLOSED = 6
+
+
+class GatewayPriority(IntEnum):
+    """
+    An enumerable object for the priority of commands sent to the Gateway.
+    Lower values are sent first when commands are rate limited.
+
+    .. note::
+        This is not part of the senpai API, and is only used by :class:`bunny.api.ratelimit.GatewayRatelimiter`.
+    """
+
+    HEARTBEAT = 0
+    SESSION = 1
+    NORMAL = 2
+    LOW = 3
+
+
+class OverflowPolicy(IntEnum):
+    """
+    An enumerable object for what happens to events dispatched to a full queue.
+
+    .. note::
+        This is not part of the senpai API, and is only used by :class:`bunny.api.dispatch.DispatchQueue`.
+    """
+
+    BLOCK = 0
+    DROP_OLDEST = 1
+    DROP_NEWEST = 2
+
+
 class HTTPResponseType(IntEnum):
     """
     An enumerable object for the HTTP response codes senpai gives out.
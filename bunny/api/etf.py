@@ -0,0 +1,222 @@
+from struct import Struct
+from typing import Any, Dict, Tuple
+from zlib import decompress
+
+__all__ = ("decode", "encode")
+
+VERSION: int = 131
+
+NEW_FLOAT_EXT: int = 70
+COMPRESSED: int = 80
+SMALL_INTEGER_EXT: int = 97
+INTEGER_EXT: int = 98
+FLOAT_EXT: int = 99
+ATOM_EXT: int = 100
+SMALL_TUPLE_EXT: int = 104
+LARGE_TUPLE_EXT: int = 105
+NIL_EXT: int = 106
+STRING_EXT: int = 107
+LIST_EXT: int = 108
+BINARY_EXT: int = 109
+SMALL_BIG_EXT: int = 110
+LARGE_BIG_EXT: int = 111
+SMALL_ATOM_EXT: int = 115
+MAP_EXT: int = 116
+ATOM_UTF8_EXT: int = 118
+SMALL_ATOM_UTF8_EXT: int = 119
+
+_uint16: Struct = Struct(">H")
+_uint32: Struct = Struct(">I")
+_int32: Struct = Struct(">i")
+_double: Struct = Struct(">d")
+
+ATOMS: Dict[str, Any] = {"nil": None, "true": True, "false": False}
+
+
+def _decode(data: bytes, offset: int) -> Tuple[Any, int]:
+    # Tags are checked from the most to the least common in gateway payloads.
+    tag: int = data[offset]
+    offset += 1
+
+    if tag == BINARY_EXT:
+        length: int = _uint32.unpack_from(data, offset)[0]
+        offset += 4
+        return data[offset : offset + length].decode(), offset + length
+
+    if tag == MAP_EXT:
+        arity: int = _uint32.unpack_from(data, offset)[0]
+        offset += 4
+        result: dict = {}
+        for _ in range(arity):
+            # Keys and most values are binaries, decoded in place to save a call.
+            if data[offset] == BINARY_EXT:
+                end: int = offset + 5 + _uint32.unpack_from(data, offset + 1)[0]
+                key: Any = data[offset + 5 : end].decode()
+                offset = end
+            else:
+                key, offset = _decode(data, offset)
+
+            if data[offset] == BINARY_EXT:
+                end = offset + 5 + _uint32.unpack_from(data, offset + 1)[0]
+                result[key] = data[offset + 5 : end].decode()
+                offset = end
+            else:
+                result[key], offset = _decode(data, offset)
+        return result, offset
+
+    if tag == SMALL_INTEGER_EXT:
+        return data[offset], offset + 1
+
+    if tag == SMALL_ATOM_UTF8_EXT or tag == SMALL_ATOM_EXT:
+        length = data[offset]
+        offset += 1
+        atom: str = data[offset : offset + length].decode()
+        return ATOMS.get(atom, atom), offset + length
+
+    if tag == SMALL_BIG_EXT or tag == LARGE_BIG_EXT:
+        if tag == SMALL_BIG_EXT:
+            length = data[offset]
+            offset += 1
+        else:
+            length = _uint32.unpack_from(data, offset)[0]
+            offset += 4
+        sign: int = data[offset]
+        offset += 1
+        # Snowflakes are sent as 64-bit integers, which never need a string conversion.
+        value: int = int.from_bytes(data[offset : offset + length], "little")
+        return -value if sign else value, offset + length
+
+    if tag == LIST_EXT:
+        length = _uint32.unpack_from(data, offset)[0]
+        offset += 4
+        items: list = []
+        for _ in range(length):
+            item, offset = _decode(data, offset)
+            items.append(item)
+        # Proper lists end with an empty list as their tail.
+        _, offset = _decode(data, offset)
+        return items, offset
+
+    if tag == NIL_EXT:
+        return [], offset
+
+    if tag == INTEGER_EXT:
+        return _int32.unpack_from(data, offset)[0], offset + 4
+
+    if tag == NEW_FLOAT_EXT:
+        return _double.unpack_from(data, offset)[0], offset + 8
+
+    if tag == ATOM_UTF8_EXT or tag == ATOM_EXT:
+        length = _uint16.unpack_from(data, offset)[0]
+        offset += 2
+        atom = data[offset : offset + length].decode()
+        return ATOMS.get(atom, atom), offset + length
+
+    if tag == STRING_EXT:
+        length = _uint16.unpack_from(data, offset)[0]
+        offset += 2
+        # Erlang strings are lists of small integers, i.e. the shard of READY.
+        return list(data[offset : offset + length]), offset + length
+
+    if tag == SMALL_TUPLE_EXT or tag == LARGE_TUPLE_EXT:
+        if tag == SMALL_TUPLE_EXT:
+            length = data[offset]
+            offset += 1
+        else:
+            length = _uint32.unpack_from(data, offset)[0]
+            offset += 4
+        items = []
+        for _ in range(length):
+            item, offset = _decode(data, offset)
+            items.append(item)
+        return tuple(items), offset
+
+    if tag == FLOAT_EXT:
+        return float(data[offset : offset + 31].split(b"\x00", 1)[0]), offset + 31
+
+    raise ValueError(f"Unknown ETF tag {tag} at offset {offset - 1}.")
+
+
+def decode(data: bytes) -> Any:
+    """
+    Decodes a payload of the External Term Format.
+
+    Binaries are decoded as strings, ``nil``, ``true`` and ``false`` atoms as
+    ``None``, ``True`` and ``False``, and snowflakes are integers as sent.
+
+    :param data: The encoded payload.
+    :type data: bytes
+    :return: typing.Any
+    """
+    data = bytes(data)
+    if data[0] != VERSION:
+        raise ValueError(f"Unknown ETF version {data[0]}.")
+
+    if data[1] == COMPRESSED:
+        data = decompress(data[6:])
+        return _decode(data, 0)[0]
+
+    return _decode(data, 1)[0]
+
+
+def _encode(obj: Any, buffer: bytearray) -> None:
+    if obj is None or obj is True or obj is False:
+        atom: bytes = b"nil" if obj is None else b"true" if obj else b"false"
+        buffer.append(SMALL_ATOM_UTF8_EXT)
+        buffer.append(len(atom))
+        buffer += atom
+    elif isinstance(obj, str):
+        data: bytes = obj.encode()
+        buffer.append(BINARY_EXT)
+        buffer += _uint32.pack(len(data))
+        buffer += data
+    elif isinstance(obj, int):
+        if 0 <= obj < 256:
+            buffer.append(SMALL_INTEGER_EXT)
+            buffer.append(obj)
+        elif -(2 ** 31) <= obj < 2 ** 31:
+            buffer.append(INTEGER_EXT)
+            buffer += _int32.pack(obj)
+        else:
+            data = abs(obj).to_bytes((abs(obj).bit_length() + 7) // 8, "little")
+            buffer.append(SMALL_BIG_EXT)
+            buffer.append(len(data))
+            buffer.append(1 if obj < 0 else 0)
+            buffer += data
+    elif isinstance(obj, float):
+        buffer.append(NEW_FLOAT_EXT)
+        buffer += _double.pack(obj)
+    elif isinstance(obj, dict):
+        buffer.append(MAP_EXT)
+        buffer += _uint32.pack(len(obj))
+        for key, value in obj.items():
+            _encode(key, buffer)
+            _encode(value, buffer)
+    elif isinstance(obj, (list, tuple)):
+        # As with term_to_binary, lists of small integers are encoded as strings.
+        if 0 < len(obj) < 65536 and all(type(item) is int and 0 <= item < 256 for item in obj):
+            buffer.append(STRING_EXT)
+            buffer += _uint16.pack(len(obj))
+            buffer += bytes(obj)
+        else:
+            if obj:
+                buffer.append(LIST_EXT)
+                buffer += _uint32.pack(len(obj))
+                for item in obj:
+                    _encode(item, buffer)
+            buffer.append(NIL_EXT)
+    else:
+        raise TypeError(f"Objects of type {type(obj).__name__} cannot be encoded to ETF.")
+
+
+def encode(obj: Any) -> bytes:
+    """
+    Encodes an object to the External Term Format.
+
+    :param obj: The object to encode.
+    :type obj: typing.Any
+    :return: bytes
+    """
+    buffer = bytearray((VERSION,))
+    _encode(obj, buffer)
+    return bytes(buffer)
@@ -0,0 +1,32 @@
+from struct import Struct
+from typing import Any, Dict, Tuple
+
+VERSION: int
+NEW_FLOAT_EXT: int
+COMPRESSED: int
+SMALL_INTEGER_EXT: int
+INTEGER_EXT: int
+FLOAT_EXT: int
+ATOM_EXT: int
+SMALL_TUPLE_EXT: int
+LARGE_TUPLE_EXT: int
+NIL_EXT: int
+STRING_EXT: int
+LIST_EXT: int
+BINARY_EXT: int
+SMALL_BIG_EXT: int
+LARGE_BIG_EXT: int
+SMALL_ATOM_EXT: int
+MAP_EXT: int
+ATOM_UTF8_EXT: int
+SMALL_ATOM_UTF8_EXT: int
+_uint16: Struct
+_uint32: Struct
+_int32: Struct
+_double: Struct
+ATOMS: Dict[str, Any]
+
+def _decode(data: bytes, offset: int) -> Tuple[Any, int]: ...
+def decode(data: bytes) -> Any: ...
+def _encode(obj: Any, buffer: bytearray) -> None: ...
+def encode(obj: Any) -> bytes: ...
@@ -1,40 +1,142 @@
 import sys
-from asyncio import get_event_loop, run_coroutine_threadsafe
+from asyncio import Queue, Task, TimeoutError, get_event_loop, sleep, wait_for
 from logging import Logger, basicConfig, getLogger
 from random import random
-from threading import Event, Thread
-from typing import Any, Optional, Union
+from time import perf_counter
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+from uuid import uuid4
+from zlib import decompressobj
 
+from aiohttp import ClientError
 from orjson import dumps, loads
 
 from ..base import Data
-from ..enums import InteractionType
-from ..models.misc import InteractionData
+from . import etf, models
 from .dispatch import Listener
-from .enums import OpCodeType
+from .enums import GatewayPriority, GatewayState, OpCodeType, WSCloseCodeType
 from .error import GatewayException
 from .http import HTTPClient
-from .models.channel import Channel
+from .identify import IdentifyScheduler
 from .models.intents import Intents
 from .models.member import Member
-from .models.message import Message
-from .models.user import User
+from .ratelimit import GatewayRatelimiter
 
 basicConfig(level=Data.LOGGER)
 log: Logger = getLogger("gateway")
 
-__all__ = ("Heartbeat", "WebSocket")
-
-
-class Heartbeat(Thread):
+__all__ = ("Heartbeat", "MemberChunkIterator", "WebSocket")
+
+ZLIB_SUFFIX: bytes = b"\x00\x00\xff\xff"
+
+# Close codes after which the session cannot be resumed, and has to be identified again.
+INVALIDATING_CLOSE_CODES: FrozenSet[int] = frozenset(
+    {
+        WSCloseCodeType.NOT_AUTHENTICATED,
+        WSCloseCodeType.INVALID_SEQ,
+        WSCloseCodeType.SESSION_TIMED_OUT,
+    }
+)
+
+# Close codes after which reconnecting is pointless, as the same request would fail again.
+FATAL_CLOSE_CODES: FrozenSet[int] = frozenset(
+    {
+        WSCloseCodeType.AUTHENTICATION_FAILED,
+        WSCloseCodeType.INVALID_SHARD,
+        WSCloseCodeType.SHARDING_REQUIRED,
+        WSCloseCodeType.INVALID_API_VERSION,
+        WSCloseCodeType.INVALID_INTENTS,
+        WSCloseCodeType.DISALLOWED_INTENTS,
+    }
+)
+
+# Every other close code, such as UNKNOWN_ERROR, UNKNOWN_OPCODE, DECODE_ERROR,
+# ALREADY_AUTHENTICATED, RATE_LIMITED or a dropped connection, is resumed.
+
+# Every dispatched event known to the gateway, see
+# https://discord.com/developers/docs/topics/gateway#commands-and-events-gateway-events
+EVENTS: Tuple[str, ...] = (
+    "APPLICATION_COMMAND_CREATE",
+    "APPLICATION_COMMAND_UPDATE",
+    "APPLICATION_COMMAND_DELETE",
+    "CHANNEL_CREATE",
+    "CHANNEL_UPDATE",
+    "CHANNEL_DELETE",
+    "CHANNEL_PINS_UPDATE",
+    "THREAD_CREATE",
+    "THREAD_UPDATE",
+    "THREAD_DELETE",
+    "THREAD_LIST_SYNC",
+    "THREAD_MEMBER_UPDATE",
+    "THREAD_MEMBERS_UPDATE",
+    "GUILD_CREATE",
+    "GUILD_UPDATE",
+    "GUILD_DELETE",
+    "GUILD_BAN_ADD",
+    "GUILD_BAN_REMOVE",
+    "GUILD_EMOJIS_UPDATE",
+    "GUILD_STICKERS_UPDATE",
+    "GUILD_INTEGRATIONS_UPDATE",
+    "GUILD_MEMBER_ADD",
+    "GUILD_MEMBER_REMOVE",
+    "GUILD_MEMBER_UPDATE",
+    "GUILD_MEMBERS_CHUNK",
+    "GUILD_ROLE_CREATE",
+    "GUILD_ROLE_UPDATE",
+    "GUILD_ROLE_DELETE",
+    "INTEGRATION_CREATE",
+    "INTEGRATION_UPDATE",
+    "INTEGRATION_DELETE",
+    "INTERACTION_CREATE",
+    "INVITE_CREATE",
+    "INVITE_DELETE",
+    "MESSAGE_CREATE",
+    "MESSAGE_UPDATE",
+    "MESSAGE_DELETE",
+    "MESSAGE_DELETE_BULK",
+    "MESSAGE_REACTION_ADD",
+    "MESSAGE_REACTION_REMOVE",
+    "MESSAGE_REACTION_REMOVE_ALL",
+    "MESSAGE_REACTION_REMOVE_EMOJI",
+    "PRESENCE_UPDATE",
+    "RESUMED",
+    "STAGE_INSTANCE_CREATE",
+    "STAGE_INSTANCE_UPDATE",
+    "STAGE_INSTANCE_DELETE",
+    "USER_UPDATE",
+    "VOICE_STATE_UPDATE",
+    "VOICE_SERVER_UPDATE",
+    "WEBHOOKS_UPDATE",
+)
+
+# Maps an event to its listener name and the model built from its data,
+# which is named after the first word of the event, i.e. MESSAGE_CREATE -> Message.
+# Events without a model are dispatched with their raw data.
+REGISTRY: Dict[str, Tuple[str, Optional[type]]] = {
+    event: (f"on_{event.lower()}", getattr(models, event.split("_")[0].capitalize(), None))
+    for event in EVENTS
+}
+# Chunks are dispatched as their data, with only their members built, once for
+# both the listeners and the request awaiting them.
+REGISTRY["GUILD_MEMBERS_CHUNK"] = ("on_guild_members_chunk", None)
+
+
+class Heartbeat:
     """
     A class representing a consistent heartbeat connection with the gateway.
 
+    The heartbeat runs as a task on the event loop of the connection. When the
+    gateway has not acknowledged the previous heartbeat by the time the next one
+    is due, the connection is considered a zombie and gets closed so that it
+    can be resumed.
+
     :ivar bunny.api.gateway.WebSocket ws: The WebSocket class to infer on.
     :ivar typing.Union[int, float] interval: The heartbeat interval determined by the gateway.
-    :ivar threading.Event event: The multi-threading event.
+    :ivar bool acked: Whether the last heartbeat sent has been acknowledged.
+    :ivar typing.Optional[asyncio.Task] task: The task sending the heartbeats.
     """
 
+    __slots__ = ("ws", "interval", "acked", "task")
+
     def __init__(self, ws: Any, interval: int) -> None:
         """
         :param ws: The WebSocket inference to run the coroutine off of.
@@ -43,32 +145,118 @@ class Heartbeat(Thread):
         :type interval: int
         :return: None
         """
-        super().__init__()
         self.ws = ws
         self.interval = interval / 1000
-        self.event = Event()
+        self.acked = True
+        self.task = None
+
+    async def run(self) -> None:
+        """Sends heartbeats periodically until stopped or the connection zombies."""
+        # The first heartbeat is jittered so that every shard
+        # reconnecting at once does not beat at the same time.
+        await sleep(self.interval * random())
+
+        while True:
+            if not self.acked:
+                log.error(
+                    "The gateway did not acknowledge the last heartbeat, closing the connection."
+                )
+                await self.ws.session.close(code=4000)
+                return
 
-    def run(self) -> None:
-        """Starts the heartbeat connection."""
-        while not self.event.wait(self.interval - random()):
+            self.acked = False
             try:
-                coro = run_coroutine_threadsafe(self.ws.heartbeat(), loop=self.ws.loop)
-                while True:
-                    try:
-                        coro.result(timeout=10)
-                        break
-                    except:  # noqa
-                        log.debug("The heartbeat took too long to send.")
-                        log.error(
-                            "The client was unable to send a heartbeat, closing the connection."
-                        )
-                        self.stop()
-            except:  # noqa
-                pass
+                await wait_for(self.ws.heartbeat(), timeout=10)
+            except TimeoutError:
+                log.error("The client was unable to send a heartbeat, closing the connection.")
+                await self.ws.session.close(code=4000)
+                return
+
+            await sleep(self.interval)
+
+    def start(self) -> None:
+        """Starts the heartbeat connection."""
+        self.task = self.ws.loop.create_task(self.run())
+
+    def ack(self) -> None:
+        """Marks the last heartbeat sent as acknowledged."""
+        self.acked = True
 
     def stop(self) -> None:
         """Stops the heartbeat connection."""
-        self.event.set()
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+
+class MemberChunkIterator:
+    """
+    A class representing the stream of ``GUILD_MEMBERS_CHUNK`` events answering
+    a ``REQUEST_GUILD_MEMBERS`` command, iterated over as batches of members.
+
+    :ivar bunny.api.gateway.WebSocket ws: The WebSocket the request was sent from.
+    :ivar str nonce: The nonce identifying the chunks of the request.
+    :ivar float timeout: The time in seconds to wait for each chunk.
+    :ivar typing.List[int] not_found: The requested user IDs which were not found.
+    :ivar typing.List[dict] presences: The presences of the members, if requested.
+    :ivar bool done: Whether every chunk has been received.
+    """
+
+    __slots__ = ("ws", "nonce", "timeout", "not_found", "presences", "done", "_queue")
+
+    def __init__(self, ws: Any, nonce: str, timeout: float) -> None:
+        """
+        :param ws: The WebSocket the request was sent from.
+        :type ws: typing.Any
+        :param nonce: The nonce identifying the chunks of the request.
+        :type nonce: str
+        :param timeout: The time in seconds to wait for each chunk.
+        :type timeout: float
+        :return: None
+        """
+        self.ws = ws
+        self.nonce = nonce
+        self.timeout = timeout
+        self.not_found = []
+        self.presences = []
+        self.done = False
+        self._queue = Queue()
+
+    def __aiter__(self) -> "MemberChunkIterator":
+        return self
+
+    async def __anext__(self) -> List[Member]:
+        if self.done:
+            raise StopAsyncIteration
+
+        try:
+            data: dict = await wait_for(self._queue.get(), timeout=self.timeout)
+        except TimeoutError:
+            self.close()
+            raise
+
+        self.not_found.extend(data.get("not_found", []))
+        self.presences.extend(data.get("presences", []))
+
+        if data["chunk_index"] >= data["chunk_count"] - 1:
+            self.close()
+
+        return data["members"]
+
+    def feed(self, data: dict) -> None:
+        """
+        Queues a chunk received for the request.
+
+        :param data: The data of the ``GUILD_MEMBERS_CHUNK`` event, with its members built.
+        :type data: dict
+        :return: None
+        """
+        self._queue.put_nowait(data)
+
+    def close(self) -> None:
+        """Stops listening to the chunks of the request."""
+        self.done = True
+        self.ws._chunks.pop(self.nonce, None)
 
 
 class WebSocket:
@@ -83,9 +271,26 @@ class WebSocket:
     :ivar int session_id: The current ID of the gateway session.
     :ivar int sequence: The current sequence of the gateway connection.
     :ivar bunny.api.gateway.Heartbeat keep_alive: An instance of :class:`bunny.api.gateway.Heartbeat`.
-    :ivar bool closed: The current connection state.
+    :ivar bool closed: Whether the connection has been closed for good.
+    :ivar bunny.api.enums.GatewayState state: The current state of the connection.
+    :ivar int attempts: The amount of connection attempts since the last successful one.
+    :ivar float max_backoff: The maximum time in seconds to wait between two connection attempts.
+    :ivar bool invalidated: Whether the gateway invalidated the last session, delaying the next identification.
+    :ivar typing.Optional[str] url: The gateway URL to identify on.
+    :ivar typing.Optional[str] resume_url: The gateway URL to resume the current session on.
     :ivar bunny.api.http.HTTPClient http: The internal HTTP client used to connect to the gateway.
     :ivar dict options: The websocket connection options.
+    :ivar typing.Optional[str] compress: The transport compression used, if any.
+    :ivar str encoding: The payload encoding used, either ``"json"`` or ``"etf"``.
+    :ivar typing.Optional[int] offload_threshold: The size in bytes from which frames are decoded and their models built in a worker thread, if any.
+    :ivar int bytes_received: The amount of bytes received over the wire.
+    :ivar int bytes_inflated: The amount of bytes received after decompression.
+    :ivar typing.Optional[typing.List[int]] shard: The ``[shard_id, shard_count]`` pair identified with, if sharded.
+    :ivar bool ready: Whether the connection has received ``READY`` for its current session.
+    :ivar typing.Optional[bunny.api.identify.IdentifyScheduler] identify_scheduler: The scheduler pacing ``IDENTIFY`` packets.
+    :ivar bool lazy: Whether event models are decoded lazily on attribute access.
+    :ivar bunny.api.ratelimit.GatewayRatelimiter ratelimiter: The rate limiter of outbound commands.
+    :ivar typing.Optional[bunny.api.replay.GatewayRecorder] recorder: The recorder writing every received frame, if any.
     """
 
     def __init__(
@@ -93,6 +298,14 @@ class WebSocket:
         intents: Intents,
         session_id: Optional[int] = None,
         sequence: Optional[int] = None,
+        compress: Optional[str] = None,
+        shard: Optional[List[int]] = None,
+        dispatch: Optional[Listener] = None,
+        identify_scheduler: Optional[IdentifyScheduler] = None,
+        lazy: bool = False,
+        encoding: str = "json",
+        offload_threshold: Optional[int] = 256 * 1024,
+        http: Optional[HTTPClient] = None,
     ) -> None:
         """
         :param intents: The intents used for identifying the connection.
@@ -101,18 +314,45 @@ class WebSocket:
         :type session_id: typing.Optional[int]
         :param sequence: The sequence if you're trying to resume a connection. Defaults to ``None``.
         :type sequence: typing.Optional[int]
+        :param compress: The transport compression to use. Only ``"zlib-stream"`` is supported. Defaults to ``None``.
+        :type compress: typing.Optional[str]
+        :param shard: The ``[shard_id, shard_count]`` pair to identify with. Defaults to ``None``.
+        :type shard: typing.Optional[typing.List[int]]
+        :param dispatch: The listener to dispatch events to, shared between shards. Defaults to a new one.
+        :type dispatch: typing.Optional[bunny.api.dispatch.Listener]
+        :param identify_scheduler: The scheduler pacing ``IDENTIFY`` packets, shared between shards. Defaults to ``None``.
+        :type identify_scheduler: typing.Optional[bunny.api.identify.IdentifyScheduler]
+        :param lazy: Whether event models are decoded lazily on attribute access. Defaults to ``False``.
+        :type lazy: bool
+        :param encoding: The payload encoding to use, either ``"json"`` or ``"etf"``. Defaults to ``"json"``.
+        :type encoding: str
+        :param offload_threshold: The size in bytes from which frames are decoded and their models built in a worker thread. Defaults to ``256 * 1024``, ``None`` to never offload.
+        :type offload_threshold: typing.Optional[int]
+        :param http: The HTTP client to fetch the gateway URL with, i.e. the one of the client, shared between shards. Defaults to a new one on connecting.
+        :type http: typing.Optional[bunny.api.http.HTTPClient]
         :return: None
         """
+        if compress not in (None, "zlib-stream"):
+            raise ValueError(f"Unsupported gateway compression: {compress}")
+        if encoding not in ("json", "etf"):
+            raise ValueError(f"Unsupported gateway encoding: {encoding}")
+
         self.intents = intents
         self.loop = get_event_loop()
-        self.dispatch = Listener()
+        self.dispatch = Listener() if dispatch is None else dispatch
         self.session = None
         self.session_id = session_id
         self.sequence = sequence
 
         self.keep_alive = None
         self.closed = False
-        self.http = None
+        self.state = GatewayState.DISCONNECTED
+        self.attempts = 0
+        self.max_backoff = 60.0
+        self.invalidated = False
+        self.url = None
+        self.resume_url = None
+        self.http = http
         self.options: dict = {
             "max_msg_size": 1024 ** 2,
             "timeout": 60,
@@ -120,100 +360,381 @@ class WebSocket:
             "compress": 0,
         }
 
+        self.compress = compress
+        self.encoding = encoding
+        # The codec is picked once here rather than on every frame.
+        self._loads: Callable[[Any], Any] = etf.decode if encoding == "etf" else loads
+        self.offload_threshold = offload_threshold
+        self._offloaded = False
+        self.bytes_received = 0
+        self.bytes_inflated = 0
+        self._zlib = None
+        self._buffer = bytearray()
+
+        self.shard = shard
+        self.ready = False
+        self.identify_scheduler = identify_scheduler
+        self.lazy = lazy
+        self.ratelimiter = GatewayRatelimiter()
+        self._chunks: Dict[str, MemberChunkIterator] = {}
+        self._identifying: Optional[Task] = None
+        self.recorder = None
+        self._last_heartbeat = None
+        self._latency = float("inf")
+
+    @property
+    def shard_id(self) -> int:
+        """
+        Returns the ID of the shard this connection represents.
+
+        :return: int
+        """
+        return self.shard[0] if self.shard else 0
+
+    @property
+    def latency(self) -> float:
+        """
+        Returns the round-trip time of the last heartbeat in seconds.
+        This is ``inf`` until the first ``HEARTBEAT_ACK`` is received.
+
+        :return: float
+        """
+        return self._latency
+
     async def recv(self) -> Optional[Any]:
         """Receives packets sent from the gateway."""
         packet = await self.session.receive()
-        return (
-            loads(packet.data)
-            if packet and isinstance(packet.data, (bytearray, bytes, memoryview, str))
-            else None
+
+        if not packet or not isinstance(packet.data, (bytearray, bytes, memoryview, str)):
+            return None
+
+        if self.recorder is not None:
+            self.recorder.write(packet.data)
+
+        if self._zlib is None or isinstance(packet.data, str):
+            self.bytes_received += len(packet.data)
+            self.bytes_inflated += len(packet.data)
+            return await self.decode(packet.data)
+
+        # zlib-stream frames may be split across multiple messages,
+        # only a frame ending with the flush suffix can be inflated.
+        self.bytes_received += len(packet.data)
+        self._buffer.extend(packet.data)
+
+        if len(packet.data) < 4 or packet.data[-4:] != ZLIB_SUFFIX:
+            return None
+
+        data: bytes = self._zlib.decompress(self._buffer)
+        self._buffer.clear()
+        self.bytes_inflated += len(data)
+        return await self.decode(data)
+
+    async def decode(self, data: Union[bytes, str]) -> Any:
+        """
+        Decodes a frame, in a worker thread if it is at least as large as the offload threshold.
+
+        The receiving loop awaits every frame before reading the next one,
+        so events of a shard are still handled in the order they were sent.
+
+        .. note::
+            orjson holds the GIL while decoding, so offloading mostly frees the
+            loop from building models and from decoding ``"etf"`` frames.
+
+        :param data: The inflated data of the frame.
+        :type data: typing.Union[bytes, str]
+        :return: typing.Any
+        """
+        self._offloaded = self.offload_threshold is not None and len(data) >= self.offload_threshold
+        if self._offloaded:
+            log.debug(f"Decoding a frame of {len(data)} bytes in a worker thread.")
+            return await self.loop.run_in_executor(None, self._loads, data)
+        return self._loads(data)
+
+    @property
+    def resumable(self) -> bool:
+        """
+        Returns whether the current session can be resumed on the next connection.
+
+        :return: bool
+        """
+        return self.session_id is not None and self.sequence is not None
+
+    def invalidate(self) -> None:
+        """Discards the current session, so that the next connection identifies."""
+        self.session_id = None
+        self.sequence = None
+        self.resume_url = None
+
+    def backoff(self) -> float:
+        """
+        Returns the time in seconds to wait before the next connection attempt,
+        following an exponential backoff with full jitter, and of 1 to 5 seconds
+        at least once the gateway invalidated the session.
+
+        :return: float
+        """
+        delay: float = (
+            min(self.max_backoff, 2 ** (self.attempts - 1)) * random() if self.attempts else 0.0
         )
+        if self.invalidated:
+            # The gateway expects a random wait of 1 to 5 seconds before identifying again.
+            delay = max(delay, 1 + random() * 4)
+        return delay
 
-    async def connect(self, token: str) -> None:
+    async def run(self, token: str, base_url: Optional[str] = None) -> None:
         """
-        Establishes a connection to the gateway.
+        Keeps a connection to the gateway until closed, resuming whenever possible.
 
         :param token: The token to use for identifying.
         :type token: str
+        :param base_url: The gateway URL to connect to instead of the one of the API. Defaults to ``None``.
+        :type base_url: typing.Optional[str]
         :return: None
         """
-        self.http = HTTPClient(token)
-        self.options["headers"] = {"User-Agent": self.http.req.headers["User-Agent"]}
-        url = await self.http.get_gateway()
+        while not self.closed:
+            delay: float = self.backoff()
+            self.invalidated = False
+            if delay:
+                self.state = GatewayState.RECONNECTING
+                log.warning(f"Reconnecting to the gateway in {delay:.2f}s.")
+                await sleep(delay)
+
+            self.attempts += 1
+            try:
+                await self.connect(token, base_url)
+            except GatewayException:
+                self.closed = True
+                self.state = GatewayState.CLOSED
+                raise
+            except (ClientError, OSError, TimeoutError) as exc:
+                log.error(f"The connection to the gateway failed: {exc!r}")
 
-        async with self.http._req.session.ws_connect(url, **self.options) as self.session:
-            while not self.closed:
-                stream = await self.recv()
+        self.state = GatewayState.CLOSED
 
-                if stream is None:
-                    continue
+    async def connect(self, token: str, base_url: Optional[str] = None) -> None:
+        """
+        Establishes a single connection to the gateway, returning once it is lost.
 
-                if self.session.close_code:
-                    code = self.session.close_code
-                    raise GatewayException(code)
+        :param token: The token to use for identifying.
+        :type token: str
+        :param base_url: The gateway URL to connect to instead of the one of the API. Defaults to ``None``.
+        :type base_url: typing.Optional[str]
+        :return: None
+        """
+        if self.http is None:
+            self.http = HTTPClient(token)
+        if "headers" not in self.options:
+            self.options["headers"] = {"User-Agent": self.http.req.headers["User-Agent"]}
+
+        if not self.resumable:
+            self.invalidate()
+
+        if self.url is None:
+            self.url = await self.http.get_gateway(
+                encoding=self.encoding, compress=self.compress, base_url=base_url
+            )
+
+        url: str = (
+            self.resume_url
+            + self.http.gateway_query(encoding=self.encoding, compress=self.compress)
+            if self.resumable and self.resume_url
+            else self.url
+        )
 
-                op: Optional[int] = stream.get("op")
-                event: Optional[str] = stream.get("t")
-                data: Optional[dict] = stream.get("d")
-                self.sequence = stream.get("s")
+        # The inflation context is bound to the connection, so it
+        # must never be carried over to a new one.
+        self._zlib = decompressobj() if self.compress else None
+        self._buffer.clear()
+        if self.recorder is not None:
+            self.recorder.connect(self.compress)
+        self.ready = False
+        self.state = GatewayState.CONNECTING
+        self.ratelimiter.reset()
+
+        try:
+            async with self.http._req.session.ws_connect(url, **self.options) as self.session:
+                while not self.closed:
+                    stream = await self.recv()
+
+                    if stream is None:
+                        if self.session.closed or self.session.close_code is not None:
+                            break
+                        continue
 
-                if op != OpCodeType.DISPATCH:
-                    log.debug(data)
+                    op: Optional[int] = stream.get("op")
+                    event: Optional[str] = stream.get("t")
+                    data: Optional[dict] = stream.get("d")
 
-                    if op == OpCodeType.HELLO:
-                        if not self.session_id:
-                            await self.identify()
-                        else:
-                            await self.resume()
+                    if stream.get("s") is not None:
+                        self.sequence = stream["s"]
 
-                        heartbeat_interval = data["heartbeat_interval"]
-                        self.keep_alive = Heartbeat(self, heartbeat_interval)
+                    if op != OpCodeType.DISPATCH:
+                        log.debug(data)
+
+                        if op == OpCodeType.HELLO:
+                            heartbeat_interval = data["heartbeat_interval"]
+                            if self.keep_alive:
+                                self.keep_alive.stop()
+                            self.keep_alive = Heartbeat(self, heartbeat_interval)
+                            self.keep_alive.start()
+
+                            if not self.resumable:
+                                self.state = GatewayState.IDENTIFYING
+                                # Waiting for the identify slot runs alongside the loop,
+                                # which keeps acknowledging heartbeats meanwhile.
+                                self._identifying = self.loop.create_task(self.identify())
+                            else:
+                                self.state = GatewayState.RESUMING
+                                await self.resume()
 
-                        await self.heartbeat()
-                        self.keep_alive.start()
+                            continue
+
+                        if op == OpCodeType.HEARTBEAT:
+                            if self.keep_alive:
+                                await self.heartbeat()
+                            continue
+
+                        if op == OpCodeType.HEARTBEAT_ACK:
+                            if self._last_heartbeat is not None:
+                                self._latency = perf_counter() - self._last_heartbeat
+                            if self.keep_alive:
+                                self.keep_alive.ack()
+                                log.debug("HEARTBEAT_ACK")
+                            continue
+
+                        if op == OpCodeType.RECONNECT:
+                            log.debug("RECONNECT")
+                            # Closing with a code other than 1000 keeps the session resumable.
+                            await self.session.close(code=4000)
+                            break
+
+                        if op == OpCodeType.INVALIDATE_SESSION:
+                            log.debug(f"INVALID_SESSION (resumable: {bool(data)})")
+                            if not data:
+                                # The wait before identifying again is left to the next
+                                # attempt, as nothing is read from the socket meanwhile.
+                                self.invalidate()
+                                self.invalidated = True
+                            await self.session.close(code=4000)
+                            break
 
-                        continue
+                    else:
+                        await self.receive(event, data)
+        finally:
+            if self._identifying is not None:
+                self._identifying.cancel()
+                self._identifying = None
+            if self.keep_alive:
+                self.keep_alive.stop()
+                self.keep_alive = None
+            self.ready = False
+
+        self.classify(self.session.close_code)
+
+    async def receive(self, event: str, data: dict) -> None:
+        """
+        Receives a dispatched event from the gateway, updating the session
+        before handling it.
 
-                    if op == OpCodeType.HEARTBEAT:
-                        if self.keep_alive:
-                            await self.heartbeat()
-                        continue
+        :param event: The name of the event.
+        :type event: str
+        :param data: The data of the event.
+        :type data: dict
+        :return: None
+        """
+        if event == "READY":
+            self.session_id = data["session_id"]
+            self.resume_url = data.get("resume_gateway_url")
+            self.ready = True
+            self.attempts = 0
+            self.state = GatewayState.CONNECTED
+            self.dispatch.dispatch("on_ready")
+            self.dispatch.dispatch("on_shard_ready", self.shard_id)
+            log.debug(f"READY (SES_ID: {self.session_id}, SEQ_ID: {self.sequence})")
+        elif event == "RESUMED":
+            self.ready = True
+            self.attempts = 0
+            self.state = GatewayState.CONNECTED
+            log.debug(f"RESUMED (SES_ID: {self.session_id}, SEQ_ID: {self.sequence})")
+            self.handle(event, data)
+        else:
+            log.debug("%s: %s", event, data)
+            spec: Optional[Tuple[str, Optional[type]]] = REGISTRY.get(event)
+            if event == "GUILD_MEMBERS_CHUNK":
+                await self.chunk(data)
+            elif (
+                self._offloaded
+                and not self.lazy
+                and spec is not None
+                and spec[1] is not None
+                and self.dispatch.wants(spec[0])
+            ):
+                # The model of a large frame is built alongside its decoding,
+                # only dispatching it is left to the loop.
+                built: Any = await self.loop.run_in_executor(None, self.build, event, data)
+                self.handle(event, data, built)
+            else:
+                self.handle(event, data)
 
-                    if op == OpCodeType.HEARTBEAT_ACK:
-                        if self.keep_alive:
-                            log.debug("HEARTBEAT_ACK")
-                        continue
+        if self.dispatch.queue.full:
+            # Stops reading from the gateway until the handlers catch up.
+            await self.dispatch.queue.wait()
 
-                    if op in (OpCodeType.INVALIDATE_SESSION, OpCodeType.RECONNECT):
-                        log.debug("INVALID_SESSION/RECONNECT")
+    async def chunk(self, data: dict) -> None:
+        """
+        Receives a ``GUILD_MEMBERS_CHUNK`` event, building its members once for both
+        its listeners and the request awaiting them, if any.
 
-                        # TODO: Correct sound reconnection logic. When a connection is lost,
-                        # an indefinite "closing connection" loop occurs. (Maybe it's based
-                        # with the Heartbeat threading event?)
-                        if not data or op == OpCodeType.RECONNECT:
-                            try:
-                                await self.resume()
-                            except Exception as exc:
-                                log.error("Server declined to reconnect, closing.")
-                                log.error(exc)
-                                await self.session.close()
-                        else:
-                            self.session_id = None
-                            self.sequence = None
-                            self.closed = True
-
-                else:
-                    if event == "READY":
-                        self.session_id = data["session_id"]
-                        self.sequence = stream["s"]
-                        self.dispatch.dispatch("on_ready")
-                        log.debug(f"READY (SES_ID: {self.session_id}, SEQ_ID: {self.sequence})")
-                    else:
-                        log.debug(f"{event}: {data}")
-                        self.handle(event, data)
-                    continue
+        :param data: The data of the event.
+        :type data: dict
+        :return: None
+        """
+        request: Optional[MemberChunkIterator] = self._chunks.get(data.get("nonce"))
+        if request is None and not self.dispatch.wants("on_guild_members_chunk"):
+            self.handle("GUILD_MEMBERS_CHUNK", data)
+            return
+
+        if self._offloaded and not self.lazy:
+            built: dict = await self.loop.run_in_executor(
+                None, self.build, "GUILD_MEMBERS_CHUNK", data
+            )
+        else:
+            built = self.build("GUILD_MEMBERS_CHUNK", data)
+
+        if request is not None:
+            request.feed(built)
+        self.handle("GUILD_MEMBERS_CHUNK", data, built)
+
+    def classify(self, code: Optional[int]) -> None:
+        """
+        Decides how to reconnect after the connection closed with a given code.
 
-    def handle(self, event: str, data: dict) -> None:
+        :param code: The close code of the connection, if any.
+        :type code: typing.Optional[int]
+        :return: None
+        """
+        if self.closed:
+            return
+
+        if code in FATAL_CLOSE_CODES:
+            log.error(f"The gateway closed the connection with {WSCloseCodeType(code).name}.")
+            raise GatewayException(code)
+
+        if code in INVALIDATING_CLOSE_CODES:
+            log.warning(f"The session was invalidated by {WSCloseCodeType(code).name}.")
+            self.invalidate()
+        elif self.resumable:
+            log.warning(f"The connection closed with code {code}, resuming.")
+        else:
+            log.warning(f"The connection closed with code {code}, identifying.")
+
+    async def close(self) -> None:
+        """Closes the connection for good, ending the session."""
+        self.closed = True
+        if self.session is not None and not self.session.closed:
+            await self.session.close(code=1000)
+
+    def handle(self, event: str, data: dict, built: Optional[Any] = None) -> None:
         """
         Handles the dispatched event data from a gateway event.
 
@@ -221,27 +742,49 @@ class WebSocket:
         :type event: str
         :param data: The data of the event.
         :type data: dict
+        :param built: The model of the event if already built, i.e. in a worker thread. Defaults to ``None``.
+        :type built: typing.Optional[typing.Any]
         :return: None
         """
-        if event != "TYPING_START":
-            name: str = event.lower()
-            path: str = "bunny"
-            path += ".models" if event == "INTERACTION_CREATE" else ".api.models"
+        if event == "TYPING_START":
+            return
 
-            if event != "INTERACTION_CREATE":
-                obj: object = getattr(
-                    __import__(path),
-                    name.split("_")[0].capitalize(),
-                )
-                self.dispatch.dispatch(
-                    f"on_{name}", obj(**data)  # noqa , object callable pycharm error.
-                )
-            else:
-                context = self.contextualize(data)
-                self.dispatch.dispatch(f"on_{name}", context)
+        spec: Optional[Tuple[str, Optional[type]]] = REGISTRY.get(event)
 
+        # Models are only built for events somebody is subscribed to,
+        # as building them is by far the most expensive part of an event.
+        if spec is not None and self.dispatch.wants(spec[0]):
+            self.dispatch.dispatch(spec[0], self.build(event, data) if built is None else built)
+
+        if self.dispatch.wants("raw_socket_create"):
             self.dispatch.dispatch("raw_socket_create", data)
 
+    def build(self, event: str, data: dict) -> Any:
+        """
+        Builds the object dispatched for a registered gateway event.
+
+        :param event: The name of the event.
+        :type event: str
+        :param data: The data of the event.
+        :type data: dict
+        :return: typing.Any
+        """
+        model: Optional[type] = REGISTRY[event][1]
+
+        if event == "INTERACTION_CREATE":
+            return self.contextualize(data)
+        if event == "GUILD_MEMBERS_CHUNK":
+            return {
+                **data,
+                "members": [
+                    Member.lazy(member) if self.lazy else Member(**member)
+                    for member in data["members"]
+                ],
+            }
+        if model is not None:
+            return model.lazy(data) if self.lazy else model(**data)
+        return data
+
     def contextualize(self, data: dict) -> object:
         """
         Takes raw data given back from the gateway
@@ -286,29 +829,42 @@ class WebSocket:
         #     context.origin = data.get("origin")
         #     return context
 
-        context: object = getattr(__import__("bunny.context"), "InteractionContext")()
-        context.message = Message(**data["message"]) if data.get("message") else None
-        context.author = Member(**data["member"]) if data.get("member") else None
-        context.user = User(**data["user"]) if data.get("user") else None
-        context.channel = Channel(**data["channel"]) if data.get("channel") else None
-        context.id = data.get("id")
-        context.application_id = data.get("application_id")
-        context.type = InteractionType(int(data["type"])) if data.get("type") else None
-        context.data = InteractionData(**data["data"])
-        context.guild_id = data.get("guild_id")
-        context.channel_id = data.get("channel_id")
-        context.token = data.get("token")
+        # The context is built from the data as is, so that it can be built back
+        # from its ``_json``, i.e. by a handler offloaded to a process pool.
+        context: object = getattr(__import__("bunny.context"), "InteractionContext")(**data)
         # context.guild = Guild(data["guild"] if data.get("guild_id"))
         # TODO: code a stupid fucking snowflake converter
         return context
 
-    async def send(self, data: Union[str, dict]) -> None:
+    async def send(self, data: Union[str, dict], priority: int = GatewayPriority.NORMAL) -> None:
+        """
+        Sends a packet to the gateway once the rate limit allows it.
+
+        :param data: The packet to send.
+        :type data: typing.Union[str, dict]
+        :param priority: The priority of the packet. Defaults to :attr:`bunny.api.enums.GatewayPriority.NORMAL`.
+        :type priority: int
+        :return: None
+        """
+        await self.ratelimiter.acquire(priority)
+        if self.encoding == "etf" and isinstance(data, dict):
+            await self.session.send_bytes(etf.encode(data))
+            log.debug(data)
+            return
+
         packet: str = dumps(data).decode("utf-8") if isinstance(data, dict) else data
         await self.session.send_str(packet)
         log.debug(packet)
 
     async def identify(self) -> None:
-        """Sends an ``IDENTIFY`` packet to the gateway."""
+        """
+        Sends an ``IDENTIFY`` packet to the gateway once the identify scheduler allows it.
+        The slot is only reserved now, so that the time spent connecting cannot shorten
+        the interval between two ``IDENTIFY`` packets of a bucket.
+        """
+        if self.identify_scheduler:
+            await self.identify_scheduler.acquire(self.shard_id)
+
         payload: dict = {
             "op": OpCodeType.IDENTIFY,
             "d": {
@@ -321,7 +877,10 @@ class WebSocket:
                 },
             },
         }
-        await self.send(payload)
+        if self.shard:
+            payload["d"]["shard"] = self.shard
+
+        await self.send(payload, GatewayPriority.SESSION)
         log.debug("IDENTIFY")
 
     async def resume(self) -> None:
@@ -330,11 +889,61 @@ class WebSocket:
             "op": OpCodeType.RESUME,
             "d": {"token": self.http.token, "seq": self.sequence, "session_id": self.session_id},
         }
-        await self.send(payload)
+        await self.send(payload, GatewayPriority.SESSION)
         log.debug("RESUME")
 
+    def request_members(
+        self,
+        guild_id: int,
+        query: str = "",
+        limit: int = 0,
+        user_ids: Optional[List[int]] = None,
+        presences: bool = False,
+        timeout: float = 60.0,
+    ) -> MemberChunkIterator:
+        """
+        Sends a ``REQUEST_GUILD_MEMBERS`` packet to the gateway, streaming the members back.
+
+        .. note::
+            Requesting every member of a guild requires the ``GUILD_MEMBERS`` intent,
+            and requesting presences the ``GUILD_PRESENCES`` intent.
+
+        i.e. : async for members in ws.request_members(guild_id): ...
+
+        :param guild_id: The ID of the guild to request the members of.
+        :type guild_id: int
+        :param query: The prefix usernames have to start with. Defaults to every member.
+        :type query: str
+        :param limit: The maximum amount of members to return, ``0`` meaning no limit. Defaults to ``0``.
+        :type limit: int
+        :param user_ids: The IDs of the users to request instead of a query. Defaults to ``None``.
+        :type user_ids: typing.Optional[typing.List[int]]
+        :param presences: Whether the presences of the members should be returned. Defaults to ``False``.
+        :type presences: bool
+        :param timeout: The time in seconds to wait for each chunk. Defaults to ``60``.
+        :type timeout: float
+        :return: bunny.api.gateway.MemberChunkIterator
+        """
+        nonce: str = uuid4().hex
+        payload: dict = {
+            "op": OpCodeType.REQUEST_MEMBERS,
+            "d": {"guild_id": str(guild_id), "presences": presences, "nonce": nonce},
+        }
+        if user_ids is not None:
+            payload["d"]["user_ids"] = [str(user_id) for user_id in user_ids]
+        else:
+            payload["d"]["query"] = query
+            payload["d"]["limit"] = limit
+
+        iterator = MemberChunkIterator(self, nonce, timeout)
+        self._chunks[nonce] = iterator
+        self.loop.create_task(self.send(payload, GatewayPriority.LOW))
+        log.debug(f"REQUEST_GUILD_MEMBERS (GUILD_ID: {guild_id}, NONCE: {nonce})")
+        return iterator
+
     async def heartbeat(self) -> None:
         """Sends a ``HEARTBEAT`` packet to the gateway."""
-        payload: dict = {"op": OpCodeType.HEARTBEAT, "d": self.session_id}
-        await self.send(payload)
+        payload: dict = {"op": OpCodeType.HEARTBEAT, "d": self.sequence}
+        self._last_heartbeat = perf_counter()
+        await self.send(payload, GatewayPriority.HEARTBEAT)
         log.debug("HEARTBEAT")
@@ -1,20 +1,47 @@
-from asyncio import AbstractEventLoop
-from threading import Event, Thread
-from typing import Any, Optional, Union
+from asyncio import AbstractEventLoop, Queue, Task
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
 
 from .dispatch import Listener
+from .enums import GatewayState
 from .http import HTTPClient
+from .identify import IdentifyScheduler
 from .models.intents import Intents
+from .models.member import Member
+from .ratelimit import GatewayRatelimiter
+from .replay import GatewayRecorder
 
-class Heartbeat(Thread):
-    __slots__ = ("ws", "interval", "event")
+INVALIDATING_CLOSE_CODES: FrozenSet[int]
+FATAL_CLOSE_CODES: FrozenSet[int]
+EVENTS: Tuple[str, ...]
+REGISTRY: Dict[str, Tuple[str, Optional[type]]]
+
+class Heartbeat:
+    __slots__ = ("ws", "interval", "acked", "task")
     ws: Any
     interval: Union[int, float]
-    event: Event
+    acked: bool
+    task: Optional[Task]
     def __init__(self, ws: Any, interval: int) -> None: ...
-    def run(self) -> None: ...
+    async def run(self) -> None: ...
+    def start(self) -> None: ...
+    def ack(self) -> None: ...
     def stop(self) -> None: ...
 
+class MemberChunkIterator:
+    __slots__ = ("ws", "nonce", "timeout", "not_found", "presences", "done", "_queue")
+    ws: Any
+    nonce: str
+    timeout: float
+    not_found: List[int]
+    presences: List[dict]
+    done: bool
+    _queue: Queue
+    def __init__(self, ws: Any, nonce: str, timeout: float) -> None: ...
+    def __aiter__(self) -> MemberChunkIterator: ...
+    async def __anext__(self) -> List[Member]: ...
+    def feed(self, data: dict) -> None: ...
+    def close(self) -> None: ...
+
 class WebSocket:
     __slots__ = (
         "intents",
@@ -25,8 +52,33 @@ class WebSocket:
         "sequence",
         "keep_alive",
         "closed",
+        "state",
+        "attempts",
+        "max_backoff",
+        "invalidated",
+        "url",
+        "resume_url",
         "http",
         "options",
+        "compress",
+        "encoding",
+        "_loads",
+        "offload_threshold",
+        "_offloaded",
+        "bytes_received",
+        "bytes_inflated",
+        "_zlib",
+        "_buffer",
+        "shard",
+        "ready",
+        "identify_scheduler",
+        "lazy",
+        "ratelimiter",
+        "_chunks",
+        "_identifying",
+        "recorder",
+        "_last_heartbeat",
+        "_latency",
     )
     intents: Intents
     loop: AbstractEventLoop
@@ -36,19 +88,76 @@ class WebSocket:
     sequence: Optional[int]
     keep_alive: Optional[Heartbeat]
     closed: bool
+    state: GatewayState
+    attempts: int
+    max_backoff: float
+    invalidated: bool
+    url: Optional[str]
+    resume_url: Optional[str]
     http: Optional[HTTPClient]
     options: dict
+    compress: Optional[str]
+    encoding: str
+    _loads: Callable[[Any], Any]
+    offload_threshold: Optional[int]
+    _offloaded: bool
+    bytes_received: int
+    bytes_inflated: int
+    _zlib: Optional[Any]
+    _buffer: bytearray
+    shard: Optional[List[int]]
+    ready: bool
+    identify_scheduler: Optional[IdentifyScheduler]
+    lazy: bool
+    ratelimiter: GatewayRatelimiter
+    _chunks: Dict[str, MemberChunkIterator]
+    _identifying: Optional[Task]
+    recorder: Optional[GatewayRecorder]
+    _last_heartbeat: Optional[float]
+    _latency: float
     def __init__(
         self,
         intents: Intents,
         session_id: Optional[int] = None,
         sequence: Optional[int] = None,
+        compress: Optional[str] = None,
+        shard: Optional[List[int]] = None,
+        dispatch: Optional[Listener] = None,
+        identify_scheduler: Optional[IdentifyScheduler] = None,
+        lazy: bool = False,
+        encoding: str = "json",
+        offload_threshold: Optional[int] = ...,
+        http: Optional[HTTPClient] = None,
     ) -> None: ...
+    @property
+    def shard_id(self) -> int: ...
+    @property
+    def latency(self) -> float: ...
     async def recv(self) -> Optional[Any]: ...
-    async def connect(self, token: str) -> None: ...
-    def handle(self, event: str, data: dict) -> None: ...
-    async def send(self, data: Union[str, dict]) -> None: ...
+    async def decode(self, data: Union[bytes, str]) -> Any: ...
+    @property
+    def resumable(self) -> bool: ...
+    def invalidate(self) -> None: ...
+    def backoff(self) -> float: ...
+    async def run(self, token: str, base_url: Optional[str] = None) -> None: ...
+    async def connect(self, token: str, base_url: Optional[str] = None) -> None: ...
+    async def receive(self, event: str, data: dict) -> None: ...
+    async def chunk(self, data: dict) -> None: ...
+    def classify(self, code: Optional[int]) -> None: ...
+    async def close(self) -> None: ...
+    def handle(self, event: str, data: dict, built: Optional[Any] = None) -> None: ...
+    def build(self, event: str, data: dict) -> Any: ...
+    async def send(self, data: Union[str, dict], priority: int = ...) -> None: ...
     async def identify(self) -> None: ...
     async def resume(self) -> None: ...
+    def request_members(
+        self,
+        guild_id: int,
+        query: str = "",
+        limit: int = 0,
+        user_ids: Optional[List[int]] = None,
+        presences: bool = False,
+        timeout: float = 60.0,
+    ) -> MemberChunkIterator: ...
     async def heartbeat(self) -> None: ...
     def contextualize(self, data: dict) -> object: ...
@@ -1,11 +1,12 @@
-from asyncio import AbstractEventLoop, Event, Lock, get_event_loop, sleep
+from asyncio import AbstractEventLoop, Lock, get_event_loop, sleep
 from logging import Logger, basicConfig, getLogger
 from sys import version_info
-from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
+from typing import Any, ClassVar, Dict, List, Mapping, Optional, Tuple, Union
 from urllib.parse import quote
 
 from aiohttp import ClientSession, FormData
 from aiohttp import __version__ as http_version
+from orjson import loads
 
 from ..api.error import HTTPException
 from ..api.models import (
@@ -25,6 +26,7 @@ from ..api.models import (
     WelcomeScreen,
 )
 from ..base import Data, __version__
+from .ratelimit import GlobalRatelimiter, HTTPRatelimiter, RatelimitBackend
 
 basicConfig(level=Data.LOGGER)
 log: Logger = getLogger("http")
@@ -38,23 +40,38 @@ class Route:
 
     :ivar typing.ClassVar[str] __api__: The HTTP route path.
     :ivar str method: The HTTP method.
+    :ivar str template: The URL path before being formatted, i.e. ``/channels/{channel_id}/messages/{message_id}``.
     :ivar str path: The URL path.
     :ivar typing.Optional[str] channel_id: The channel ID from the bucket if given.
     :ivar typing.Optional[str] guild_id: The guild ID from the bucket if given.
+    :ivar typing.Optional[str] webhook_id: The webhook ID from the bucket if given.
+    :ivar typing.Optional[str] webhook_token: The webhook token from the bucket if given.
     """
 
-    __slots__ = ("__api__", "method", "path", "channel_id", "guild_id")
+    __slots__ = (
+        "__api__",
+        "method",
+        "template",
+        "path",
+        "channel_id",
+        "guild_id",
+        "webhook_id",
+        "webhook_token",
+    )
     __api__: ClassVar[str]
     method: str
+    template: str
     path: str
     channel_id: Optional[str]
     guild_id: Optional[str]
+    webhook_id: Optional[str]
+    webhook_token: Optional[str]
 
     def __init__(self, method: str, path: str, **kwargs) -> None:
         r"""
         :param method: The HTTP request method.
         :type method: str
-        :param path: The path of the HTTP/URL.
+        :param path: The path of the HTTP/URL, with its parameters left as ``{name}`` placeholders.
         :type path: str
         :param \**kwargs: Optional keyword-only arguments to pass as information in the route.
         :type \**kwargs: dict
@@ -62,18 +79,31 @@ class Route:
         """
         self.__api__ = "https://discord.com/api/v9"
         self.method = method
+        self.template = path
         self.path = path.format(**kwargs)
         self.channel_id = kwargs.get("channel_id")
         self.guild_id = kwargs.get("guild_id")
+        self.webhook_id = kwargs.get("webhook_id")
+        self.webhook_token = kwargs.get("webhook_token")
 
     @property
     def bucket(self) -> str:
         """
-        Returns the route's bucket.
+        Returns the route's bucket, made of its template and major parameters only,
+        so that i.e. every message of a channel shares the bucket of the channel.
 
         :return: str
         """
-        return f"{self.channel_id}:{self.guild_id}:{self.path}"
+        return f"{self.method} {self.template}:{self.major}"
+
+    @property
+    def major(self) -> str:
+        """
+        Returns the route's major parameters, which split buckets sharing a hash.
+
+        :return: str
+        """
+        return f"{self.channel_id}:{self.guild_id}:{self.webhook_id}:{self.webhook_token}"
 
 
 class Padlock:
@@ -115,30 +145,50 @@ class Request:
 
     :ivar str token: The current application token.
     :ivar asyncio.AbstractEventLoop loop: The current coroutine event loop.
-    :ivar dict ratelimits: The current ratelimits from the senpai API.
+    :ivar bunny.api.ratelimit.RatelimitBackend ratelimiter: The backend pacing requests with the rate limit headers of the senpai API.
+    :ivar typing.Optional[str] base_url: The URL requests are sent to instead of the API, i.e. a :class:`bunny.proxy.HTTPProxy`.
     :ivar dict headers: The current headers for an HTTP request.
     :ivar asyncio.ClientSession session: The current session for making requests.
-    :ivar asyncio.Event lock: The ratelimit lock event.
     """
 
-    __slots__ = ("token", "loop", "ratelimits", "headers", "session", "lock")
+    __slots__ = ("token", "loop", "ratelimiter", "base_url", "headers", "session")
     token: str
     loop: AbstractEventLoop
-    ratelimits: dict
+    ratelimiter: RatelimitBackend
+    base_url: Optional[str]
     headers: dict
     session: ClientSession
-    lock: Event
 
-    def __init__(self, token: str) -> None:
+    def __init__(
+        self,
+        token: str,
+        global_limit: int = 50,
+        ratelimiter: Optional[RatelimitBackend] = None,
+        base_url: Optional[str] = None,
+        session: Optional[ClientSession] = None,
+    ) -> None:
         """
         :param token: The application token used for authorizing.
         :type token: str
+        :param global_limit: The amount of requests allowed per second across every request of the token. Defaults to ``50``.
+        :type global_limit: int
+        :param ratelimiter: The backend keeping the rate limit state, i.e. a :class:`bunny.api.ratelimit.SharedRatelimiter`. Defaults to one kept in memory.
+        :type ratelimiter: typing.Optional[bunny.api.ratelimit.RatelimitBackend]
+        :param base_url: The URL to send requests to instead of the API, i.e. ``"http://localhost:8080/api/v9"`` for a :class:`bunny.proxy.HTTPProxy`. Defaults to ``None``.
+        :type base_url: typing.Optional[str]
+        :param session: The session to send requests with, i.e. one shared by several tokens. Defaults to a new one.
+        :type session: typing.Optional[aiohttp.ClientSession]
         :return: None
         """
         self.token = token
         self.loop = get_event_loop()
-        self.session = ClientSession()
-        self.ratelimits = {}
+        self.session = ClientSession() if session is None else session
+        self.ratelimiter = (
+            HTTPRatelimiter(global_ratelimiter=GlobalRatelimiter.shared(token, global_limit))
+            if ratelimiter is None
+            else ratelimiter
+        )
+        self.base_url = base_url.rstrip("/") if base_url else None
         self.headers = {
             "X-Ratelimit-Precision": "millisecond",
             "Authorization": f"Bot {self.token}",
@@ -146,15 +196,55 @@ class Request:
             f"Python/{version_info[0]}.{version_info[1]} "
             f"aiohttp/{http_version}",
         }
-        self.lock = Event(loop=self.loop)
-
-        self.lock.set()
 
     def check_session(self) -> None:
         """Ensures that we have a valid connection session."""
         if self.session.closed:
             self.session = ClientSession()
 
+    async def send(self, route: Route, **kwargs) -> Tuple[int, Mapping[str, str], bytes]:
+        r"""
+        Sends a request as given, waiting for its rate limits and retrying it
+        up to three times on a 429, without decoding its response.
+
+        :param route: The HTTP route to request.
+        :type route: bunny.api.http.Route
+        :param \**kwargs: Optional keyword-only arguments passed on to :meth:`aiohttp.ClientSession.request`.
+        :type \**kwargs: dict
+        :return: The status, headers and body of the last response.
+        :rtype: typing.Tuple[int, typing.Mapping[str, str], bytes]
+        """
+        self.check_session()
+        url: str = (self.base_url or route.__api__) + route.path
+
+        for _ in range(3):  # we're not using this variable, flow why
+            ticket: Any = await self.ratelimiter.acquire(route)
+
+            try:
+                async with self.session.request(route.method, url, **kwargs) as response:
+                    body: bytes = await response.read()
+                    await self.ratelimiter.update(route, ticket, response.headers)
+
+                    if response.status != 429:
+                        return response.status, response.headers, body
+
+                    data: dict = loads(body)
+                    retry_after = data["retry_after"]
+
+                    if response.headers.get("X-RateLimit-Global") or data.get("global"):
+                        # Every request of the token waits for the block to be over,
+                        # this one included once it is retried.
+                        await self.ratelimiter.block(retry_after)
+                        log.warning("The HTTP request has encountered a global API ratelimit.")
+                    else:
+                        log.warning("A local ratelimit with the bucket has been encountered.")
+                        await sleep(retry_after)
+            finally:
+                self.ratelimiter.release(ticket)
+
+        # This is reached if every retry failed.
+        return response.status, response.headers, body
+
     async def request(self, route: Route, **kwargs) -> Optional[Any]:
         r"""
         Sends a request to the senpai API.
@@ -165,65 +255,20 @@ class Request:
         :type \**kwargs: dict
         :return: None
         """
-        self.check_session()
+        kwargs["headers"] = {**self.headers, **kwargs.get("headers", {})}
 
-        bucket: Optional[str] = route.bucket
+        reason: Optional[str] = kwargs.pop("reason", None)
+        if reason:
+            kwargs["headers"]["X-Audit-Log-Reason"] = quote(reason, safe="/ ")
 
-        for _ in range(3):  # we're not using this variable, flow why
-            ratelimit: Lock = self.ratelimits.get(bucket)
-
-            if not self.lock.is_set():
-                log.warning("Global lock is still locked, waiting for it to clear...")
-                await self.lock.wait()
-
-            if ratelimit is None:
-                self.ratelimits[bucket] = Lock()
-                continue
-
-            await ratelimit.acquire()
-
-            with Padlock(ratelimit) as lock:  # noqa: F841
-                kwargs["headers"] = {**self.headers, **kwargs.get("headers", {})}
-
-                try:
-                    reason = kwargs.get("reason")
-                except:  # noqa
-                    pass
-                else:
-                    if reason:
-                        kwargs["headers"]["X-Audit-Log-Reason"] = quote(reason, safe="/ ")
-
-                kwargs["headers"]["Content-Type"] = "application/json"
-                async with self.session.request(
-                    route.method, route.__api__ + route.path, **kwargs
-                ) as response:
-                    data = await response.json(content_type=None)
-                    log.debug(data)
-
-                    if response.status in (300, 401, 403, 404):
-                        raise HTTPException(response.status)
-                    elif response.status == 429:
-                        retry_after = data["retry_after"]
-
-                        if "X-Ratelimit-Global" in response.headers.keys():
-                            self.lock.set()
-                            log.warning("The HTTP request has encountered a global API ratelimit.")
-                            await sleep(retry_after)
-                            self.lock.clear()
-                        else:
-                            log.warning("A local ratelimit with the bucket has been encountered.")
-                            await sleep(retry_after)
-                        continue
-                    return data
-
-        if response is not None:  # after _ -> 3
-            # This is reached if every retry failed.
-            if response.status >= 500:
-                raise HTTPException(
-                    response.status, message="The server had an error processing your request."
-                )
+        kwargs["headers"]["Content-Type"] = "application/json"
+        status, _, body = await self.send(route, **kwargs)
+        data: Any = loads(body) if body else None
+        log.debug(data)
 
-            raise HTTPException(response.status)  # Unknown, unparsed
+        if status in (300, 401, 403, 404, 429):
+            raise HTTPException(status)
+        return data
 
     async def close(self) -> None:
         """Closes the current session."""
@@ -239,29 +284,78 @@ class HTTPClient:
     headers: dict
     _req: Optional[Request]
 
-    def __init__(self, token: str):
+    def __init__(
+        self,
+        token: str,
+        global_limit: int = 50,
+        ratelimiter: Optional[RatelimitBackend] = None,
+        base_url: Optional[str] = None,
+    ):
         self.token = token
-        self._req = Request(self.token)  # Only one session, in theory
+        self._req = Request(  # Only one session, in theory
+            self.token, global_limit, ratelimiter, base_url=base_url
+        )
 
         # An ideology is that this client does every single HTTP call, which reduces multiple ClientSessions in theory
         # because of how they are constructed/closed. This includes Gateway
 
-    async def get_gateway(self) -> str:
-        """This calls the Gateway endpoint and returns a v9 gateway link with JSON encoding."""
+    @staticmethod
+    def gateway_query(encoding: str = "json", compress: Optional[str] = None) -> str:
+        """
+        Builds the query string appended onto a gateway URL.
+
+        :param encoding: The payload encoding to request. Defaults to ``"json"``.
+        :type encoding: str
+        :param compress: The transport compression to request, if any. Defaults to ``None``.
+        :type compress: typing.Optional[str]
+        :return: str
+        """
+        query: str = f"?v=9&encoding={encoding}"
+        if compress:
+            query += f"&compress={compress}"
+        return query
+
+    async def get_gateway(
+        self, encoding: str = "json", compress: Optional[str] = None, base_url: Optional[str] = None
+    ) -> str:
+        """
+        This calls the Gateway endpoint and returns a v9 gateway link.
+
+        :param encoding: The payload encoding to request. Defaults to ``"json"``.
+        :param compress: The transport compression to request, i.e. ``"zlib-stream"``. Defaults to ``None``.
+        :param base_url: The gateway URL to use instead of calling the endpoint, i.e. a :class:`bunny.api.mock.MockGateway`. Defaults to ``None``.
+        """
+
+        if base_url is not None:
+            return base_url + self.gateway_query(encoding, compress)
 
         url: Any = await self._req.request(
             Route("GET", "/gateway")
         )  # typehinting Any because pycharm yells
-        return url["url"] + "?v=9&encoding=json"
+        return url["url"] + self.gateway_query(encoding, compress)
 
-    async def get_bot_gateway(self) -> Tuple[int, str]:
+    async def get_bot_gateway(
+        self, encoding: str = "json", compress: Optional[str] = None
+    ) -> Tuple[int, str]:
         """
         This calls the BOT Gateway endpoint.
-        :return: A tuple denoting (shard, gateway_url), url from API v9 and JSON encoding
+
+        :param encoding: The payload encoding to request. Defaults to ``"json"``.
+        :param compress: The transport compression to request, i.e. ``"zlib-stream"``. Defaults to ``None``.
+        :return: A tuple denoting (shard, gateway_url), url from API v9
         """
 
-        data: Any = await self._req.request(Route("GET", "/gateway/bot"))
-        return data["shards"], data["url"] + "?v=9&encoding=json"
+        data: dict = await self.get_bot_gateway_data()
+        return data["shards"], data["url"] + self.gateway_query(encoding, compress)
+
+    async def get_bot_gateway_data(self) -> dict:
+        """
+        This calls the BOT Gateway endpoint and returns its raw data.
+
+        :return: A dictionary containing the ``url``, ``shards`` and ``session_start_limit``.
+        """
+
+        return await self._req.request(Route("GET", "/gateway/bot"))
 
     async def login(self) -> Optional[dict]:
         """
@@ -324,7 +418,7 @@ class HTTPClient:
         if user_id is None:
             user_id = "@me"
 
-        return await self._req.request(Route("GET", f"/users/{user_id}"))
+        return await self._req.request(Route("GET", "/users/{user_id}", user_id=user_id))
 
     async def modify_self(self, payload: dict) -> dict:
         """
@@ -418,7 +512,12 @@ class HTTPClient:
         :return: message if it exists.
         """
         return await self._req.request(
-            Route("GET", f"/channels/{channel_id}/messages/{message_id}")
+            Route(
+                "GET",
+                "/channels/{channel_id}/messages/{message_id}",
+                channel_id=channel_id,
+                message_id=message_id,
+            )
         )
 
     async def delete_message(
@@ -479,14 +578,28 @@ class HTTPClient:
         :param channel_id: Channel ID snowflake.
         :param message_id: Message ID snowflake.
         """
-        return await self._req.request(Route("PUT", f"/channels/{channel_id}/pins/{message_id}"))
+        return await self._req.request(
+            Route(
+                "PUT",
+                "/channels/{channel_id}/pins/{message_id}",
+                channel_id=channel_id,
+                message_id=message_id,
+            )
+        )
 
     async def unpin_message(self, channel_id: int, message_id: int) -> None:
         """Unpin a message to a channel
         :param channel_id: Channel ID snowflake.
         :param message_id: Message ID snowflake.
         """
-        return await self._req.request(Route("DELETE", f"/channels/{channel_id}/pins/{message_id}"))
+        return await self._req.request(
+            Route(
+                "DELETE",
+                "/channels/{channel_id}/pins/{message_id}",
+                channel_id=channel_id,
+                message_id=message_id,
+            )
+        )
 
     async def publish_message(self, channel_id: int, message_id: int) -> dict:
         """Publishes (API calls it crossposts) a message in a News channel to any that is followed by.
@@ -496,7 +609,12 @@ class HTTPClient:
         :return: message object
         """
         return await self._req.request(
-            Route("POST", f"/channels/{channel_id}/messages/{message_id}/crosspost")
+            Route(
+                "POST",
+                "/channels/{channel_id}/messages/{message_id}/crosspost",
+                channel_id=channel_id,
+                message_id=message_id,
+            )
         )
 
     # Guild endpoint
@@ -523,7 +641,9 @@ class HTTPClient:
         :param guild_id: Guild ID snowflake.
         :return: Guild Preview object associated with the snowflake
         """
-        return await self._req.request(Route("GET", f"/guilds/{guild_id}/preview"))
+        return await self._req.request(
+            Route("GET", "/guilds/{guild_id}/preview", guild_id=guild_id)
+        )
 
     async def modify_guild(
         self, guild_id: int, payload: dict, reason: Optional[str] = None
@@ -539,7 +659,9 @@ class HTTPClient:
         :param reason: Reason to send to the audit log, if given.
         """
 
-        await self._req.request(Route("PATCH", f"/guilds/{guild_id}"), json=payload, reason=reason)
+        await self._req.request(
+            Route("PATCH", "/guilds/{guild_id}", guild_id=guild_id), json=payload, reason=reason
+        )
 
     async def leave_guild(self, guild_id: int) -> None:
         """
@@ -558,7 +680,7 @@ class HTTPClient:
 
         :param guild_id: Guild ID snowflake.
         """
-        return await self._req.request(Route("DELETE", f"/guilds/{guild_id}"))
+        return await self._req.request(Route("DELETE", "/guilds/{guild_id}", guild_id=guild_id))
 
     async def get_guild_widget(self, guild_id: int) -> dict:
         """
@@ -566,7 +688,9 @@ class HTTPClient:
         :param guild_id: Guild ID snowflake.
         :return: Guild Widget contents as a dict: {"enabled":bool, "channel_id": str}
         """
-        return await self._req.request(Route("GET", f"/guilds/{guild_id}/widget.json"))
+        return await self._req.request(
+            Route("GET", "/guilds/{guild_id}/widget.json", guild_id=guild_id)
+        )
 
     async def get_guild_widget_settings(self, guild_id: int) -> dict:
         """
@@ -575,7 +699,7 @@ class HTTPClient:
         :param guild_id: Guild ID snowflake.
         :return: Guild Widget contents as a dict: {"enabled":bool, "channel_id": str}
         """
-        return await self._req.request(Route("GET", f"/guilds/{guild_id}"))
+        return await self._req.request(Route("GET", "/guilds/{guild_id}", guild_id=guild_id))
 
     async def get_guild_widget_image(self, guild_id: int, style: Optional[str] = None) -> str:
         """
@@ -587,8 +711,8 @@ class HTTPClient:
         :param style: The style of widget required, if given.
         :return: A url pointing to this image
         """
-        route = Route("GET", f"/guilds/{guild_id}/widget.png{f'?style={style}' if style else ''}")
-        return route.path
+        route = Route("GET", "/guilds/{guild_id}/widget.png", guild_id=guild_id)
+        return route.path + (f"?style={style}" if style else "")
 
     async def modify_guild_widget(self, guild_id: int, payload: dict) -> dict:
         """
@@ -598,7 +722,9 @@ class HTTPClient:
         :param payload: Payload containing new widget attributes.
         :return: Updated widget attributes.
         """
-        return await self._req.request(Route("PATCH", f"/guilds/{guild_id}/widget"), json=payload)
+        return await self._req.request(
+            Route("PATCH", "/guilds/{guild_id}/widget", guild_id=guild_id), json=payload
+        )
 
     async def get_guild_invites(self, guild_id: int) -> List[Invite]:
         """
@@ -606,7 +732,9 @@ class HTTPClient:
         :param guild_id: Guild ID snowflake.
         :return: A list of invite objects
         """
-        return await self._req.request(Route("GET", f"/guilds/{guild_id}/invites"))
+        return await self._req.request(
+            Route("GET", "/guilds/{guild_id}/invites", guild_id=guild_id)
+        )
 
     async def get_guild_welcome_screen(self, guild_id: int) -> WelcomeScreen:
         """
@@ -614,7 +742,9 @@ class HTTPClient:
         :param guild_id: Guild ID snowflake.
         :return: Welcome Screen object
         """
-        return await self._req.request(Route("GET", f"/guilds/{guild_id}/welcome-screen"))
+        return await self._req.request(
+            Route("GET", "/guilds/{guild_id}/welcome-screen", guild_id=guild_id)
+        )
 
     async def modify_guild_welcome_screen(
         self, guild_id: int, enabled: bool, welcome_channels: List[int], description: str
@@ -629,7 +759,7 @@ class HTTPClient:
         :return: Updated Welcome screen object.
         """
         return await self._req.request(
-            Route("PATCH", f"/guilds/{guild_id}/welcome-screen"),
+            Route("PATCH", "/guilds/{guild_id}/welcome-screen", guild_id=guild_id),
             json={
                 "enabled": enabled,
                 "welcome_channels": welcome_channels,
@@ -658,7 +788,9 @@ class HTTPClient:
         :param guild_id: Guild ID snowflake.
         :return: An array of integration objects
         """
-        return await self._req.request(Route("GET", f"/guilds/{guild_id}/integrations"))
+        return await self._req.request(
+            Route("GET", "/guilds/{guild_id}/integrations", guild_id=guild_id)
+        )
 
     async def delete_guild_integration(self, guild_id: int, integration_id: int) -> None:
         """
@@ -667,7 +799,12 @@ class HTTPClient:
         :param integration_id: Integration ID snowflake.
         """
         return await self._req.request(
-            Route("DELETE", f"/guilds/{guild_id}/integrations/{integration_id}")
+            Route(
+                "DELETE",
+                "/guilds/{guild_id}/integrations/{integration_id}",
+                guild_id=guild_id,
+                integration_id=integration_id,
+            )
         )
 
     async def modify_current_user_voice_state(
@@ -686,7 +823,7 @@ class HTTPClient:
         :param request_to_speak_timestamp: Sets the user's request to speak, if given.
         """
         return await self._req.request(
-            Route("PATCH", f"/guilds/{guild_id}/voice-states/@me"),
+            Route("PATCH", "/guilds/{guild_id}/voice-states/@me", guild_id=guild_id),
             json={
                 k: v
                 for k, v in {
@@ -710,7 +847,12 @@ class HTTPClient:
         :param suppress: Toggles the user's suppress state, if given.
         """
         return await self._req.request(
-            Route("PATCH", f"/guilds/{guild_id}/voice-states/{user_id}"),
+            Route(
+                "PATCH",
+                "/guilds/{guild_id}/voice-states/{user_id}",
+                guild_id=guild_id,
+                user_id=user_id,
+            ),
             json={
                 k: v
                 for k, v in {"channel_id": channel_id, "suppress": suppress}.items()
@@ -738,7 +880,12 @@ class HTTPClient:
         if icon:
             payload["icon"] = icon
         return await self._req.request(
-            Route("POST", f"/guilds/templates/{template_code}", json=payload)
+            Route(
+                "POST",
+                "/guilds/templates/{template_code}",
+                template_code=template_code,
+                json=payload,
+            )
         )
 
     async def get_guild_templates(self, guild_id: int) -> List[GuildTemplate]:
@@ -748,7 +895,9 @@ class HTTPClient:
         :param guild_id: Guild ID snowflake.
         :return: An array of guild templates
         """
-        return await self._req.request(Route("GET", f"/guilds/{guild_id}/templates"))
+        return await self._req.request(
+            Route("GET", "/guilds/{guild_id}/templates", guild_id=guild_id)
+        )
 
     async def create_guild_template(
         self, guild_id: int, name: str, description: Optional[str] = None
@@ -762,7 +911,7 @@ class HTTPClient:
         :return: The created guild template
         """
         return await self._req.request(
-            Route("POST", f"/guilds/{guild_id}/templates"),
+            Route("POST", "/guilds/{guild_id}/templates", guild_id=guild_id),
             json={
                 k: v for k, v in {"name": name, "description": description}.items() if v is not None
             },
@@ -777,7 +926,12 @@ class HTTPClient:
         :return: The updated guild template.
         """
         return await self._req.request(
-            Route("PUT", f"/guilds/{guild_id}/templates/{template_code}")
+            Route(
+                "PUT",
+                "/guilds/{guild_id}/templates/{template_code}",
+                guild_id=guild_id,
+                template_code=template_code,
+            )
         )
 
     async def modify_guild_template(
@@ -797,7 +951,12 @@ class HTTPClient:
         :return: The updated guild template
         """
         return await self._req.request(
-            Route("PATCH", f"/guilds/{guild_id}/templates/{template_code}"),
+            Route(
+                "PATCH",
+                "/guilds/{guild_id}/templates/{template_code}",
+                guild_id=guild_id,
+                template_code=template_code,
+            ),
             json={
                 k: v for k, v in {"name": name, "description": description}.items() if v is not None
             },
@@ -813,7 +972,12 @@ class HTTPClient:
         """
         # According to Polls, this returns the object. Why, I don't know.
         return await self._req.request(
-            Route("DELETE", f"/guilds/{guild_id}/templates/{template_code}")
+            Route(
+                "DELETE",
+                "/guilds/{guild_id}/templates/{template_code}",
+                guild_id=guild_id,
+                template_code=template_code,
+            )
         )
 
     async def get_all_channels(self, guild_id: int) -> List[dict]:
@@ -846,7 +1010,7 @@ class HTTPClient:
         :return: Role object
         """
         return await self._req.request(
-            Route("POST", f"/guilds/{guild_id}/roles"), json=data, reason=reason
+            Route("POST", "/guilds/{guild_id}/roles", guild_id=guild_id), json=data, reason=reason
         )
 
     async def modify_guild_role_position(
@@ -861,7 +1025,7 @@ class HTTPClient:
         :return: List of guild roles with updated hierarchy.
         """
         return await self._req.request(
-            Route("PATCH", f"/guilds/{guild_id}/roles"),
+            Route("PATCH", "/guilds/{guild_id}/roles", guild_id=guild_id),
             json={"id": role_id, "position": position},
             reason=reason,
         )
@@ -878,7 +1042,11 @@ class HTTPClient:
         :return: Updated role object.
         """
         return await self._req.request(
-            Route("PATCH", f"/guilds/{guild_id}/roles/{role_id}"), json=data, reason=reason
+            Route(
+                "PATCH", "/guilds/{guild_id}/roles/{role_id}", guild_id=guild_id, role_id=role_id
+            ),
+            json=data,
+            reason=reason,
         )
 
     async def delete_guild_role(self, guild_id: int, role_id: int, reason: str = None) -> None:
@@ -889,7 +1057,10 @@ class HTTPClient:
         :param reason: The reason for this action, if any.
         """
         return await self._req.request(
-            Route("DELETE", f"/guilds/{guild_id}/roles/{role_id}"), reason=reason
+            Route(
+                "DELETE", "/guilds/{guild_id}/roles/{role_id}", guild_id=guild_id, role_id=role_id
+            ),
+            reason=reason,
         )
 
     async def create_guild_kick(
@@ -926,7 +1097,7 @@ class HTTPClient:
         """
 
         return await self._req.request(
-            Route("PUT", f"/guilds/{guild_id}/bans/{user_id}"),
+            Route("PUT", "/guilds/{guild_id}/bans/{user_id}", guild_id=guild_id, user_id=user_id),
             json={"delete_message_days": delete_message_days},
             reason=reason,
         )
@@ -955,7 +1126,7 @@ class HTTPClient:
         :return: A list of banned users.
         """
         # TODO: Create banned entry.
-        return await self._req.request(Route("GET", f"/guilds/{guild_id}/bans"))
+        return await self._req.request(Route("GET", "/guilds/{guild_id}/bans", guild_id=guild_id))
 
     async def get_user_ban(self, guild_id: int, user_id: int) -> Optional[dict]:
         """
@@ -964,7 +1135,9 @@ class HTTPClient:
         :param user_id: User ID snowflake.
         :return: Ban object if it exists.
         """
-        return await self._req.request(Route("GET", f"/guilds/{guild_id}/bans/{user_id}"))
+        return await self._req.request(
+            Route("GET", "/guilds/{guild_id}/bans/{user_id}", guild_id=guild_id, user_id=user_id)
+        )
 
     async def add_guild_member(
         self,
@@ -989,7 +1162,9 @@ class HTTPClient:
         :return: Guild member object (?)
         """
         return await self._req.request(
-            Route("PUT", f"/guilds/{guild_id}/members/{user_id}"),
+            Route(
+                "PUT", "/guilds/{guild_id}/members/{user_id}", guild_id=guild_id, user_id=user_id
+            ),
             json={
                 k: v
                 for k, v in {
@@ -1013,7 +1188,10 @@ class HTTPClient:
         :param reason: Reason to send to audit log, if any.
         """
         return await self._req.request(
-            Route("DELETE", f"/guilds/{guild_id}/members/{user_id}"), reason=reason
+            Route(
+                "DELETE", "/guilds/{guild_id}/members/{user_id}", guild_id=guild_id, user_id=user_id
+            ),
+            reason=reason,
         )
 
     async def get_guild_prune_count(
@@ -1032,7 +1210,9 @@ class HTTPClient:
                 str(x) for x in include_roles
             )  # would still iterate
 
-        return await self._req.request(Route("GET", f"/guilds/{guild_id}/prune"), params=payload)
+        return await self._req.request(
+            Route("GET", "/guilds/{guild_id}/prune", guild_id=guild_id), params=payload
+        )
 
     # Guild (Member) endpoint
 
@@ -1067,7 +1247,9 @@ class HTTPClient:
         if after:
             payload["after"] = after
 
-        return await self._req.request(Route("GET", f"/guilds/{guild_id}/members"), params=payload)
+        return await self._req.request(
+            Route("GET", "/guilds/{guild_id}/members", guild_id=guild_id), params=payload
+        )
 
     async def search_guild_members(self, guild_id: int, query: str, limit: int = 1) -> List[Member]:
         """
@@ -1079,7 +1261,7 @@ class HTTPClient:
         """
 
         return await self._req.request(
-            Route("GET", f"/guilds/{guild_id}/members/search"),
+            Route("GET", "/guilds/{guild_id}/members/search", guild_id=guild_id),
             params={"query": query, "limit": limit},
         )
 
@@ -1153,7 +1335,9 @@ class HTTPClient:
         :param channel_id: Channel ID snowflake.
         :return: Channel object.
         """
-        return await self._req.request(Route("GET", f"/channels/{channel_id}"))
+        return await self._req.request(
+            Route("GET", "/channels/{channel_id}", channel_id=channel_id)
+        )
 
     async def delete_channel(self, channel_id: int) -> None:
         """
@@ -1206,7 +1390,7 @@ class HTTPClient:
             )
 
         return await self._req.request(
-            Route("GET", f"/channels/{channel_id}/messages"), params=params
+            Route("GET", "/channels/{channel_id}/messages", channel_id=channel_id), params=params
         )
 
     async def create_channel(
@@ -1224,7 +1408,9 @@ class HTTPClient:
         :return: Channel object.
         """
         return await self._req.request(
-            Route("POST", f"/guilds/{guild_id}/channels"), json=payload, reason=reason
+            Route("POST", "/guilds/{guild_id}/channels", guild_id=guild_id),
+            json=payload,
+            reason=reason,
         )
 
     async def move_channel(
@@ -1252,7 +1438,9 @@ class HTTPClient:
             payload["parent_id"] = parent_id
 
         return await self._req.request(
-            Route("PATCH", f"/guilds/{guild_id}/channels"), json=payload, reason=reason
+            Route("PATCH", "/guilds/{guild_id}/channels", guild_id=guild_id),
+            json=payload,
+            reason=reason,
         )
 
     async def modify_channel(
@@ -1266,7 +1454,9 @@ class HTTPClient:
         :return: Channel with updated attributes, if successful.
         """
         return await self._req.request(
-            Route("PATCH", f"/channels/{channel_id}"), json=data, reason=reason
+            Route("PATCH", "/channels/{channel_id}", channel_id=channel_id),
+            json=data,
+            reason=reason,
         )
 
     async def get_channel_invites(self, channel_id: int) -> List[Invite]:
@@ -1275,7 +1465,9 @@ class HTTPClient:
         :param channel_id: Channel ID snowflake.
         :return: List of invite objects
         """
-        return await self._req.request(Route("GET", f"/channels/{channel_id}/invites"))
+        return await self._req.request(
+            Route("GET", "/channels/{channel_id}/invites", channel_id=channel_id)
+        )
 
     async def create_channel_invite(
         self, channel_id: int, data: dict, reason: Optional[str] = None
@@ -1292,7 +1484,9 @@ class HTTPClient:
         :return: An invite object.
         """
         return await self._req.request(
-            Route("POST", f"/channels/{channel_id}/invites"), json=data, reason=reason
+            Route("POST", "/channels/{channel_id}/invites", channel_id=channel_id),
+            json=data,
+            reason=reason,
         )
 
     async def delete_invite(self, invite_code: str, reason: Optional[str] = None) -> dict:
@@ -1302,7 +1496,9 @@ class HTTPClient:
         :param reason: Reason to show in the audit log, if any.
         :return: The deleted invite object
         """
-        return await self._req.request(Route("DELETE", f"/invites/{invite_code}"), reason=reason)
+        return await self._req.request(
+            Route("DELETE", "/invites/{invite_code}", invite_code=invite_code), reason=reason
+        )
 
     async def edit_channel_permission(
         self,
@@ -1324,7 +1520,12 @@ class HTTPClient:
         :param reason: Reason to display in the Audit Log, if given.
         """
         return await self._req.request(
-            Route("PUT", f"/channels/{channel_id}/permissions/{overwrite_id}"),
+            Route(
+                "PUT",
+                "/channels/{channel_id}/permissions/{overwrite_id}",
+                channel_id=channel_id,
+                overwrite_id=overwrite_id,
+            ),
             json={"allow": allow, "deny": deny, "type": perm_type},
         )
 
@@ -1339,7 +1540,13 @@ class HTTPClient:
         :param reason: Reason to display in the Audit Log, if given.
         """
         return await self._req.request(
-            Route("DELETE", f"/channels/{channel_id}/{overwrite_id}"), reason=reason
+            Route(
+                "DELETE",
+                "/channels/{channel_id}/{overwrite_id}",
+                channel_id=channel_id,
+                overwrite_id=overwrite_id,
+            ),
+            reason=reason,
         )
 
     async def trigger_typing(self, channel_id: int) -> None:
@@ -1350,7 +1557,9 @@ class HTTPClient:
             By default, this lib doesn't use this endpoint, however, this is listed for third-party implementation.
         :param channel_id: Channel ID snowflake.
         """
-        return await self._req.request(Route("POST", f"/channels/{channel_id}/typing"))
+        return await self._req.request(
+            Route("POST", "/channels/{channel_id}/typing", channel_id=channel_id)
+        )
 
     async def get_pinned_messages(self, channel_id: int) -> List[Message]:
         """
@@ -1358,7 +1567,9 @@ class HTTPClient:
         :param channel_id: Channel ID snowflake.
         :return: A list of pinned message objects.
         """
-        return await self._req.request(Route("GET", f"/channels/{channel_id}/pins"))
+        return await self._req.request(
+            Route("GET", "/channels/{channel_id}/pins", channel_id=channel_id)
+        )
 
     async def create_stage_instance(
         self, channel_id: int, topic: str, privacy_level: int = 1, reason: Optional[str] = None
@@ -1389,7 +1600,9 @@ class HTTPClient:
         :param channel_id: Channel ID snowflake.
         :return: A stage instance.
         """
-        return await self._req.request(Route("GET", f"/stage-instances/{channel_id}"))
+        return await self._req.request(
+            Route("GET", "/stage-instances/{channel_id}", channel_id=channel_id)
+        )
 
     async def modify_stage_instance(
         self,
@@ -1408,7 +1621,7 @@ class HTTPClient:
         :return: The updated stage instance.
         """
         return await self._req.request(
-            Route("PATCH", f"/stage-instances/{channel_id}"),
+            Route("PATCH", "/stage-instances/{channel_id}", channel_id=channel_id),
             json={
                 k: v
                 for k, v in {"topic": topic, "privacy_level": privacy_level}.items()
@@ -1425,7 +1638,7 @@ class HTTPClient:
         :param reason: The reason for the creating the stage instance, if any.
         """
         return await self._req.request(
-            Route("DELETE", f"/stage-instances/{channel_id}"), reason=reason
+            Route("DELETE", "/stage-instances/{channel_id}", channel_id=channel_id), reason=reason
         )
 
     # Thread endpoint
@@ -1435,14 +1648,18 @@ class HTTPClient:
         Have the bot user join a thread.
         :param thread_id: The thread to join.
         """
-        return await self._req.request(Route("PUT", f"/channels/{thread_id}/thread-members/@me"))
+        return await self._req.request(
+            Route("PUT", "/channels/{channel_id}/thread-members/@me", channel_id=thread_id)
+        )
 
     async def leave_thread(self, thread_id: int) -> None:
         """
         Have the bot user leave a thread.
         :param thread_id: The thread to leave.
         """
-        return await self._req.request(Route("DELETE", f"/channels/{thread_id}/thread-members/@me"))
+        return await self._req.request(
+            Route("DELETE", "/channels/{channel_id}/thread-members/@me", channel_id=thread_id)
+        )
 
     async def add_member_to_thread(self, thread_id: int, user_id: int) -> None:
         """
@@ -1451,7 +1668,12 @@ class HTTPClient:
         :param user_id: The ID of the user to add
         """
         return await self._req.request(
-            Route("PUT", f"/channels/{thread_id}/thread-members/@{user_id}")
+            Route(
+                "PUT",
+                "/channels/{channel_id}/thread-members/@{user_id}",
+                channel_id=thread_id,
+                user_id=user_id,
+            )
         )
 
     async def remove_member_from_thread(self, thread_id: int, user_id: int) -> None:
@@ -1461,7 +1683,12 @@ class HTTPClient:
         :param user_id: The ID of the user to remove
         """
         return await self._req.request(
-            Route("DELETE", f"/channels/{thread_id}/thread-members/@{user_id}")
+            Route(
+                "DELETE",
+                "/channels/{channel_id}/thread-members/@{user_id}",
+                channel_id=thread_id,
+                user_id=user_id,
+            )
         )
 
     async def list_thread_members(self, thread_id: int) -> List[dict]:
@@ -1470,7 +1697,9 @@ class HTTPClient:
         :param thread_id: the id of the thread
         :return: a list of member objects
         """
-        return await self._req.request(Route("GET", f"/channels/{thread_id}/thread-members"))
+        return await self._req.request(
+            Route("GET", "/channels/{channel_id}/thread-members", channel_id=thread_id)
+        )
 
     async def list_public_archived_threads(
         self, channel_id: int, limit: int = None, before: Optional[int] = None
@@ -1489,7 +1718,8 @@ class HTTPClient:
         if before:
             payload["before"] = before
         return await self._req.request(
-            Route("GET", f"/channels/{channel_id}/threads/archived/public"), json=payload
+            Route("GET", "/channels/{channel_id}/threads/archived/public", channel_id=channel_id),
+            json=payload,
         )
 
     async def list_private_archived_threads(
@@ -1508,7 +1738,8 @@ class HTTPClient:
         if before:
             payload["before"] = before
         return await self._req.request(
-            Route("GET", f"/channels/{channel_id}/threads/archived/private"), json=payload
+            Route("GET", "/channels/{channel_id}/threads/archived/private", channel_id=channel_id),
+            json=payload,
         )
 
     async def list_joined_private_archived_threads(
@@ -1527,7 +1758,12 @@ class HTTPClient:
         if before:
             payload["before"] = before
         return await self._req.request(
-            Route("GET", f"/channels/{channel_id}/users/@me/threads/archived/private"), json=payload
+            Route(
+                "GET",
+                "/channels/{channel_id}/users/@me/threads/archived/private",
+                channel_id=channel_id,
+            ),
+            json=payload,
         )
 
     async def list_active_threads(self, guild_id: int) -> List[dict]:
@@ -1536,7 +1772,9 @@ class HTTPClient:
         :param guild_id: the guild id to get threads from
         :return: A list of active threads
         """
-        return await self._req.request(Route("GET", f"/guilds/{guild_id}/threads/active"))
+        return await self._req.request(
+            Route("GET", "/guilds/{guild_id}/threads/active", guild_id=guild_id)
+        )
 
     async def create_thread(
         self,
@@ -1564,14 +1802,21 @@ class HTTPClient:
         payload = {"name": name, "auto_archive_duration": auto_archive_duration}
         if message_id:
             return await self._req.request(
-                Route("POST", f"/channels/{channel_id}/messages/{message_id}/threads"),
+                Route(
+                    "POST",
+                    "/channels/{channel_id}/messages/{message_id}/threads",
+                    channel_id=channel_id,
+                    message_id=message_id,
+                ),
                 json=payload,
                 reason=reason,
             )
         payload["type"] = thread_type
         payload["invitable"] = invitable
         return await self._req.request(
-            Route("POST", f"/channels/{channel_id}/threads"), json=payload, reason=reason
+            Route("POST", "/channels/{channel_id}/threads", channel_id=channel_id),
+            json=payload,
+            reason=reason,
         )
 
     # Reaction endpoint
@@ -1695,7 +1940,9 @@ class HTTPClient:
         :param sticker_id: The id of the sticker
         :return: Sticker or None
         """
-        return await self._req.request(Route("GET", f"/stickers/{sticker_id}"))
+        return await self._req.request(
+            Route("GET", "/stickers/{sticker_id}", sticker_id=sticker_id)
+        )
 
     async def list_nitro_sticker_packs(self) -> list:
         """
@@ -1710,7 +1957,9 @@ class HTTPClient:
         :param guild_id: The guild to get stickers from
         :return: List of Stickers or None
         """
-        return await self._req.request(Route("GET", f"/guild/{guild_id}/stickers"))
+        return await self._req.request(
+            Route("GET", "/guild/{guild_id}/stickers", guild_id=guild_id)
+        )
 
     async def get_guild_sticker(self, guild_id: int, sticker_id: int) -> dict:
         """
@@ -1719,7 +1968,14 @@ class HTTPClient:
         :param sticker_id: The sticker to get from the guild
         :return: Sticker or None
         """
-        return await self._req.request(Route("GET", f"/guild/{guild_id}/stickers/{sticker_id}"))
+        return await self._req.request(
+            Route(
+                "GET",
+                "/guild/{guild_id}/stickers/{sticker_id}",
+                guild_id=guild_id,
+                sticker_id=sticker_id,
+            )
+        )
 
     async def create_guild_sticker(
         self, payload: FormData, guild_id: int, reason: Optional[str] = None
@@ -1732,7 +1988,9 @@ class HTTPClient:
         :return: The new sticker data on success.
         """
         return await self._req.request(
-            Route("POST", f"/guild/{guild_id}/stickers"), json=payload, reason=reason
+            Route("POST", "/guild/{guild_id}/stickers", guild_id=guild_id),
+            json=payload,
+            reason=reason,
         )
 
     async def modify_guild_sticker(
@@ -1747,7 +2005,14 @@ class HTTPClient:
         :return: The updated sticker data on success.
         """
         return await self._req.request(
-            Route("PATCH", f"/guild/{guild_id}/stickers/{sticker_id}"), json=payload, reason=reason
+            Route(
+                "PATCH",
+                "/guild/{guild_id}/stickers/{sticker_id}",
+                guild_id=guild_id,
+                sticker_id=sticker_id,
+            ),
+            json=payload,
+            reason=reason,
         )
 
     async def delete_guild_sticker(
@@ -1761,7 +2026,13 @@ class HTTPClient:
         :return: Returns 204 No Content on success.
         """
         return await self._req.request(
-            Route("DELETE", f"/guild/{guild_id}/stickers/{sticker_id}"), reason=reason
+            Route(
+                "DELETE",
+                "/guild/{guild_id}/stickers/{sticker_id}",
+                guild_id=guild_id,
+                sticker_id=sticker_id,
+            ),
+            reason=reason,
         )
 
     # Interaction endpoint (Application commands) **
@@ -1779,9 +2050,18 @@ class HTTPClient:
         :return: A list of Application commands.
         """
         if not guild_id:
-            return await self._req.request(Route("GET", f"/applications/{application_id}/commands"))
+            return await self._req.request(
+                Route(
+                    "GET", "/applications/{application_id}/commands", application_id=application_id
+                )
+            )
         return await self._req.request(
-            Route("GET", f"/applications/{application_id}/guilds/{guild_id}/commands")
+            Route(
+                "GET",
+                "/applications/{application_id}/guilds/{guild_id}/commands",
+                application_id=application_id,
+                guild_id=guild_id,
+            )
         )
 
     async def create_application_command(
@@ -1796,14 +2076,18 @@ class HTTPClient:
         :return: An application command object.
         """
 
-        url = (
-            f"/applications/{application_id}/commands"
-            if not guild_id
-            else f"/applications/{application_id}/guilds/{guild_id}/commands"
+        return await self._req.request(
+            Route(
+                "POST",
+                "/applications/{application_id}/guilds/{guild_id}/commands"
+                if guild_id
+                else "/applications/{application_id}/commands",
+                application_id=application_id,
+                guild_id=guild_id,
+            ),
+            json=data,
         )
 
-        return await self._req.request(Route("POST", url), json=data)
-
     async def overwrite_application_command(
         self, application_id: int, data: List[dict], guild_id: Optional[int] = None
     ) -> List[dict]:
@@ -1818,14 +2102,18 @@ class HTTPClient:
         :param guild_id: Guild ID snowflake to put them in, if applicable.
         :return: An array of application command objects.
         """
-        url = (
-            f"/applications/{application_id}/commands"
-            if not guild_id
-            else f"/applications/{application_id}/guilds/{guild_id}/commands"
+        return await self._req.request(
+            Route(
+                "PUT",
+                "/applications/{application_id}/guilds/{guild_id}/commands"
+                if guild_id
+                else "/applications/{application_id}/commands",
+                application_id=application_id,
+                guild_id=guild_id,
+            ),
+            json=data,
         )
 
-        return await self._req.request(Route("PUT", url), json=data)
-
     async def edit_application_command(
         self, application_id: int, data: dict, command_id: int, guild_id: Optional[int] = None
     ) -> dict:
@@ -1901,7 +2189,10 @@ class HTTPClient:
         return await self._req.request(
             Route(
                 "PUT",
-                f"/applications/{application_id}/guilds/{guild_id}/commands/{command_id}/permissions",
+                "/applications/{application_id}/guilds/{guild_id}/commands/{command_id}/permissions",
+                application_id=application_id,
+                guild_id=guild_id,
+                command_id=command_id,
             ),
             json=data,
         )
@@ -1918,7 +2209,12 @@ class HTTPClient:
         :return: An updated array of application array permissions.
         """
         return await self._req.request(
-            Route("PUT", f"/applications/{application_id}/guilds/{guild_id}/commands/permissions"),
+            Route(
+                "PUT",
+                "/applications/{application_id}/guilds/{guild_id}/commands/permissions",
+                application_id=application_id,
+                guild_id=guild_id,
+            ),
             json=data,
         )
 
@@ -1936,7 +2232,10 @@ class HTTPClient:
         return await self._req.request(
             Route(
                 "GET",
-                f"/applications/{application_id}/guilds/{guild_id}/commands/{command_id}/permissions",
+                "/applications/{application_id}/guilds/{guild_id}/commands/{command_id}/permissions",
+                application_id=application_id,
+                guild_id=guild_id,
+                command_id=command_id,
             )
         )
 
@@ -1951,7 +2250,12 @@ class HTTPClient:
         :return: An array of Guild Application Command permissions
         """
         return await self._req.request(
-            Route("GET", f"/applications/{application_id}/guilds/{guild_id}/commands/permissions")
+            Route(
+                "GET",
+                "/applications/{application_id}/guilds/{guild_id}/commands/permissions",
+                application_id=application_id,
+                guild_id=guild_id,
+            )
         )
 
     async def create_interaction_response(
@@ -1965,7 +2269,13 @@ class HTTPClient:
         :param data: The data to send.
         """
         return await self._req.request(
-            Route("POST", f"/bunny/{application_id}/{token}/callback"), json=data
+            Route(
+                "POST",
+                "/bunny/{application_id}/{token}/callback",
+                application_id=application_id,
+                token=token,
+            ),
+            json=data,
         )
 
     # This is still Bunny, but this also applies to webhooks
@@ -1982,7 +2292,13 @@ class HTTPClient:
         """
         # ^ again, I don't know if python will let me
         return await self._req.request(
-            Route("GET", f"/webhooks/{application_id}/{token}/messages/{message_id}")
+            Route(
+                "GET",
+                "/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}",
+                webhook_id=application_id,
+                webhook_token=token,
+                message_id=message_id,
+            )
         )
 
     async def edit_interaction_response(
@@ -1998,7 +2314,13 @@ class HTTPClient:
         """
         # ^ again, I don't know if python will let me
         return await self._req.request(
-            Route("PATCH", f"/webhooks/{application_id}/{token}/messages/{message_id}"),
+            Route(
+                "PATCH",
+                "/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}",
+                webhook_id=application_id,
+                webhook_token=token,
+                message_id=message_id,
+            ),
             json=data,
         )
 
@@ -2011,7 +2333,13 @@ class HTTPClient:
         """
 
         return await self._req.request(
-            Route("POST", f"/webhooks/{application_id}/{token}"), json=data
+            Route(
+                "POST",
+                "/webhooks/{webhook_id}/{webhook_token}",
+                webhook_id=application_id,
+                webhook_token=token,
+            ),
+            json=data,
         )
 
     # Webhook endpoints.
@@ -2028,7 +2356,8 @@ class HTTPClient:
         :return Webhook object
         """
         return await self._req.request(
-            Route("POST", f"/channels/{channel_id}/webhooks"), json={"name": name, "avatar": avatar}
+            Route("POST", "/channels/{channel_id}/webhooks", channel_id=channel_id),
+            json={"name": name, "avatar": avatar},
         )
 
     async def get_channel_webhooks(self, channel_id: int) -> List[dict]:
@@ -2037,7 +2366,9 @@ class HTTPClient:
         :param channel_id: Channel ID snowflake.
         :return:List of webhook objects
         """
-        return await self._req.request(Route("GET", f"/channels/{channel_id}/webhooks"))
+        return await self._req.request(
+            Route("GET", "/channels/{channel_id}/webhooks", channel_id=channel_id)
+        )
 
     async def get_guild_webhooks(self, guild_id: int) -> List[dict]:
         """
@@ -2046,7 +2377,9 @@ class HTTPClient:
 
         :return: List of webhook objects
         """
-        return await self._req.request(Route("GET", f"/guilds/{guild_id}/webhooks"))
+        return await self._req.request(
+            Route("GET", "/guilds/{guild_id}/webhooks", guild_id=guild_id)
+        )
 
     async def get_webhook(self, webhook_id: int, webhook_token: str = None) -> dict:
         """
@@ -2056,9 +2389,16 @@ class HTTPClient:
 
         :return:Webhook object
         """
-        endpoint = f"/webhooks/{webhook_id}{f'/{webhook_token}' if webhook_token else ''}"
-
-        return await self._req.request(Route("GET", endpoint))
+        return await self._req.request(
+            Route(
+                "GET",
+                "/webhooks/{webhook_id}/{webhook_token}"
+                if webhook_token
+                else "/webhooks/{webhook_id}",
+                webhook_id=webhook_id,
+                webhook_token=webhook_token,
+            )
+        )
 
     async def modify_webhook(
         self,
@@ -2078,10 +2418,15 @@ class HTTPClient:
 
         :return: Modified webhook object.
         """
-        endpoint = f"/webhooks/{webhook_id}{f'/{webhook_token}' if webhook_token else ''}"
-
         return await self._req.request(
-            Route("PATCH", endpoint),
+            Route(
+                "PATCH",
+                "/webhooks/{webhook_id}/{webhook_token}"
+                if webhook_token
+                else "/webhooks/{webhook_id}",
+                webhook_id=webhook_id,
+                webhook_token=webhook_token,
+            ),
             json={"name": name, "avatar": avatar, "channel_id": channel_id},
         )
 
@@ -2091,10 +2436,16 @@ class HTTPClient:
         :param webhook_id: Webhook ID snowflake.
         :param webhook_token: The token for the webhook, if given.
         """
-
-        endpoint = f"/webhooks/{webhook_id}{f'/{webhook_token}' if webhook_token else ''}"
-
-        return await self._req.request(Route("DELETE", endpoint))
+        return await self._req.request(
+            Route(
+                "DELETE",
+                "/webhooks/{webhook_id}/{webhook_token}"
+                if webhook_token
+                else "/webhooks/{webhook_id}",
+                webhook_id=webhook_id,
+                webhook_token=webhook_token,
+            )
+        )
 
     async def execute_webhook(
         self,
@@ -2116,7 +2467,12 @@ class HTTPClient:
         """
 
         return await self._req.request(
-            Route("POST", f"/webhooks/{webhook_id}/{webhook_token}"),
+            Route(
+                "POST",
+                "/webhooks/{webhook_id}/{webhook_token}",
+                webhook_id=webhook_id,
+                webhook_token=webhook_token,
+            ),
             params={"wait": wait, "thread_id": thread_id},
             json=payload,
         )
@@ -2138,7 +2494,13 @@ class HTTPClient:
         """
 
         return await self._req.request(
-            Route("POST", f"/webhooks/{webhook_id}/{webhook_token}/slack"), json=payload
+            Route(
+                "POST",
+                "/webhooks/{webhook_id}/{webhook_token}/slack",
+                webhook_id=webhook_id,
+                webhook_token=webhook_token,
+            ),
+            json=payload,
         )
 
     async def execute_github_webhook(
@@ -2158,7 +2520,13 @@ class HTTPClient:
         """
 
         return await self._req.request(
-            Route("POST", f"/webhooks/{webhook_id}/{webhook_token}/slack"), json=payload
+            Route(
+                "POST",
+                "/webhooks/{webhook_id}/{webhook_token}/slack",
+                webhook_id=webhook_id,
+                webhook_token=webhook_token,
+            ),
+            json=payload,
         )
 
     async def get_webhook_message(
@@ -2174,7 +2542,13 @@ class HTTPClient:
         """
 
         return await self._req.request(
-            Route("GET", f"/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}")
+            Route(
+                "GET",
+                "/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}",
+                webhook_id=webhook_id,
+                webhook_token=webhook_token,
+                message_id=message_id,
+            )
         )
 
     async def edit_webhook_message(
@@ -2191,7 +2565,13 @@ class HTTPClient:
         """
 
         return await self._req.request(
-            Route("PATCH", f"/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}"),
+            Route(
+                "PATCH",
+                "/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}",
+                webhook_id=webhook_id,
+                webhook_token=webhook_token,
+                message_id=message_id,
+            ),
             json=data,
         )
 
@@ -2207,7 +2587,13 @@ class HTTPClient:
         """
 
         return await self._req.request(
-            Route("DELETE", f"/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}")
+            Route(
+                "DELETE",
+                "/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}",
+                webhook_id=webhook_id,
+                webhook_token=webhook_token,
+                message_id=message_id,
+            )
         )
 
     # Emoji endpoints, a subset of guild but it should get it's own thing...
@@ -2219,7 +2605,7 @@ class HTTPClient:
         :param guild_id: Guild ID snowflake.
         :return: A list of emojis.
         """
-        return await self._req.request(Route("GET", f"/guilds/{guild_id}/emojis"))
+        return await self._req.request(Route("GET", "/guilds/{guild_id}/emojis", guild_id=guild_id))
 
     async def get_guild_emoji(self, guild_id: int, emoji_id: int) -> Emoji:
         """
@@ -2228,7 +2614,11 @@ class HTTPClient:
         :param emoji_id: Emoji ID snowflake.
         :return: Emoji object
         """
-        return await self._req.request(Route("GET", f"/guilds/{guild_id}/emojis/{emoji_id}"))
+        return await self._req.request(
+            Route(
+                "GET", "/guilds/{guild_id}/emojis/{emoji_id}", guild_id=guild_id, emoji_id=emoji_id
+            )
+        )
 
     async def create_guild_emoji(
         self, guild_id: int, data: dict, reason: Optional[str] = None
@@ -2241,7 +2631,7 @@ class HTTPClient:
         :return: An emoji object with the included parameters.
         """
         return await self._req.request(
-            Route("POST", f"/guilds/{guild_id}/emojis"), json=data, reason=reason
+            Route("POST", "/guilds/{guild_id}/emojis", guild_id=guild_id), json=data, reason=reason
         )
 
     async def modify_guild_emoji(
@@ -2256,7 +2646,14 @@ class HTTPClient:
         :return: An emoji object with updated attributes.
         """
         return await self._req.request(
-            Route("PATCH", f"/guilds/{guild_id}/emojis/{emoji_id}"), json=data, reason=reason
+            Route(
+                "PATCH",
+                "/guilds/{guild_id}/emojis/{emoji_id}",
+                guild_id=guild_id,
+                emoji_id=emoji_id,
+            ),
+            json=data,
+            reason=reason,
         )
 
     async def delete_guild_emoji(
@@ -2269,5 +2666,11 @@ class HTTPClient:
         :param reason: Optionally, give a reason.
         """
         await self._req.request(
-            Route("DELETE", f"/guilds/{guild_id}/emojis/{emoji_id}"), reason=reason
+            Route(
+                "DELETE",
+                "/guilds/{guild_id}/emojis/{emoji_id}",
+                guild_id=guild_id,
+                emoji_id=emoji_id,
+            ),
+            reason=reason,
         )
@@ -0,0 +1,191 @@
+from asyncio import get_event_loop, sleep
+from logging import Logger, basicConfig, getLogger
+from os import O_CREAT, O_RDWR, close, ftruncate, lseek
+from os import open as os_open
+from os import path, read, write
+from tempfile import gettempdir
+from time import monotonic, time
+from typing import Dict, Optional
+
+from ..base import Data
+
+try:
+    from fcntl import LOCK_EX, LOCK_UN, flock
+except ImportError:  # Windows
+    from msvcrt import LK_LOCK, LK_UNLCK, locking
+
+    flock = None
+
+basicConfig(level=Data.LOGGER)
+log: Logger = getLogger("identify")
+
+__all__ = ("IdentifyScheduler", "SharedIdentifyScheduler")
+
+
+def _lock(fd: int) -> None:
+    """Waits for the exclusive lock of a file, released by the system if its holder dies."""
+    if flock is not None:
+        flock(fd, LOCK_EX)
+        return
+    while True:
+        try:
+            # Gives up after 10 seconds, which only a stuck process holds it for.
+            locking(fd, LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+
+def _unlock(fd: int) -> None:
+    """Releases the exclusive lock of a file."""
+    if flock is not None:
+        flock(fd, LOCK_UN)
+    else:
+        locking(fd, LK_UNLCK, 1)
+
+
+class IdentifyScheduler:
+    """
+    A class representing how ``IDENTIFY`` packets of shards are paced.
+
+    Shards are bucketed by ``shard_id % max_concurrency``, and every bucket
+    may only identify once per interval, as ruled by the ``session_start_limit``
+    of the ``/gateway/bot`` endpoint.
+
+    :ivar int max_concurrency: The amount of buckets allowed to identify at once.
+    :ivar float interval: The time in seconds between two releases of a bucket.
+    """
+
+    __slots__ = ("max_concurrency", "interval", "_slots")
+
+    def __init__(self, max_concurrency: int = 1, interval: float = 5.0) -> None:
+        """
+        :param max_concurrency: The amount of buckets allowed to identify at once. Defaults to ``1``.
+        :type max_concurrency: int
+        :param interval: The time in seconds between two releases of a bucket. Defaults to ``5``.
+        :type interval: float
+        :return: None
+        """
+        self.max_concurrency = max(max_concurrency, 1)
+        self.interval = interval
+        self._slots: Dict[int, float] = {}
+
+    def bucket(self, shard_id: int) -> int:
+        """
+        Returns the identify bucket of a shard.
+
+        :param shard_id: The ID of the shard.
+        :type shard_id: int
+        :return: int
+        """
+        return shard_id % self.max_concurrency
+
+    async def reserve(self, bucket: int) -> float:
+        """
+        Reserves the next release of a bucket.
+
+        :param bucket: The bucket to reserve.
+        :type bucket: int
+        :return: The time in seconds to wait before identifying.
+        """
+        now: float = monotonic()
+        slot: float = max(now, self._slots.get(bucket, 0.0))
+        self._slots[bucket] = slot + self.interval
+        return slot - now
+
+    async def acquire(self, shard_id: int) -> None:
+        """
+        Waits until a shard is allowed to identify.
+
+        :param shard_id: The ID of the shard.
+        :type shard_id: int
+        :return: None
+        """
+        bucket: int = self.bucket(shard_id)
+        delay: float = await self.reserve(bucket)
+
+        if delay > 0:
+            log.debug(f"Shard {shard_id} is waiting {delay:.2f}s to identify (bucket {bucket}).")
+            await sleep(delay)
+
+
+class SharedIdentifyScheduler(IdentifyScheduler):
+    """
+    A class representing an identify scheduler shared by every process of a host.
+
+    The next release of each bucket is stored in a file of ``directory``, which
+    is only read and written while holding an exclusive lock on it. The lock is
+    released by the operating system when its process dies, so that it never
+    goes stale, and is taken in a worker thread so that the event loop never
+    waits on it.
+
+    .. note::
+        Every process identifying with the same token must use the same ``name``
+        and ``directory``.
+
+    :ivar int max_concurrency: The amount of buckets allowed to identify at once.
+    :ivar float interval: The time in seconds between two releases of a bucket.
+    :ivar str name: The name prefixing the bucket files.
+    :ivar str directory: The directory storing the bucket files.
+    """
+
+    __slots__ = ("name", "directory")
+
+    def __init__(
+        self,
+        max_concurrency: int = 1,
+        interval: float = 5.0,
+        name: str = "bunny",
+        directory: Optional[str] = None,
+    ) -> None:
+        """
+        :param max_concurrency: The amount of buckets allowed to identify at once. Defaults to ``1``.
+        :type max_concurrency: int
+        :param interval: The time in seconds between two releases of a bucket. Defaults to ``5``.
+        :type interval: float
+        :param name: The name prefixing the bucket files. Defaults to ``"bunny"``.
+        :type name: str
+        :param directory: The directory storing the bucket files. Defaults to the temporary directory.
+        :type directory: typing.Optional[str]
+        :return: None
+        """
+        super().__init__(max_concurrency, interval)
+        self.name = name
+        self.directory = gettempdir() if directory is None else directory
+
+    async def reserve(self, bucket: int) -> float:
+        """
+        Reserves the next release of a bucket across every process.
+
+        :param bucket: The bucket to reserve.
+        :type bucket: int
+        :return: The time in seconds to wait before identifying.
+        """
+        return await get_event_loop().run_in_executor(None, self._reserve, bucket)
+
+    def _reserve(self, bucket: int) -> float:
+        fd: int = os_open(
+            path.join(self.directory, f"{self.name}-identify-{bucket}"), O_RDWR | O_CREAT
+        )
+        try:
+            _lock(fd)
+            try:
+                try:
+                    last: float = float(read(fd, 64) or 0)
+                except ValueError:
+                    last = 0.0
+
+                now: float = time()
+                slot: float = max(now, last)
+
+                lseek(fd, 0, 0)
+                ftruncate(fd, 0)
+                write(fd, str(slot + self.interval).encode())
+                # The lock of msvcrt covers the byte at the current position.
+                lseek(fd, 0, 0)
+            finally:
+                _unlock(fd)
+        finally:
+            close(fd)
+
+        return slot - now
@@ -0,0 +1,28 @@
+from typing import Dict, Optional
+
+def _lock(fd: int) -> None: ...
+def _unlock(fd: int) -> None: ...
+
+class IdentifyScheduler:
+    __slots__ = ("max_concurrency", "interval", "_slots")
+    max_concurrency: int
+    interval: float
+    _slots: Dict[int, float]
+    def __init__(self, max_concurrency: int = 1, interval: float = 5.0) -> None: ...
+    def bucket(self, shard_id: int) -> int: ...
+    async def reserve(self, bucket: int) -> float: ...
+    async def acquire(self, shard_id: int) -> None: ...
+
+class SharedIdentifyScheduler(IdentifyScheduler):
+    __slots__ = ("name", "directory")
+    name: str
+    directory: str
+    def __init__(
+        self,
+        max_concurrency: int = 1,
+        interval: float = 5.0,
+        name: str = "bunny",
+        directory: Optional[str] = None,
+    ) -> None: ...
+    async def reserve(self, bucket: int) -> float: ...
+    def _reserve(self, bucket: int) -> float: ...
@@ -0,0 +1,499 @@
+from asyncio import get_event_loop, sleep
+from collections import deque
+from itertools import count
+from logging import Logger, basicConfig, getLogger
+from typing import Deque, Dict, Iterator, List, Optional
+from uuid import uuid4
+from zlib import Z_SYNC_FLUSH, compressobj
+
+from aiohttp import WSMsgType, web
+from orjson import dumps, loads
+
+from ..base import Data
+from . import etf
+from .enums import OpCodeType, WSCloseCodeType
+
+basicConfig(level=Data.LOGGER)
+log: Logger = getLogger("mock")
+
+__all__ = ("MockSession", "MockGateway")
+
+# Synthetic snowflakes, counting up from a fixed epoch offset.
+_snowflakes: Iterator[int] = count(906612395827023882)
+
+
+def guild_create(guild_id: int) -> dict:
+    """
+    Builds the data of a synthetic ``GUILD_CREATE`` event.
+
+    :param guild_id: The ID of the guild.
+    :type guild_id: int
+    :return: dict
+    """
+    return {
+        "id": str(guild_id),
+        "name": f"guild {guild_id}",
+        "owner_id": "242351388137488384",
+        "roles": [],
+        "emojis": [],
+        "features": [],
+        "channels": [{"id": str(guild_id + 1), "type": 0, "name": "general"}],
+        "members": [],
+        "member_count": 1,
+        "unavailable": False,
+    }
+
+
+def message_create(guild_id: int, channel_id: Optional[int] = None) -> dict:
+    """
+    Builds the data of a synthetic ``MESSAGE_CREATE`` event.
+
+    :param guild_id: The ID of the guild of the message.
+    :type guild_id: int
+    :param channel_id: The ID of the channel of the message. Defaults to the first channel of the guild.
+    :type channel_id: typing.Optional[int]
+    :return: dict
+    """
+    return {
+        "id": str(next(_snowflakes)),
+        "type": 0,
+        "content": "hello world",
+        "channel_id": str(guild_id + 1 if channel_id is None else channel_id),
+        "guild_id": str(guild_id),
+        "author": {
+            "id": "242351388137488384",
+            "username": "bunny",
+            "discriminator": "0001",
+            "avatar": None,
+        },
+        "timestamp": "2021-11-06T18:28:32.468000+00:00",
+        "edited_timestamp": None,
+        "tts": False,
+        "mention_everyone": False,
+        "mentions": [],
+        "mention_roles": [],
+        "attachments": [],
+        "embeds": [],
+        "pinned": False,
+    }
+
+
+class MockSession:
+    """
+    A class representing a gateway session of the mock gateway, outliving its connections.
+
+    :ivar str id: The ID of the session.
+    :ivar typing.Optional[typing.List[int]] shard: The ``[shard_id, shard_count]`` the session identified with.
+    :ivar int sequence: The sequence of the last dispatched event.
+    :ivar typing.Deque[dict] sent: The last dispatched packets, replayed on resume.
+    :ivar typing.Optional[aiohttp.web.WebSocketResponse] ws: The current connection of the session.
+    :ivar str encoding: The payload encoding of the current connection, either ``"json"`` or ``"etf"``.
+    """
+
+    __slots__ = ("id", "shard", "sequence", "sent", "ws", "encoding", "_zlib")
+
+    def __init__(self, shard: Optional[List[int]] = None, backlog: int = 1000) -> None:
+        """
+        :param shard: The ``[shard_id, shard_count]`` the session identified with. Defaults to ``None``.
+        :type shard: typing.Optional[typing.List[int]]
+        :param backlog: The amount of dispatched packets kept for resuming. Defaults to ``1000``.
+        :type backlog: int
+        :return: None
+        """
+        self.id = uuid4().hex
+        self.shard = shard
+        self.sequence = 0
+        self.sent: Deque[dict] = deque(maxlen=backlog)
+        self.ws = None
+        self.encoding = "json"
+        self._zlib = None
+
+    @property
+    def shard_id(self) -> int:
+        """
+        Returns the ID of the shard of the session.
+
+        :return: int
+        """
+        return self.shard[0] if self.shard else 0
+
+
+class MockGateway:
+    """
+    A class representing a local fake of the gateway and of its discovery endpoints,
+    to test reconnections, resuming and sharding without the API.
+
+    It answers ``IDENTIFY`` with ``READY`` followed by a ``GUILD_CREATE`` per guild of
+    the shard, ``RESUME`` with the missed events followed by ``RESUMED``, and heartbeats
+    with ``HEARTBEAT_ACK``. Events, floods, close codes and session invalidations
+    can then be scripted from the test.
+
+    i.e. : async with MockGateway(shards=4) as gateway: Client(..., gateway_url=gateway.url)
+
+    :ivar str host: The host the server listens on.
+    :ivar int port: The port the server listens on, picked by the system if ``0``.
+    :ivar int shards: The amount of shards recommended by ``/gateway/bot``.
+    :ivar int max_concurrency: The identify concurrency given by ``/gateway/bot``.
+    :ivar int guilds: The amount of guilds spread across the shards.
+    :ivar float heartbeat_interval: The heartbeat interval given in ``HELLO``, in milliseconds.
+    :ivar typing.Dict[str, bunny.api.mock.MockSession] sessions: The sessions by their ID.
+    :ivar int identifies: The amount of ``IDENTIFY`` packets received.
+    :ivar int resumes: The amount of successful ``RESUME`` packets received.
+    :ivar int connections: The amount of connections accepted.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        shards: int = 1,
+        max_concurrency: int = 1,
+        guilds: int = 10,
+        heartbeat_interval: float = 41250,
+    ) -> None:
+        """
+        :param host: The host to listen on. Defaults to ``"127.0.0.1"``.
+        :type host: str
+        :param port: The port to listen on. Defaults to ``0``, picked by the system.
+        :type port: int
+        :param shards: The amount of shards recommended by ``/gateway/bot``. Defaults to ``1``.
+        :type shards: int
+        :param max_concurrency: The identify concurrency given by ``/gateway/bot``. Defaults to ``1``.
+        :type max_concurrency: int
+        :param guilds: The amount of guilds spread across the shards. Defaults to ``10``.
+        :type guilds: int
+        :param heartbeat_interval: The heartbeat interval given in ``HELLO``, in milliseconds. Defaults to ``41250``.
+        :type heartbeat_interval: float
+        :return: None
+        """
+        self.host = host
+        self.port = port
+        self.shards = shards
+        self.max_concurrency = max_concurrency
+        self.guilds = guilds
+        self.heartbeat_interval = heartbeat_interval
+        self.sessions: Dict[str, MockSession] = {}
+        self.identifies = 0
+        self.resumes = 0
+        self.connections = 0
+        self._runner: Optional[web.AppRunner] = None
+
+        self.app = web.Application()
+        self.app.router.add_get("/", self.handle)
+        self.app.router.add_get("/api/v9/gateway", self.get_gateway)
+        self.app.router.add_get("/api/v9/gateway/bot", self.get_bot_gateway)
+
+    async def __aenter__(self) -> "MockGateway":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    @property
+    def url(self) -> str:
+        """
+        Returns the URL of the gateway.
+
+        :return: str
+        """
+        return f"ws://{self.host}:{self.port}/"
+
+    async def start(self) -> None:
+        """Starts listening."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        log.info(f"The mock gateway is listening on {self.url}.")
+
+    async def stop(self) -> None:
+        """Closes every connection and stops listening."""
+        for session in self.sessions.values():
+            if session.ws is not None and not session.ws.closed:
+                await session.ws.close(code=1001)
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def get_gateway(self, request: web.Request) -> web.Response:
+        return web.json_response({"url": self.url})
+
+    async def get_bot_gateway(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "url": self.url,
+                "shards": self.shards,
+                "session_start_limit": {
+                    "total": 1000,
+                    "remaining": 1000 - self.identifies,
+                    "reset_after": 86400000,
+                    "max_concurrency": self.max_concurrency,
+                },
+            }
+        )
+
+    def guild_ids(self, shard: Optional[List[int]] = None) -> List[int]:
+        """
+        Returns the IDs of the synthetic guilds of a shard, following ``(guild_id >> 22) % shard_count``.
+
+        :param shard: The ``[shard_id, shard_count]`` of the shard. Defaults to every guild.
+        :type shard: typing.Optional[typing.List[int]]
+        :return: typing.List[int]
+        """
+        ids: List[int] = [(index + 1) << 22 for index in range(self.guilds)]
+        if not shard:
+            return ids
+        return [guild_id for guild_id in ids if (guild_id >> 22) % shard[1] == shard[0]]
+
+    def connected(self, shard_id: Optional[int] = None) -> List[MockSession]:
+        """
+        Returns the sessions with an open connection.
+
+        :param shard_id: The ID of the shard to filter on. Defaults to every shard.
+        :type shard_id: typing.Optional[int]
+        :return: typing.List[bunny.api.mock.MockSession]
+        """
+        return [
+            session
+            for session in self.sessions.values()
+            if session.ws is not None
+            and not session.ws.closed
+            and (shard_id is None or session.shard_id == shard_id)
+        ]
+
+    async def send(self, session: MockSession, packet: dict) -> None:
+        """
+        Sends a packet over the connection of a session, encoded and compressed as negotiated.
+
+        :param session: The session to send to.
+        :type session: bunny.api.mock.MockSession
+        :param packet: The packet to send.
+        :type packet: dict
+        :return: None
+        """
+        if session.ws is None or session.ws.closed:
+            return
+        data: bytes = etf.encode(packet) if session.encoding == "etf" else dumps(packet)
+        if session._zlib is not None:
+            await session.ws.send_bytes(
+                session._zlib.compress(data) + session._zlib.flush(Z_SYNC_FLUSH)
+            )
+        elif session.encoding == "etf":
+            await session.ws.send_bytes(data)
+        else:
+            await session.ws.send_str(data.decode())
+
+    async def dispatch(
+        self,
+        event: str,
+        data: dict,
+        shard_id: Optional[int] = None,
+        session: Optional[MockSession] = None,
+    ) -> None:
+        """
+        Dispatches an event to every connected session, or to those of a shard.
+
+        :param event: The name of the event.
+        :type event: str
+        :param data: The data of the event.
+        :type data: dict
+        :param shard_id: The ID of the shard to dispatch to. Defaults to every shard.
+        :type shard_id: typing.Optional[int]
+        :param session: The session to dispatch to, instead of the connected ones. Defaults to ``None``.
+        :type session: typing.Optional[bunny.api.mock.MockSession]
+        :return: None
+        """
+        for _session in [session] if session is not None else self.connected(shard_id):
+            _session.sequence += 1
+            packet: dict = {
+                "op": OpCodeType.DISPATCH,
+                "t": event,
+                "s": _session.sequence,
+                "d": data,
+            }
+            _session.sent.append(packet)
+            await self.send(_session, packet)
+
+    async def flood(
+        self,
+        event: str = "MESSAGE_CREATE",
+        count: int = 1000,
+        rate: Optional[float] = None,
+        shard_id: Optional[int] = None,
+    ) -> None:
+        """
+        Dispatches a flood of synthetic ``MESSAGE_CREATE`` or ``GUILD_CREATE`` events.
+
+        :param event: The event to flood, ``"MESSAGE_CREATE"`` or ``"GUILD_CREATE"``. Defaults to ``"MESSAGE_CREATE"``.
+        :type event: str
+        :param count: The amount of events per session. Defaults to ``1000``.
+        :type count: int
+        :param rate: The amount of events per second per session. Defaults to ``None``, as fast as possible.
+        :type rate: typing.Optional[float]
+        :param shard_id: The ID of the shard to flood. Defaults to every shard.
+        :type shard_id: typing.Optional[int]
+        :return: None
+        """
+        build = message_create if event == "MESSAGE_CREATE" else guild_create
+        started: float = get_event_loop().time()
+
+        for index in range(count):
+            for session in self.connected(shard_id):
+                guild_ids: List[int] = self.guild_ids(session.shard) or [1 << 22]
+                await self.dispatch(
+                    event, build(guild_ids[index % len(guild_ids)]), session=session
+                )
+
+            if rate:
+                delay: float = started + (index + 1) / rate - get_event_loop().time()
+                await sleep(max(delay, 0))
+
+    async def close(
+        self, code: int = WSCloseCodeType.UNKNOWN_ERROR, shard_id: Optional[int] = None
+    ) -> None:
+        """
+        Closes the connections of every shard, or of one, with a close code.
+
+        :param code: The close code, i.e. one of :class:`bunny.api.enums.WSCloseCodeType`. Defaults to ``4000``.
+        :type code: int
+        :param shard_id: The ID of the shard to close. Defaults to every shard.
+        :type shard_id: typing.Optional[int]
+        :return: None
+        """
+        for session in self.connected(shard_id):
+            await session.ws.close(code=int(code))
+
+    async def invalidate(self, resumable: bool = False, shard_id: Optional[int] = None) -> None:
+        """
+        Sends ``INVALID_SESSION`` to every shard, or to one.
+
+        :param resumable: Whether the sessions may be resumed. Defaults to ``False``.
+        :type resumable: bool
+        :param shard_id: The ID of the shard to invalidate. Defaults to every shard.
+        :type shard_id: typing.Optional[int]
+        :return: None
+        """
+        for session in self.connected(shard_id):
+            if not resumable:
+                del self.sessions[session.id]
+            await self.send(session, {"op": OpCodeType.INVALIDATE_SESSION, "d": resumable})
+
+    async def reconnect(self, shard_id: Optional[int] = None) -> None:
+        """
+        Sends ``RECONNECT`` to every shard, or to one.
+
+        :param shard_id: The ID of the shard to ask to reconnect. Defaults to every shard.
+        :type shard_id: typing.Optional[int]
+        :return: None
+        """
+        for session in self.connected(shard_id):
+            await self.send(session, {"op": OpCodeType.RECONNECT, "d": None})
+
+    async def handle(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections += 1
+
+        # Packets sent before IDENTIFY or RESUME go through a session of their own.
+        session = MockSession()
+        session.ws = ws
+        session.encoding = request.query.get("encoding", "json")
+        if request.query.get("compress") == "zlib-stream":
+            session._zlib = compressobj()
+
+        await self.send(
+            session, {"op": OpCodeType.HELLO, "d": {"heartbeat_interval": self.heartbeat_interval}}
+        )
+
+        async for message in ws:
+            if message.type == WSMsgType.TEXT:
+                packet: dict = loads(message.data)
+            elif message.type == WSMsgType.BINARY:
+                packet = etf.decode(message.data)
+            else:
+                continue
+
+            op: int = packet.get("op")
+            data = packet.get("d")
+
+            if op == OpCodeType.HEARTBEAT:
+                await self.send(session, {"op": OpCodeType.HEARTBEAT_ACK, "d": None})
+
+            elif op == OpCodeType.IDENTIFY:
+                self.identifies += 1
+                encoding, zlib = session.encoding, session._zlib
+                session = MockSession(data.get("shard"))
+                session.ws, session.encoding, session._zlib = ws, encoding, zlib
+                self.sessions[session.id] = session
+                await self.dispatch(
+                    "READY",
+                    {
+                        "v": 9,
+                        "session_id": session.id,
+                        "resume_gateway_url": self.url,
+                        "user": {
+                            "id": "242351388137488384",
+                            "username": "bunny",
+                            "discriminator": "0001",
+                        },
+                        "guilds": [
+                            {"id": str(guild_id), "unavailable": True}
+                            for guild_id in self.guild_ids(session.shard)
+                        ],
+                        "shard": session.shard,
+                    },
+                    session=session,
+                )
+                for guild_id in self.guild_ids(session.shard):
+                    await self.dispatch("GUILD_CREATE", guild_create(guild_id), session=session)
+
+            elif op == OpCodeType.RESUME:
+                resumed: Optional[MockSession] = self.sessions.get(data.get("session_id"))
+                if resumed is None:
+                    await self.send(session, {"op": OpCodeType.INVALIDATE_SESSION, "d": False})
+                    continue
+
+                self.resumes += 1
+                resumed.ws, resumed.encoding, resumed._zlib = ws, session.encoding, session._zlib
+                session = resumed
+                for sent in list(session.sent):
+                    if sent["s"] > data.get("seq", 0):
+                        await self.send(session, sent)
+                await self.dispatch("RESUMED", {}, session=session)
+
+            elif op == OpCodeType.REQUEST_MEMBERS:
+                await self.dispatch(
+                    "GUILD_MEMBERS_CHUNK",
+                    {
+                        "guild_id": data["guild_id"],
+                        "members": [],
+                        "chunk_index": 0,
+                        "chunk_count": 1,
+                        "not_found": data.get("user_ids", []),
+                        "nonce": data.get("nonce"),
+                    },
+                    session=session,
+                )
+
+        return ws
+
+
+if __name__ == "__main__":
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser(description="Runs a mock gateway until interrupted.")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--shards", type=int, default=1)
+    parser.add_argument("--guilds", type=int, default=10)
+    args = parser.parse_args()
+
+    loop = get_event_loop()
+    gateway = MockGateway(port=args.port, shards=args.shards, guilds=args.guilds)
+    loop.run_until_complete(gateway.start())
+    log.info(f"Listening on {gateway.url}")
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        loop.run_until_complete(gateway.stop())
@@ -0,0 +1,72 @@
+from typing import Deque, Dict, Iterator, List, Optional
+
+from aiohttp import web
+
+_snowflakes: Iterator[int]
+
+def guild_create(guild_id: int) -> dict: ...
+def message_create(guild_id: int, channel_id: Optional[int] = None) -> dict: ...
+
+class MockSession:
+    __slots__ = ("id", "shard", "sequence", "sent", "ws", "encoding", "_zlib")
+    id: str
+    shard: Optional[List[int]]
+    sequence: int
+    sent: Deque[dict]
+    ws: Optional[web.WebSocketResponse]
+    encoding: str
+    def __init__(self, shard: Optional[List[int]] = None, backlog: int = 1000) -> None: ...
+    @property
+    def shard_id(self) -> int: ...
+
+class MockGateway:
+    host: str
+    port: int
+    shards: int
+    max_concurrency: int
+    guilds: int
+    heartbeat_interval: float
+    sessions: Dict[str, MockSession]
+    identifies: int
+    resumes: int
+    connections: int
+    app: web.Application
+    _runner: Optional[web.AppRunner]
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        shards: int = 1,
+        max_concurrency: int = 1,
+        guilds: int = 10,
+        heartbeat_interval: float = 41250,
+    ) -> None: ...
+    async def __aenter__(self) -> MockGateway: ...
+    async def __aexit__(self, *exc) -> None: ...
+    @property
+    def url(self) -> str: ...
+    async def start(self) -> None: ...
+    async def stop(self) -> None: ...
+    async def get_gateway(self, request: web.Request) -> web.Response: ...
+    async def get_bot_gateway(self, request: web.Request) -> web.Response: ...
+    def guild_ids(self, shard: Optional[List[int]] = None) -> List[int]: ...
+    def connected(self, shard_id: Optional[int] = None) -> List[MockSession]: ...
+    async def send(self, session: MockSession, packet: dict) -> None: ...
+    async def dispatch(
+        self,
+        event: str,
+        data: dict,
+        shard_id: Optional[int] = None,
+        session: Optional[MockSession] = None,
+    ) -> None: ...
+    async def flood(
+        self,
+        event: str = "MESSAGE_CREATE",
+        count: int = 1000,
+        rate: Optional[float] = None,
+        shard_id: Optional[int] = None,
+    ) -> None: ...
+    async def close(self, code: int = ..., shard_id: Optional[int] = None) -> None: ...
+    async def invalidate(self, resumable: bool = False, shard_id: Optional[int] = None) -> None: ...
+    async def reconnect(self, shard_id: Optional[int] = None) -> None: ...
+    async def handle(self, request: web.Request) -> web.WebSocketResponse: ...
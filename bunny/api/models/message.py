@@ -93,6 +93,15 @@ class Message(DictSerializerMixin):
     is never needed to be used directly.
     """
 
+    _converters = {
+        "timestamp": datetime.fromisoformat,
+        "author": User.lazy,
+    }
+    _defaults = {
+        "timestamp": datetime.utcnow,
+        "author": lambda: None,
+    }
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.timestamp = (
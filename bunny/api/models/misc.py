@@ -2,6 +2,7 @@
 # TODO: Potentially rename some model references to enums, if applicable
 # TODO: Reorganise mixins to its own thing, currently placed here because circular import sucks.
 # also, it should be serialiser* but idk, fl0w'd say something if I left it like that. /shrug
+from typing import Any, Callable, ClassVar, Dict
 
 
 class DictSerializerMixin(object):
@@ -19,13 +20,57 @@ class DictSerializerMixin(object):
 
         This does NOT convert them to its own data types, i.e. timestamps, or User within Member. This is left by
         the object that's using the mixin.
+
+    ..note::
+
+        Models created with :meth:`lazy` only hold the raw data. An attribute is read from it on first access,
+        converted by the matching callable of ``_converters`` if any, and then memoized onto the instance.
+        Attributes missing or empty in the data are given the value of the matching callable of ``_defaults``,
+        like ``__init__`` does for the model eagerly.
     """
 
+    _converters: ClassVar[Dict[str, Callable[[Any], Any]]] = {}
+    _defaults: ClassVar[Dict[str, Callable[[], Any]]] = {}
+
     def __init__(self, **kwargs):
         for key in kwargs:
             setattr(self, key, kwargs[key])
         self._json = kwargs
 
+    @classmethod
+    def lazy(cls, data: dict) -> Any:
+        """
+        Creates the model without decoding any of its data.
+
+        :param data: The data of the model.
+        :type data: dict
+        :return: An instance of the model.
+        """
+        self = cls.__new__(cls)
+        self._json = data
+        return self
+
+    def __getattr__(self, name: str) -> Any:
+        # This is only reached when the attribute was never set,
+        # which means it has yet to be read from the data of a lazy model.
+        data: dict = self.__dict__.get("_json")
+        if data is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        default = self._defaults.get(name)
+        if default is not None and not data.get(name):
+            value: Any = default()
+        elif name not in data:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        else:
+            value = data[name]
+            converter = self._converters.get(name)
+            if converter is not None and value is not None:
+                value = converter(value)
+
+        self.__dict__[name] = value
+        return value
+
 
 class Overwrite(DictSerializerMixin):
     """This is used for the PermissionOverride obj"""
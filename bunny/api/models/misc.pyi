@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Callable, ClassVar, Dict, Optional
 
 # TODO: Reorganise these models based on which big obj uses little obj
 # TODO: Potentially rename some model references to enums, if applicable
@@ -9,7 +9,12 @@ class DictSerializerMixin(object):
     __slots__ = "_json"
 
     _json: dict
+    _converters: ClassVar[Dict[str, Callable[[Any], Any]]]
+    _defaults: ClassVar[Dict[str, Callable[[], Any]]]
     def __init__(self, **kwargs): ...
+    @classmethod
+    def lazy(cls, data: dict) -> Any: ...
+    def __getattr__(self, name: str) -> Any: ...
 
 class Overwrite(DictSerializerMixin):
     __slots__ = ("_json", "id", "type", "allow", "deny")
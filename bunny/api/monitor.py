@@ -0,0 +1,197 @@
+from asyncio import Task, get_event_loop, sleep
+from logging import Logger, basicConfig, getLogger
+from time import perf_counter
+from typing import Any, Callable, Coroutine, Generator, Optional
+
+from ..base import Data
+from .dispatch import Listener
+
+basicConfig(level=Data.LOGGER)
+log: Logger = getLogger("monitor")
+
+__all__ = ("TimedCoroutine", "LoopMonitor")
+
+# Events dispatched by the monitor itself, which are never timed
+# so that a slow listener of them cannot keep reporting itself.
+MONITOR_EVENTS = ("on_loop_lag", "on_slow_handler")
+
+
+class TimedCoroutine:
+    """
+    A class representing a handler's coroutine timed one step at a time,
+    measuring how long it holds the event loop between two awaits.
+
+    :ivar str name: The name of the dispatched event.
+    :ivar typing.Callable handler: The handler the coroutine comes from.
+    :ivar typing.Coroutine coro: The coroutine to time.
+    :ivar bunny.api.monitor.LoopMonitor monitor: The monitor to report to.
+    """
+
+    __slots__ = ("name", "handler", "coro", "monitor")
+
+    def __init__(self, name: str, handler: Callable, coro: Coroutine, monitor: Any) -> None:
+        """
+        :param name: The name of the dispatched event.
+        :type name: str
+        :param handler: The handler the coroutine comes from.
+        :type handler: typing.Callable
+        :param coro: The coroutine to time.
+        :type coro: typing.Coroutine
+        :param monitor: The monitor to report to.
+        :type monitor: bunny.api.monitor.LoopMonitor
+        :return: None
+        """
+        self.name = name
+        self.handler = handler
+        self.coro = coro
+        self.monitor = monitor
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        value: Any = None
+        error: Optional[BaseException] = None
+
+        while True:
+            started: float = perf_counter()
+            try:
+                future: Any = self.coro.send(value) if error is None else self.coro.throw(error)
+            except StopIteration as stop:
+                self.monitor.step(self, perf_counter() - started)
+                return stop.value
+            except BaseException:
+                self.monitor.step(self, perf_counter() - started)
+                raise
+            self.monitor.step(self, perf_counter() - started)
+
+            try:
+                value, error = (yield future), None
+            except BaseException as exc:
+                value, error = None, exc
+
+    async def run(self) -> Any:
+        """
+        Runs the coroutine to completion.
+
+        :return: typing.Any
+        """
+        return await self
+
+
+class LoopMonitor:
+    """
+    A class representing a monitor of the event loop's lag and of handlers blocking it.
+
+    The lag is sampled by sleeping for an interval and measuring how late the loop
+    woke up. Once attached to a listener, every dispatched handler is timed between
+    its awaits, and those holding the loop longer than the threshold are reported.
+
+    .. note::
+        Handlers are only wrapped while a monitor is attached, so that
+        dispatching costs a single attribute check otherwise.
+
+    :ivar float threshold: The time in seconds the loop may be held before it is reported.
+    :ivar float interval: The interval in seconds the lag is sampled at.
+    :ivar typing.Optional[bunny.api.dispatch.Listener] listener: The listener handlers are timed on and reports are dispatched to.
+    :ivar float lag: The last sampled lag of the loop in seconds.
+    :ivar float max_lag: The highest sampled lag of the loop in seconds.
+    :ivar int samples: The amount of lag samples taken.
+    :ivar int slow_handlers: The amount of handler steps which held the loop longer than the threshold.
+    """
+
+    __slots__ = (
+        "threshold",
+        "interval",
+        "listener",
+        "lag",
+        "max_lag",
+        "samples",
+        "slow_handlers",
+        "_task",
+    )
+
+    def __init__(self, threshold: float = 0.1, interval: float = 0.5) -> None:
+        """
+        :param threshold: The time in seconds the loop may be held before it is reported. Defaults to ``0.1``.
+        :type threshold: float
+        :param interval: The interval in seconds the lag is sampled at. Defaults to ``0.5``.
+        :type interval: float
+        :return: None
+        """
+        self.threshold = threshold
+        self.interval = interval
+        self.listener = None
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.samples = 0
+        self.slow_handlers = 0
+        self._task: Optional[Task] = None
+
+    def attach(self, listener: Listener) -> None:
+        """
+        Starts timing the handlers of a listener and sampling the lag of the loop.
+
+        :param listener: The listener to monitor.
+        :type listener: bunny.api.dispatch.Listener
+        :return: None
+        """
+        self.listener = listener
+        listener.queue.monitor = self
+        if self._task is None or self._task.done():
+            self._task = get_event_loop().create_task(self.sample())
+
+    def detach(self) -> None:
+        """Stops timing handlers and sampling the lag of the loop."""
+        if self.listener is not None and self.listener.queue.monitor is self:
+            self.listener.queue.monitor = None
+        self.listener = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def wrap(self, name: str, handler: Callable, coro: Coroutine) -> Coroutine:
+        """
+        Wraps the coroutine of a dispatched handler to be timed.
+
+        :param name: The name of the dispatched event.
+        :type name: str
+        :param handler: The handler the coroutine comes from.
+        :type handler: typing.Callable
+        :param coro: The coroutine to time.
+        :type coro: typing.Coroutine
+        :return: typing.Coroutine
+        """
+        if name in MONITOR_EVENTS:
+            return coro
+        return TimedCoroutine(name, handler, coro, self).run()
+
+    def step(self, timed: TimedCoroutine, elapsed: float) -> None:
+        """
+        Records how long a step of a handler held the loop.
+
+        :param timed: The timed coroutine of the handler.
+        :type timed: bunny.api.monitor.TimedCoroutine
+        :param elapsed: The time in seconds the step took.
+        :type elapsed: float
+        :return: None
+        """
+        if elapsed < self.threshold:
+            return
+
+        self.slow_handlers += 1
+        handler: str = getattr(timed.handler, "__qualname__", repr(timed.handler))
+        log.warning(f"{handler} blocked the event loop for {elapsed:.3f}s handling {timed.name}.")
+        if self.listener is not None and self.listener.wants("on_slow_handler"):
+            self.listener.dispatch("on_slow_handler", timed.name, timed.handler, elapsed)
+
+    async def sample(self) -> None:
+        """Samples the lag of the loop every interval until detached."""
+        while True:
+            expected: float = perf_counter() + self.interval
+            await sleep(self.interval)
+            self.lag = max(perf_counter() - expected, 0.0)
+            self.max_lag = max(self.max_lag, self.lag)
+            self.samples += 1
+
+            if self.lag >= self.threshold:
+                log.warning(f"The event loop is lagging {self.lag:.3f}s behind.")
+                if self.listener is not None and self.listener.wants("on_loop_lag"):
+                    self.listener.dispatch("on_loop_lag", self.lag)
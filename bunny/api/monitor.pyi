@@ -0,0 +1,42 @@
+from asyncio import Task
+from typing import Any, Callable, Coroutine, Generator, Optional, Tuple
+
+from .dispatch import Listener
+
+MONITOR_EVENTS: Tuple[str, ...]
+
+class TimedCoroutine:
+    __slots__ = ("name", "handler", "coro", "monitor")
+    name: str
+    handler: Callable
+    coro: Coroutine
+    monitor: LoopMonitor
+    def __init__(self, name: str, handler: Callable, coro: Coroutine, monitor: Any) -> None: ...
+    def __await__(self) -> Generator[Any, Any, Any]: ...
+    async def run(self) -> Any: ...
+
+class LoopMonitor:
+    __slots__ = (
+        "threshold",
+        "interval",
+        "listener",
+        "lag",
+        "max_lag",
+        "samples",
+        "slow_handlers",
+        "_task",
+    )
+    threshold: float
+    interval: float
+    listener: Optional[Listener]
+    lag: float
+    max_lag: float
+    samples: int
+    slow_handlers: int
+    _task: Optional[Task]
+    def __init__(self, threshold: float = 0.1, interval: float = 0.5) -> None: ...
+    def attach(self, listener: Listener) -> None: ...
+    def detach(self) -> None: ...
+    def wrap(self, name: str, handler: Callable, coro: Coroutine) -> Coroutine: ...
+    def step(self, timed: TimedCoroutine, elapsed: float) -> None: ...
+    async def sample(self) -> None: ...
@@ -0,0 +1,861 @@
+from abc import ABC, abstractmethod
+from asyncio import Event, Future, Lock, Task, TimeoutError, get_event_loop, sleep, wait_for
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
+from heapq import heappop, heappush
+from itertools import count
+from logging import Logger, basicConfig, getLogger
+from sqlite3 import Connection, connect
+from time import monotonic, time
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from ..base import Data
+from .enums import GatewayPriority
+
+basicConfig(level=Data.LOGGER)
+log: Logger = getLogger("ratelimit")
+
+__all__ = (
+    "TokenBucket",
+    "GatewayRatelimiter",
+    "GlobalRatelimiter",
+    "RatelimitBackend",
+    "HTTPBucket",
+    "HTTPRatelimiter",
+    "SharedRatelimiter",
+)
+
+# Times are wall-clock times in the database, so that they are comparable across processes.
+SHARED_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS hashes (route TEXT PRIMARY KEY, hash TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS buckets (
+    key TEXT PRIMARY KEY,
+    lim INTEGER NOT NULL,
+    remaining INTEGER NOT NULL,
+    reset_at REAL NOT NULL,
+    per REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS globals (
+    namespace TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL,
+    blocked_until REAL NOT NULL
+);
+"""
+
+
+class TokenBucket:
+    """
+    A class representing a token bucket never allowing more than ``limit``
+    tokens to be taken within any window of ``per`` seconds.
+
+    .. note::
+        The bucket holds up to half of the limit by default, and refills the rest
+        over the window. A full burst followed by the refill of a whole window
+        therefore adds up to exactly the limit.
+
+    :ivar int limit: The amount of tokens allowed within a window.
+    :ivar float per: The length of a window in seconds.
+    :ivar float capacity: The amount of tokens the bucket can hold.
+    :ivar float rate: The amount of tokens refilled per second.
+    :ivar float tokens: The amount of tokens currently available.
+    :ivar float updated: The monotonic time of the last refill.
+    """
+
+    __slots__ = ("limit", "per", "capacity", "rate", "tokens", "updated")
+
+    def __init__(self, limit: int, per: float, capacity: Optional[float] = None) -> None:
+        """
+        :param limit: The amount of tokens allowed within a window.
+        :type limit: int
+        :param per: The length of a window in seconds.
+        :type per: float
+        :param capacity: The amount of tokens the bucket can hold, the rest being refilled over the window. Defaults to half of the limit.
+        :type capacity: typing.Optional[float]
+        :return: None
+        """
+        self.limit = limit
+        self.per = per
+        self.capacity = max(limit / 2, 1) if capacity is None else capacity
+        self.rate = (limit - self.capacity) / per
+        self.reset()
+
+    def reset(self) -> None:
+        """Fills the bucket back up."""
+        self.tokens = self.capacity
+        self.updated = monotonic()
+
+    def refill(self) -> None:
+        """Adds the tokens refilled since the last refill."""
+        now: float = monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, tokens: float = 1) -> float:
+        """
+        Returns the time in seconds until an amount of tokens is available.
+
+        :param tokens: The amount of tokens needed. Defaults to ``1``.
+        :type tokens: float
+        :return: float
+        """
+        self.refill()
+        if self.tokens >= tokens:
+            return 0.0
+        if self.rate <= 0:
+            return self.per
+        return (tokens - self.tokens) / self.rate
+
+    def consume(self, tokens: float = 1) -> None:
+        """
+        Takes an amount of tokens from the bucket.
+
+        :param tokens: The amount of tokens to take. Defaults to ``1``.
+        :type tokens: float
+        :return: None
+        """
+        self.refill()
+        self.tokens -= tokens
+
+
+class GatewayRatelimiter:
+    """
+    A class representing how outbound commands of a gateway connection are paced.
+
+    Commands wait in a queue ordered by their :class:`bunny.api.enums.GatewayPriority`.
+    Only heartbeats may use the last ``reserved`` tokens of the bucket, so that a
+    burst of other commands can never delay one into a zombied connection.
+
+    :ivar bunny.api.ratelimit.TokenBucket bucket: The token bucket of the connection.
+    :ivar int reserved: The amount of tokens only heartbeats may use.
+    :ivar int commands: The amount of commands let through.
+    :ivar float waited: The total time in seconds commands spent queued.
+    :ivar float max_wait: The longest time in seconds a command spent queued.
+    """
+
+    __slots__ = (
+        "bucket",
+        "reserved",
+        "commands",
+        "waited",
+        "max_wait",
+        "_queue",
+        "_counter",
+        "_wakeup",
+        "_task",
+    )
+
+    def __init__(self, limit: int = 120, per: float = 60.0, reserved: int = 3) -> None:
+        """
+        :param limit: The amount of commands allowed within a window. Defaults to ``120``.
+        :type limit: int
+        :param per: The length of a window in seconds. Defaults to ``60``.
+        :type per: float
+        :param reserved: The amount of tokens only heartbeats may use. Defaults to ``3``.
+        :type reserved: int
+        :return: None
+        """
+        self.bucket = TokenBucket(limit, per)
+        self.reserved = reserved
+        self.commands = 0
+        self.waited = 0.0
+        self.max_wait = 0.0
+        self._queue: List[Tuple[int, int, Future]] = []
+        self._counter: Iterator[int] = count()
+        self._wakeup: Optional[Event] = None
+        self._task: Optional[Task] = None
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Returns the amount of commands waiting to be sent.
+
+        :return: int
+        """
+        return len(self._queue)
+
+    @property
+    def average_wait(self) -> float:
+        """
+        Returns the average time in seconds commands spent queued.
+
+        :return: float
+        """
+        return self.waited / self.commands if self.commands else 0.0
+
+    def reset(self) -> None:
+        """Refills the bucket, as every new connection starts with a fresh limit."""
+        self.bucket.reset()
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def acquire(self, priority: int = GatewayPriority.NORMAL) -> None:
+        """
+        Waits until a command is allowed to be sent.
+
+        :param priority: The priority of the command. Defaults to :attr:`bunny.api.enums.GatewayPriority.NORMAL`.
+        :type priority: int
+        :return: None
+        """
+        loop = get_event_loop()
+        started: float = monotonic()
+        future: Future = loop.create_future()
+        heappush(self._queue, (priority, next(self._counter), future))
+
+        if self._wakeup is None:
+            self._wakeup = Event()
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._drain())
+
+        await future
+
+        elapsed: float = monotonic() - started
+        self.commands += 1
+        self.waited += elapsed
+        self.max_wait = max(self.max_wait, elapsed)
+
+        if elapsed > 1:
+            log.warning(f"A gateway command waited {elapsed:.2f}s to be sent.")
+
+    async def _drain(self) -> None:
+        while self._queue:
+            priority, _, future = self._queue[0]
+            if future.done():
+                heappop(self._queue)
+                continue
+
+            needed: int = 1 if priority <= GatewayPriority.HEARTBEAT else 1 + self.reserved
+            delay: float = self.bucket.delay(needed)
+
+            if delay > 0:
+                # A command of a higher priority being queued, i.e. a heartbeat,
+                # wakes the queue up to be looked at before the delay is over.
+                self._wakeup.clear()
+                try:
+                    await wait_for(self._wakeup.wait(), timeout=delay)
+                except TimeoutError:
+                    pass
+                continue
+
+            heappop(self._queue)
+            self.bucket.consume()
+            future.set_result(None)
+
+
+class GlobalRatelimiter:
+    """
+    A class representing the global rate limit of the HTTP API, shared by every
+    request sent with the same token.
+
+    Requests are paced by a token bucket holding a small burst and refilling
+    close to the limit, so that throughput stays right below the limit instead
+    of bursting into it. A global 429 blocks every request until it is over.
+
+    :ivar bunny.api.ratelimit.TokenBucket bucket: The token bucket of the token.
+    :ivar float blocked_until: The monotonic time a global 429 blocks requests until.
+    :ivar int requests: The amount of requests let through.
+    :ivar int delayed: The amount of requests which waited to be let through.
+    """
+
+    __slots__ = ("bucket", "blocked_until", "requests", "delayed")
+
+    def __init__(self, limit: int = 50, per: float = 1.0) -> None:
+        """
+        :param limit: The amount of requests allowed within a window. Defaults to ``50``.
+        :type limit: int
+        :param per: The length of a window in seconds. Defaults to ``1``.
+        :type per: float
+        :return: None
+        """
+        self.bucket = TokenBucket(limit, per, capacity=max(limit / 10, 1))
+        self.blocked_until = 0.0
+        self.requests = 0
+        self.delayed = 0
+
+    @classmethod
+    def shared(cls, token: str, limit: int = 50) -> "GlobalRatelimiter":
+        """
+        Returns the global rate limiter of a token, creating it if needed.
+
+        :param token: The token the requests are sent with.
+        :type token: str
+        :param limit: The amount of requests allowed per second, if created. Defaults to ``50``.
+        :type limit: int
+        :return: bunny.api.ratelimit.GlobalRatelimiter
+        """
+        ratelimiter: Optional[GlobalRatelimiter] = GLOBAL_RATELIMITERS.get(token)
+        if ratelimiter is None:
+            ratelimiter = GLOBAL_RATELIMITERS[token] = cls(limit)
+        return ratelimiter
+
+    def delay(self) -> float:
+        """
+        Returns the time in seconds until another request is allowed.
+
+        :return: float
+        """
+        return max(self.blocked_until - monotonic(), self.bucket.delay())
+
+    async def acquire(self) -> None:
+        """Waits until another request is allowed to be sent."""
+        delay: float = self.delay()
+        if delay > 0:
+            self.delayed += 1
+        while delay > 0:
+            await sleep(delay)
+            delay = self.delay()
+
+        self.bucket.consume()
+        self.requests += 1
+
+    def block(self, retry_after: float) -> None:
+        """
+        Blocks every request after a global 429.
+
+        :param retry_after: The time in seconds to block requests for.
+        :type retry_after: float
+        :return: None
+        """
+        self.blocked_until = max(self.blocked_until, monotonic() + retry_after)
+
+
+# The global rate limiters by the token they limit.
+GLOBAL_RATELIMITERS: Dict[str, GlobalRatelimiter] = {}
+
+
+class RatelimitBackend(ABC):
+    """
+    A class representing where the rate limit state of HTTP requests is kept.
+
+    A request acquires a ticket before being sent, updates the backend with the
+    headers of its response, and releases the ticket once it is done with it.
+    Subclasses implement every method below, or cannot be instantiated.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    async def acquire(self, route: Any) -> Any:
+        """
+        Waits until both the bucket of a route and the global limit allow a request.
+
+        :param route: The route to request.
+        :type route: bunny.api.http.Route
+        :return: typing.Any
+        """
+
+    @abstractmethod
+    async def update(self, route: Any, ticket: Any, headers: Mapping[str, str]) -> None:
+        """
+        Updates the bucket of a route from the headers of its response.
+
+        :param route: The route of the response.
+        :type route: bunny.api.http.Route
+        :param ticket: The ticket the request was sent with.
+        :type ticket: typing.Any
+        :param headers: The headers of the response.
+        :type headers: typing.Mapping[str, str]
+        :return: None
+        """
+
+    @abstractmethod
+    def release(self, ticket: Any) -> None:
+        """
+        Releases the ticket of a request once it is done.
+
+        :param ticket: The ticket the request was sent with.
+        :type ticket: typing.Any
+        :return: None
+        """
+
+    @abstractmethod
+    async def block(self, retry_after: float) -> None:
+        """
+        Blocks every request after a global 429.
+
+        :param retry_after: The time in seconds to block requests for.
+        :type retry_after: float
+        :return: None
+        """
+
+
+class HTTPBucket:
+    """
+    A class representing a rate limit bucket of the HTTP API, as reported
+    by the ``X-RateLimit-*`` headers of its last response.
+
+    :ivar typing.Optional[int] limit: The amount of requests allowed per reset, once known.
+    :ivar typing.Optional[int] remaining: The amount of requests left until the reset, once known.
+    :ivar float reset_at: The monotonic time the bucket resets at.
+    :ivar asyncio.Lock lock: The lock serializing the requests of the bucket.
+    :ivar float used: The monotonic time the bucket was last used at.
+    """
+
+    __slots__ = ("limit", "remaining", "reset_at", "lock", "used")
+
+    def __init__(self) -> None:
+        self.limit = None
+        self.remaining = None
+        self.reset_at = 0.0
+        self.lock = Lock()
+        self.used = monotonic()
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """
+        Updates the bucket from the headers of a response.
+
+        :param headers: The headers of the response.
+        :type headers: typing.Mapping[str, str]
+        :return: None
+        """
+        if "X-RateLimit-Remaining" not in headers:
+            return
+
+        self.limit = int(headers.get("X-RateLimit-Limit", 1))
+        self.remaining = int(headers["X-RateLimit-Remaining"])
+        self.reset_at = monotonic() + float(headers.get("X-RateLimit-Reset-After", 0))
+
+    def delay(self) -> float:
+        """
+        Returns the time in seconds to wait before the bucket allows another request.
+
+        :return: float
+        """
+        if self.remaining is None or self.remaining > 0:
+            return 0.0
+        return max(self.reset_at - monotonic(), 0.0)
+
+    def idle(self, since: float) -> bool:
+        """
+        Returns whether the bucket is unused and carries no state worth keeping.
+
+        :param since: The monotonic time the bucket must not have been used after.
+        :type since: float
+        :return: bool
+        """
+        return self.used < since and not self.lock.locked() and self.delay() == 0
+
+
+class HTTPRatelimiter(RatelimitBackend):
+    """
+    A class representing how HTTP requests are paced with the rate limit headers of the API,
+    keeping the state in memory. This is the default backend.
+
+    Routes are mapped to the bucket hash reported by ``X-RateLimit-Bucket``, and
+    buckets are keyed on that hash and the major parameters of the route, so
+    that routes sharing a bucket upstream share one here too. Requests of an
+    exhausted bucket wait for its reset before being sent, instead of after a 429.
+
+    Buckets left unused for ``idle`` seconds are evicted, as a bucket exists for
+    every channel and guild requested, so that memory stays flat over long uptimes.
+
+    :ivar float idle: The time in seconds after which an unused bucket is evicted.
+    :ivar bunny.api.ratelimit.GlobalRatelimiter global_ratelimiter: The global rate limiter requests are paced by.
+    :ivar typing.Dict[str, str] hashes: The bucket hash reported for each route template.
+    :ivar typing.Dict[str, bunny.api.ratelimit.HTTPBucket] buckets: The buckets by their key.
+    :ivar int delayed: The amount of requests which waited for a bucket to reset.
+    :ivar int evicted: The amount of idle buckets evicted.
+    """
+
+    __slots__ = ("idle", "global_ratelimiter", "hashes", "buckets", "delayed", "evicted", "_swept")
+
+    def __init__(
+        self, idle: float = 300.0, global_ratelimiter: Optional[GlobalRatelimiter] = None
+    ) -> None:
+        """
+        :param idle: The time in seconds after which an unused bucket is evicted. Defaults to ``300``.
+        :type idle: float
+        :param global_ratelimiter: The global rate limiter requests are paced by. Defaults to a new one.
+        :type global_ratelimiter: typing.Optional[bunny.api.ratelimit.GlobalRatelimiter]
+        :return: None
+        """
+        self.idle = idle
+        self.global_ratelimiter = (
+            GlobalRatelimiter() if global_ratelimiter is None else global_ratelimiter
+        )
+        self.hashes: Dict[str, str] = {}
+        self.buckets: Dict[str, HTTPBucket] = {}
+        self.delayed = 0
+        self.evicted = 0
+        self._swept = monotonic()
+
+    def key(self, route: Any) -> str:
+        """
+        Returns the key of the bucket of a route.
+
+        Until the hash of the route is known, its bucket is keyed on the route alone.
+
+        :param route: The route to key.
+        :type route: bunny.api.http.Route
+        :return: str
+        """
+        bucket_hash: Optional[str] = self.hashes.get(f"{route.method} {route.template}")
+        return route.bucket if bucket_hash is None else f"{bucket_hash}:{route.major}"
+
+    def get(self, route: Any) -> HTTPBucket:
+        """
+        Returns the bucket of a route.
+
+        :param route: The route to get the bucket of.
+        :type route: bunny.api.http.Route
+        :return: bunny.api.ratelimit.HTTPBucket
+        """
+        now: float = monotonic()
+        if now - self._swept >= self.idle:
+            self.evict(now - self.idle)
+            self._swept = now
+
+        key: str = self.key(route)
+        bucket: Optional[HTTPBucket] = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = HTTPBucket()
+        bucket.used = now
+        return bucket
+
+    def evict(self, since: float) -> int:
+        """
+        Evicts the buckets left unused since a given time.
+
+        :param since: The monotonic time the evicted buckets must not have been used after.
+        :type since: float
+        :return: int
+        """
+        idle: List[str] = [key for key, bucket in self.buckets.items() if bucket.idle(since)]
+        for key in idle:
+            del self.buckets[key]
+
+        self.evicted += len(idle)
+        if idle:
+            log.debug(f"Evicted {len(idle)} idle rate limit buckets.")
+        return len(idle)
+
+    async def acquire(self, route: Any) -> HTTPBucket:
+        """
+        Locks the bucket of a route, then waits until both it and the global limit allow a request.
+
+        :param route: The route to request.
+        :type route: bunny.api.http.Route
+        :return: bunny.api.ratelimit.HTTPBucket
+        """
+        bucket: HTTPBucket = self.get(route)
+        await bucket.lock.acquire()
+
+        try:
+            # An exhausted bucket is waited for before sending rather than after a 429.
+            delay: float = bucket.delay()
+            if delay > 0:
+                self.delayed += 1
+                log.debug(f"The bucket is exhausted, waiting {delay:.3f}s before sending.")
+                await sleep(delay)
+            await self.global_ratelimiter.acquire()
+        except BaseException:
+            bucket.lock.release()
+            raise
+
+        return bucket
+
+    def release(self, ticket: HTTPBucket) -> None:
+        """
+        Unlocks the bucket of a request once it is done.
+
+        :param ticket: The bucket the request was sent through.
+        :type ticket: bunny.api.ratelimit.HTTPBucket
+        :return: None
+        """
+        ticket.lock.release()
+
+    async def block(self, retry_after: float) -> None:
+        """
+        Blocks every request after a global 429.
+
+        :param retry_after: The time in seconds to block requests for.
+        :type retry_after: float
+        :return: None
+        """
+        self.global_ratelimiter.block(retry_after)
+
+    async def update(self, route: Any, ticket: HTTPBucket, headers: Mapping[str, str]) -> None:
+        """
+        Updates the bucket of a route from the headers of its response.
+
+        The first time a route reports its hash, its bucket is moved under the
+        key of the hash, where it is shared with the other routes of the hash.
+
+        :param route: The route of the response.
+        :type route: bunny.api.http.Route
+        :param ticket: The bucket the request was sent through.
+        :type ticket: bunny.api.ratelimit.HTTPBucket
+        :param headers: The headers of the response.
+        :type headers: typing.Mapping[str, str]
+        :return: None
+        """
+        bucket: HTTPBucket = ticket
+        bucket_hash: Optional[str] = headers.get("X-RateLimit-Bucket")
+        name: str = f"{route.method} {route.template}"
+
+        if bucket_hash is not None and self.hashes.get(name) != bucket_hash:
+            if self.buckets.get(route.bucket) is bucket:
+                del self.buckets[route.bucket]
+            self.hashes[name] = bucket_hash
+            bucket = self.buckets.setdefault(f"{bucket_hash}:{route.major}", bucket)
+
+        bucket.update(headers)
+
+
+class SharedRatelimiter(RatelimitBackend):
+    """
+    A class representing rate limit state shared by every process of a host,
+    kept in an SQLite database so that workers using the same token never
+    collectively exceed a bucket or the global limit.
+
+    Requests reserve one of the remaining requests of their bucket, and a token
+    of the global bucket, in a single transaction which SQLite serializes across
+    processes with a lock on the file. Responses then correct the reservations
+    with the headers of the API. Buckets whose limit is not known yet let
+    requests through until a response reports it.
+
+    The queries run in a worker thread of their own, one at a time, so that
+    waiting on the lock of another process never blocks the event loop.
+
+    i.e. : HTTPClient(token, ratelimiter=SharedRatelimiter("/tmp/bunny.db", token))
+
+    .. note::
+        Routes and bucket keys are stored hashed, as they may contain webhook tokens.
+
+    :ivar str path: The path of the database.
+    :ivar float idle: The time in seconds after which an unused bucket is evicted.
+    :ivar int delayed: The amount of requests of this process which waited to be sent.
+    """
+
+    __slots__ = (
+        "path",
+        "idle",
+        "delayed",
+        "_db",
+        "_executor",
+        "_namespace",
+        "_global",
+        "_swept",
+    )
+
+    def __init__(self, path: str, token: str, global_limit: int = 50, idle: float = 300.0) -> None:
+        """
+        :param path: The path of the database, shared by every process.
+        :type path: str
+        :param token: The application token the requests are sent with.
+        :type token: str
+        :param global_limit: The amount of requests allowed per second across every process. Defaults to ``50``.
+        :type global_limit: int
+        :param idle: The time in seconds after which an unused bucket is evicted. Defaults to ``300``.
+        :type idle: float
+        :return: None
+        """
+        self.path = path
+        self.idle = idle
+        self.delayed = 0
+        self._namespace: str = blake2b(token.encode(), digest_size=16).hexdigest()
+        # Only the capacity and rate of the bucket are used, its tokens being kept in the database.
+        self._global = TokenBucket(global_limit, 1.0, capacity=max(global_limit / 10, 1))
+        self._swept = time()
+
+        # Queued before any query, so that opening the database does not block either.
+        self._db: Optional[Connection] = None
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="bunny-ratelimit")
+        self._executor.submit(self._open)
+
+    def _open(self) -> None:
+        self._db = connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SHARED_SCHEMA)
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        return await get_event_loop().run_in_executor(self._executor, func, *args)
+
+    def digest(self, name: str) -> str:
+        """
+        Returns the hash a route or bucket name is stored as, unique to the token.
+
+        :param name: The name to hash.
+        :type name: str
+        :return: str
+        """
+        return blake2b(f"{self._namespace}:{name}".encode(), digest_size=16).hexdigest()
+
+    def key(self, route: Any) -> str:
+        """
+        Returns the hashed key of the bucket of a route.
+        Queries the database, so it is only called from the worker thread.
+
+        :param route: The route to key.
+        :type route: bunny.api.http.Route
+        :return: str
+        """
+        row: Optional[Tuple[str]] = self._db.execute(
+            "SELECT hash FROM hashes WHERE route = ?",
+            (self.digest(f"{route.method} {route.template}"),),
+        ).fetchone()
+        return self.digest(route.bucket if row is None else f"{row[0]}:{route.major}")
+
+    def reserve(self, route: Any) -> float:
+        """
+        Reserves a request of the bucket of a route and of the global bucket.
+        Waits on the lock of the database, so it is only called from the worker thread.
+
+        :param route: The route to request.
+        :type route: bunny.api.http.Route
+        :return: The time in seconds to wait before trying again, ``0`` once reserved.
+        :rtype: float
+        """
+        now: float = time()
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            key: str = self.key(route)
+            bucket: Optional[Tuple[int, int, float, float]] = self._db.execute(
+                "SELECT lim, remaining, reset_at, per FROM buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens, updated, blocked_until = (
+                self._db.execute(
+                    "SELECT tokens, updated, blocked_until FROM globals WHERE namespace = ?",
+                    (self._namespace,),
+                ).fetchone()
+                or (self._global.capacity, now, 0.0)
+            )
+
+            tokens = min(self._global.capacity, tokens + (now - updated) * self._global.rate)
+            delay: float = max(
+                blocked_until - now,
+                0.0 if tokens >= 1 else (1 - tokens) / self._global.rate,
+            )
+
+            if bucket is not None:
+                limit, remaining, reset_at, per = bucket
+                if reset_at <= now:
+                    # The window is over, the next one is assumed to be as long as the last.
+                    remaining, reset_at = limit, now + per
+                if remaining <= 0:
+                    delay = max(delay, reset_at - now)
+                elif delay <= 0:
+                    self._db.execute(
+                        "UPDATE buckets SET remaining = ?, reset_at = ? WHERE key = ?",
+                        (remaining - 1, reset_at, key),
+                    )
+
+            if delay <= 0:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO globals VALUES (?, ?, ?, ?)",
+                    (self._namespace, tokens - 1, now, blocked_until),
+                )
+            self._db.execute("COMMIT")
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+
+        return max(delay, 0.0)
+
+    async def acquire(self, route: Any) -> None:
+        """
+        Waits until both the bucket of a route and the global limit allow a request.
+
+        :param route: The route to request.
+        :type route: bunny.api.http.Route
+        :return: None
+        """
+        delay: float = await self._run(self.reserve, route)
+        if delay > 0:
+            self.delayed += 1
+        while delay > 0:
+            log.debug(f"The shared rate limit is exhausted, waiting {delay:.3f}s before sending.")
+            await sleep(delay)
+            delay = await self._run(self.reserve, route)
+
+    async def update(self, route: Any, ticket: None, headers: Mapping[str, str]) -> None:
+        """
+        Updates the bucket of a route from the headers of its response.
+
+        :param route: The route of the response.
+        :type route: bunny.api.http.Route
+        :param ticket: Unused, as requests reserve rather than lock their bucket.
+        :type ticket: None
+        :param headers: The headers of the response.
+        :type headers: typing.Mapping[str, str]
+        :return: None
+        """
+        await self._run(self._update, route, headers)
+
+    def _update(self, route: Any, headers: Mapping[str, str]) -> None:
+        now: float = time()
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            bucket_hash: Optional[str] = headers.get("X-RateLimit-Bucket")
+            if bucket_hash is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO hashes VALUES (?, ?)",
+                    (self.digest(f"{route.method} {route.template}"), bucket_hash),
+                )
+
+            if "X-RateLimit-Remaining" in headers:
+                reset_after: float = float(headers.get("X-RateLimit-Reset-After", 0))
+                # Within a window, other processes may have reserved requests since this
+                # one was answered, so the lowest remaining amount is kept. The reset-after
+                # of the first request of a window is the length of the window, while later
+                # ones only give what is left of it, a lower bound of its length.
+                self._db.execute(
+                    "INSERT INTO buckets VALUES (?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+                    "lim = excluded.lim, "
+                    "remaining = CASE WHEN excluded.reset_at > reset_at + per / 2 "
+                    "THEN excluded.remaining ELSE min(remaining, excluded.remaining) END, "
+                    "reset_at = max(reset_at, excluded.reset_at), "
+                    "per = CASE WHEN excluded.remaining = excluded.lim - 1 "
+                    "THEN excluded.per ELSE max(per, excluded.per) END",
+                    (
+                        self.key(route),
+                        int(headers.get("X-RateLimit-Limit", 1)),
+                        int(headers["X-RateLimit-Remaining"]),
+                        now + reset_after,
+                        reset_after,
+                    ),
+                )
+
+            if now - self._swept >= self.idle:
+                self._db.execute("DELETE FROM buckets WHERE reset_at < ?", (now - self.idle,))
+                self._swept = now
+            self._db.execute("COMMIT")
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+
+    def release(self, ticket: None) -> None:
+        """
+        Does nothing, as requests reserve rather than lock their bucket.
+
+        :param ticket: Unused.
+        :type ticket: None
+        :return: None
+        """
+
+    async def block(self, retry_after: float) -> None:
+        """
+        Blocks every request of every process after a global 429.
+
+        :param retry_after: The time in seconds to block requests for.
+        :type retry_after: float
+        :return: None
+        """
+        await self._run(self._block, time() + retry_after)
+
+    def _block(self, blocked_until: float) -> None:
+        self._db.execute(
+            "INSERT INTO globals VALUES (?, 0, ?, ?) ON CONFLICT (namespace) DO UPDATE SET "
+            "blocked_until = max(blocked_until, excluded.blocked_until)",
+            (self._namespace, time(), blocked_until),
+        )
+
+    def _close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+
+    def close(self) -> None:
+        """Closes the database, once the queries already queued are done."""
+        self._executor.submit(self._close)
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,145 @@
+from abc import ABC, abstractmethod
+from asyncio import Event, Future, Lock, Task
+from concurrent.futures import ThreadPoolExecutor
+from sqlite3 import Connection
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+SHARED_SCHEMA: str
+
+class TokenBucket:
+    __slots__ = ("limit", "per", "capacity", "rate", "tokens", "updated")
+    limit: int
+    per: float
+    capacity: float
+    rate: float
+    tokens: float
+    updated: float
+    def __init__(self, limit: int, per: float, capacity: Optional[float] = None) -> None: ...
+    def reset(self) -> None: ...
+    def refill(self) -> None: ...
+    def delay(self, tokens: float = 1) -> float: ...
+    def consume(self, tokens: float = 1) -> None: ...
+
+class GatewayRatelimiter:
+    __slots__ = (
+        "bucket",
+        "reserved",
+        "commands",
+        "waited",
+        "max_wait",
+        "_queue",
+        "_counter",
+        "_wakeup",
+        "_task",
+    )
+    bucket: TokenBucket
+    reserved: int
+    commands: int
+    waited: float
+    max_wait: float
+    _queue: List[Tuple[int, int, Future]]
+    _counter: Iterator[int]
+    _wakeup: Optional[Event]
+    _task: Optional[Task]
+    def __init__(self, limit: int = 120, per: float = 60.0, reserved: int = 3) -> None: ...
+    @property
+    def queue_depth(self) -> int: ...
+    @property
+    def average_wait(self) -> float: ...
+    def reset(self) -> None: ...
+    async def acquire(self, priority: int = ...) -> None: ...
+    async def _drain(self) -> None: ...
+
+class GlobalRatelimiter:
+    __slots__ = ("bucket", "blocked_until", "requests", "delayed")
+    bucket: TokenBucket
+    blocked_until: float
+    requests: int
+    delayed: int
+    def __init__(self, limit: int = 50, per: float = 1.0) -> None: ...
+    @classmethod
+    def shared(cls, token: str, limit: int = 50) -> GlobalRatelimiter: ...
+    def delay(self) -> float: ...
+    async def acquire(self) -> None: ...
+    def block(self, retry_after: float) -> None: ...
+
+GLOBAL_RATELIMITERS: Dict[str, GlobalRatelimiter]
+
+class RatelimitBackend(ABC):
+    __slots__ = ()
+    @abstractmethod
+    async def acquire(self, route: Any) -> Any: ...
+    @abstractmethod
+    async def update(self, route: Any, ticket: Any, headers: Mapping[str, str]) -> None: ...
+    @abstractmethod
+    def release(self, ticket: Any) -> None: ...
+    @abstractmethod
+    async def block(self, retry_after: float) -> None: ...
+
+class HTTPBucket:
+    __slots__ = ("limit", "remaining", "reset_at", "lock", "used")
+    limit: Optional[int]
+    remaining: Optional[int]
+    reset_at: float
+    lock: Lock
+    used: float
+    def __init__(self) -> None: ...
+    def update(self, headers: Mapping[str, str]) -> None: ...
+    def delay(self) -> float: ...
+    def idle(self, since: float) -> bool: ...
+
+class HTTPRatelimiter(RatelimitBackend):
+    __slots__ = ("idle", "global_ratelimiter", "hashes", "buckets", "delayed", "evicted", "_swept")
+    idle: float
+    global_ratelimiter: GlobalRatelimiter
+    hashes: Dict[str, str]
+    buckets: Dict[str, HTTPBucket]
+    delayed: int
+    evicted: int
+    _swept: float
+    def __init__(
+        self, idle: float = 300.0, global_ratelimiter: Optional[GlobalRatelimiter] = None
+    ) -> None: ...
+    def key(self, route: Any) -> str: ...
+    def get(self, route: Any) -> HTTPBucket: ...
+    def evict(self, since: float) -> int: ...
+    async def acquire(self, route: Any) -> HTTPBucket: ...
+    def release(self, ticket: HTTPBucket) -> None: ...
+    async def block(self, retry_after: float) -> None: ...
+    async def update(self, route: Any, ticket: HTTPBucket, headers: Mapping[str, str]) -> None: ...
+
+class SharedRatelimiter(RatelimitBackend):
+    __slots__ = (
+        "path",
+        "idle",
+        "delayed",
+        "_db",
+        "_executor",
+        "_namespace",
+        "_global",
+        "_swept",
+    )
+    path: str
+    idle: float
+    delayed: int
+    _db: Optional[Connection]
+    _executor: ThreadPoolExecutor
+    _namespace: str
+    _global: TokenBucket
+    _swept: float
+    def __init__(
+        self, path: str, token: str, global_limit: int = 50, idle: float = 300.0
+    ) -> None: ...
+    def _open(self) -> None: ...
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any: ...
+    def digest(self, name: str) -> str: ...
+    def key(self, route: Any) -> str: ...
+    def reserve(self, route: Any) -> float: ...
+    async def acquire(self, route: Any) -> None: ...
+    async def update(self, route: Any, ticket: None, headers: Mapping[str, str]) -> None: ...
+    def _update(self, route: Any, headers: Mapping[str, str]) -> None: ...
+    def release(self, ticket: None) -> None: ...
+    async def block(self, retry_after: float) -> None: ...
+    def _block(self, blocked_until: float) -> None: ...
+    def _close(self) -> None: ...
+    def close(self) -> None: ...
@@ -0,0 +1,347 @@
+import sys
+from asyncio import sleep
+from collections import deque
+from logging import Logger, basicConfig, getLogger
+from struct import Struct
+from time import perf_counter
+from typing import Any, BinaryIO, Deque, List, Optional, Tuple, Union
+from zlib import decompressobj
+
+from aiohttp import WSMessage, WSMsgType
+
+from ..base import Data
+from .enums import OpCodeType
+
+basicConfig(level=Data.LOGGER)
+log: Logger = getLogger("replay")
+
+__all__ = ("GatewayRecorder", "ReplaySession", "ReplayReport", "GatewayReplay")
+
+MAGIC: bytes = b"BNYREC1\n"
+
+# Every frame is written as its time since the recording started,
+# its kind and its length, followed by its raw data.
+HEADER: Struct = Struct("<dBI")
+
+BINARY: int = 0
+TEXT: int = 1
+CONNECT: int = 2
+
+
+class GatewayRecorder:
+    """
+    A class representing a recorder writing every frame received from the gateway,
+    exactly as received, to a compact binary file.
+
+    New connections are marked along with their compression, so that
+    ``zlib-stream`` recordings spanning reconnections can be inflated back.
+
+    i.e. : client.websocket.recorder = GatewayRecorder("gateway.rec")
+
+    :ivar str path: The path of the recording.
+    :ivar int frames: The amount of frames written.
+    :ivar float started: The monotonic time the recording started at.
+    """
+
+    __slots__ = ("path", "frames", "started", "_file")
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: The path of the recording.
+        :type path: str
+        :return: None
+        """
+        self.path = path
+        self.frames = 0
+        self.started = perf_counter()
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(MAGIC)
+
+    def __enter__(self) -> "GatewayRecorder":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _write(self, kind: int, data: bytes) -> None:
+        self._file.write(HEADER.pack(perf_counter() - self.started, kind, len(data)))
+        self._file.write(data)
+
+    def connect(self, compress: Optional[str] = None) -> None:
+        """
+        Marks the start of a new connection.
+
+        :param compress: The transport compression of the connection. Defaults to ``None``.
+        :type compress: typing.Optional[str]
+        :return: None
+        """
+        self._write(CONNECT, (compress or "").encode())
+
+    def write(self, data: Union[bytes, bytearray, memoryview, str]) -> None:
+        """
+        Writes a received frame.
+
+        :param data: The raw data of the frame.
+        :type data: typing.Union[bytes, bytearray, memoryview, str]
+        :return: None
+        """
+        if isinstance(data, str):
+            self._write(TEXT, data.encode())
+        else:
+            self._write(BINARY, bytes(data))
+        self.frames += 1
+
+    def close(self) -> None:
+        """Flushes and closes the recording."""
+        if not self._file.closed:
+            self._file.close()
+            log.debug(f"Recorded {self.frames} frames to {self.path}.")
+
+    @staticmethod
+    def read(path: str) -> List[Tuple[float, int, bytes]]:
+        """
+        Reads every frame of a recording.
+
+        :param path: The path of the recording.
+        :type path: str
+        :return: typing.List[typing.Tuple[float, int, bytes]]
+        """
+        with open(path, "rb") as fp:
+            if fp.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a gateway recording.")
+            content: bytes = fp.read()
+
+        frames: List[Tuple[float, int, bytes]] = []
+        offset: int = 0
+        while offset < len(content):
+            timestamp, kind, length = HEADER.unpack_from(content, offset)
+            offset += HEADER.size
+            frames.append((timestamp, kind, content[offset : offset + length]))
+            offset += length
+
+        return frames
+
+
+class ReplaySession:
+    """
+    A class representing a stand-in for a websocket connection, handing
+    queued frames to :meth:`bunny.api.gateway.WebSocket.recv`.
+
+    :ivar bool closed: Whether the session is closed.
+    :ivar typing.Optional[int] close_code: The close code of the session.
+    """
+
+    __slots__ = ("closed", "close_code", "_frames")
+
+    def __init__(self) -> None:
+        self.closed = False
+        self.close_code = None
+        self._frames: Deque[WSMessage] = deque()
+
+    def push(self, kind: int, data: bytes) -> None:
+        """
+        Queues a frame to be received.
+
+        :param kind: The kind of the frame.
+        :type kind: int
+        :param data: The raw data of the frame.
+        :type data: bytes
+        :return: None
+        """
+        if kind == TEXT:
+            self._frames.append(WSMessage(WSMsgType.TEXT, data.decode(), None))
+        else:
+            self._frames.append(WSMessage(WSMsgType.BINARY, data, None))
+
+    async def receive(self) -> Optional[WSMessage]:
+        return self._frames.popleft() if self._frames else None
+
+    async def send_str(self, data: str) -> None:
+        pass
+
+    async def send_bytes(self, data: bytes) -> None:
+        pass
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed = True
+        self.close_code = code
+
+
+class ReplayReport:
+    """
+    A class representing the measurements of a replay.
+
+    :ivar int frames: The amount of frames replayed.
+    :ivar int events: The amount of dispatched events replayed.
+    :ivar int bytes_received: The amount of bytes received, before inflation.
+    :ivar float elapsed: The time in seconds the replay took, including running the handlers.
+    :ivar typing.List[float] latencies: The time in seconds each event took from its frame to being dispatched, sorted.
+    :ivar int retained: The net amount of memory blocks the replay left allocated, ``0`` when nothing leaked.
+    """
+
+    __slots__ = ("frames", "events", "bytes_received", "elapsed", "latencies", "retained")
+
+    def __init__(
+        self,
+        frames: int,
+        events: int,
+        bytes_received: int,
+        elapsed: float,
+        latencies: List[float],
+        retained: int,
+    ) -> None:
+        """
+        :param frames: The amount of frames replayed.
+        :type frames: int
+        :param events: The amount of dispatched events replayed.
+        :type events: int
+        :param bytes_received: The amount of bytes received, before inflation.
+        :type bytes_received: int
+        :param elapsed: The time in seconds the replay took.
+        :type elapsed: float
+        :param latencies: The time in seconds each event took from its frame to being dispatched.
+        :type latencies: typing.List[float]
+        :param retained: The net amount of memory blocks the replay left allocated.
+        :type retained: int
+        :return: None
+        """
+        self.frames = frames
+        self.events = events
+        self.bytes_received = bytes_received
+        self.elapsed = elapsed
+        self.latencies = sorted(latencies)
+        self.retained = retained
+
+    @property
+    def events_per_second(self) -> float:
+        """
+        Returns the amount of events replayed per second.
+
+        :return: float
+        """
+        return self.events / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns a percentile of the per-event latency in seconds.
+
+        :param percent: The percentile, i.e. ``99``.
+        :type percent: float
+        :return: float
+        """
+        if not self.latencies:
+            return 0.0
+        index: int = min(len(self.latencies) - 1, int(len(self.latencies) * percent / 100))
+        return self.latencies[index]
+
+    @property
+    def retained_per_event(self) -> float:
+        """
+        Returns the net amount of memory blocks left allocated per event.
+
+        This is not the amount of allocations per event, as blocks freed during
+        the replay are not counted. It stays near ``0`` unless events leak memory,
+        i.e. into a cache growing with every event.
+
+        :return: float
+        """
+        return self.retained / self.events if self.events else 0.0
+
+    def summary(self) -> str:
+        """
+        Returns the measurements as human-readable lines.
+
+        :return: str
+        """
+        return "\n".join(
+            (
+                f"frames:         {self.frames:,} ({self.bytes_received:,} bytes)",
+                f"events:         {self.events:,} in {self.elapsed:.3f}s",
+                f"throughput:     {self.events_per_second:,.0f} events/s",
+                f"latency p50:    {self.percentile(50) * 1e6:,.1f}us",
+                f"latency p99:    {self.percentile(99) * 1e6:,.1f}us",
+                f"retained/event: {self.retained_per_event:,.2f} blocks",
+            )
+        )
+
+
+class GatewayReplay:
+    """
+    A class representing a replay of a recording through the whole receiving path
+    of a WebSocket: :meth:`recv`, :meth:`receive`, :meth:`handle` and the listener.
+
+    Only dispatched events are replayed, as there is no session to answer
+    ``HELLO`` or heartbeats to.
+
+    :ivar typing.Any ws: The WebSocket frames are fed to.
+    :ivar typing.List[typing.Tuple[float, int, bytes]] frames: The frames of the recording.
+    :ivar typing.Optional[float] speed: The speed relative to the recording, or ``None`` for as fast as possible.
+    """
+
+    __slots__ = ("ws", "frames", "speed")
+
+    def __init__(self, path: str, ws: Any, speed: Optional[float] = None) -> None:
+        """
+        :param path: The path of the recording.
+        :type path: str
+        :param ws: The WebSocket to feed the frames to.
+        :type ws: bunny.api.gateway.WebSocket
+        :param speed: The speed relative to the recording, i.e. ``1`` for recorded speed. Defaults to ``None``, as fast as possible.
+        :type speed: typing.Optional[float]
+        :return: None
+        """
+        self.ws = ws
+        self.frames = GatewayRecorder.read(path)
+        self.speed = speed
+
+    async def run(self) -> ReplayReport:
+        """
+        Replays every frame, then waits for the dispatched handlers to be done.
+
+        :return: bunny.api.replay.ReplayReport
+        """
+        ws = self.ws
+        session = ReplaySession()
+        ws.session = session
+        queue = ws.dispatch.queue
+        latencies: List[float] = []
+        frames: int = 0
+        received: int = ws.bytes_received
+        blocks: int = sys.getallocatedblocks()
+        started: float = perf_counter()
+
+        for timestamp, kind, data in self.frames:
+            if kind == CONNECT:
+                ws._zlib = decompressobj() if data else None
+                ws._buffer.clear()
+                continue
+
+            if self.speed:
+                delay: float = started + timestamp / self.speed - perf_counter()
+                if delay > 0:
+                    await sleep(delay)
+
+            frames += 1
+            began: float = perf_counter()
+            session.push(kind, data)
+            stream: Optional[dict] = await ws.recv()
+            if stream is None or stream.get("op") != OpCodeType.DISPATCH:
+                continue
+
+            if stream.get("s") is not None:
+                ws.sequence = stream["s"]
+            await ws.receive(stream["t"], stream["d"])
+            latencies.append(perf_counter() - began)
+
+        while queue.depth or queue.running:
+            await sleep(0)
+
+        elapsed: float = perf_counter() - started
+        return ReplayReport(
+            frames,
+            len(latencies),
+            ws.bytes_received - received,
+            elapsed,
+            latencies,
+            sys.getallocatedblocks() - blocks,
+        )
@@ -0,0 +1,72 @@
+from struct import Struct
+from typing import Any, BinaryIO, Deque, List, Optional, Tuple, Union
+
+from aiohttp import WSMessage
+
+from .gateway import WebSocket
+
+MAGIC: bytes
+HEADER: Struct
+BINARY: int
+TEXT: int
+CONNECT: int
+
+class GatewayRecorder:
+    __slots__ = ("path", "frames", "started", "_file")
+    path: str
+    frames: int
+    started: float
+    _file: BinaryIO
+    def __init__(self, path: str) -> None: ...
+    def __enter__(self) -> GatewayRecorder: ...
+    def __exit__(self, *exc: Any) -> None: ...
+    def _write(self, kind: int, data: bytes) -> None: ...
+    def connect(self, compress: Optional[str] = None) -> None: ...
+    def write(self, data: Union[bytes, bytearray, memoryview, str]) -> None: ...
+    def close(self) -> None: ...
+    @staticmethod
+    def read(path: str) -> List[Tuple[float, int, bytes]]: ...
+
+class ReplaySession:
+    __slots__ = ("closed", "close_code", "_frames")
+    closed: bool
+    close_code: Optional[int]
+    _frames: Deque[WSMessage]
+    def __init__(self) -> None: ...
+    def push(self, kind: int, data: bytes) -> None: ...
+    async def receive(self) -> Optional[WSMessage]: ...
+    async def send_str(self, data: str) -> None: ...
+    async def send_bytes(self, data: bytes) -> None: ...
+    async def close(self, code: int = 1000) -> None: ...
+
+class ReplayReport:
+    __slots__ = ("frames", "events", "bytes_received", "elapsed", "latencies", "retained")
+    frames: int
+    events: int
+    bytes_received: int
+    elapsed: float
+    latencies: List[float]
+    retained: int
+    def __init__(
+        self,
+        frames: int,
+        events: int,
+        bytes_received: int,
+        elapsed: float,
+        latencies: List[float],
+        retained: int,
+    ) -> None: ...
+    @property
+    def events_per_second(self) -> float: ...
+    def percentile(self, percent: float) -> float: ...
+    @property
+    def retained_per_event(self) -> float: ...
+    def summary(self) -> str: ...
+
+class GatewayReplay:
+    __slots__ = ("ws", "frames", "speed")
+    ws: WebSocket
+    frames: List[Tuple[float, int, bytes]]
+    speed: Optional[float]
+    def __init__(self, path: str, ws: WebSocket, speed: Optional[float] = None) -> None: ...
+    async def run(self) -> ReplayReport: ...
@@ -1,14 +1,18 @@
-from asyncio import get_event_loop
+from asyncio import gather, get_event_loop
 from logging import Logger, basicConfig, getLogger
-from typing import Any, Callable, Coroutine, List, Optional, Union
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple, Union
 
 from .api.cache import Cache, Item
+from .api.dispatch import DispatchQueue, Listener
 from .api.error import InteractionException, JSONException
 from .api.gateway import WebSocket
 from .api.http import HTTPClient
+from .api.identify import IdentifyScheduler
 from .api.models.guild import Guild
 from .api.models.intents import Intents
 from .api.models.team import Application
+from .api.monitor import LoopMonitor
+from .api.ratelimit import RatelimitBackend
 from .base import Data
 from .enums import ApplicationCommandType
 from .models.command import ApplicationCommand, Option
@@ -32,16 +36,46 @@ class Client:
     :ivar bunny.api.http.Request http: An instance of :class:`bunny.api.http.Request`.
     :ivar bunny.api.gateway.WebSocket websocket: An instance of :class:`bunny.api.gateway.WebSocket`.
     :ivar str token: The application token.
+    :ivar typing.Optional[str] gateway_url: The gateway URL to connect to instead of the one of the API.
     """
 
     def __init__(
-        self, token: str, intents: Optional[Union[Intents, List[Intents]]] = Intents.DEFAULT
+        self,
+        token: str,
+        intents: Optional[Union[Intents, List[Intents]]] = Intents.DEFAULT,
+        compress: Optional[str] = None,
+        lazy: bool = False,
+        dispatch_queue: Optional[DispatchQueue] = None,
+        monitor: Optional[LoopMonitor] = None,
+        gateway_url: Optional[str] = None,
+        encoding: str = "json",
+        offload_threshold: Optional[int] = 256 * 1024,
+        ratelimiter: Optional[RatelimitBackend] = None,
+        http_url: Optional[str] = None,
     ) -> None:
         """
         :param token: The token of the application for authentication and connection.
         :type token: str
         :param intents: The intents you wish to pass through the client. Defaults to :meth:`bunny.api.models.Intents.DEFAULT` or ``513``.
         :type intents: typing.Optional[typing.Union[bunny.api.models.Intents, typing.List[Intents]]]
+        :param compress: The gateway transport compression to use, i.e. ``"zlib-stream"``. Defaults to ``None``.
+        :type compress: typing.Optional[str]
+        :param lazy: Whether event models are decoded lazily on attribute access. Defaults to ``False``.
+        :type lazy: bool
+        :param dispatch_queue: The queue bounding how many event handlers run at once. Defaults to a new one.
+        :type dispatch_queue: typing.Optional[bunny.api.dispatch.DispatchQueue]
+        :param monitor: The monitor of the event loop's lag and of slow handlers. Defaults to ``None``.
+        :type monitor: typing.Optional[bunny.api.monitor.LoopMonitor]
+        :param gateway_url: The gateway URL to connect to instead of the one of the API, i.e. a :class:`bunny.api.mock.MockGateway`. Defaults to ``None``.
+        :type gateway_url: typing.Optional[str]
+        :param encoding: The gateway payload encoding to use, either ``"json"`` or ``"etf"``. Defaults to ``"json"``.
+        :type encoding: str
+        :param offload_threshold: The size in bytes from which gateway frames are decoded and their models built in a worker thread. Defaults to ``256 * 1024``, ``None`` to never offload.
+        :type offload_threshold: typing.Optional[int]
+        :param ratelimiter: The backend keeping the HTTP rate limits, i.e. a :class:`bunny.api.ratelimit.SharedRatelimiter` shared by several processes. Defaults to one of this process.
+        :type ratelimiter: typing.Optional[bunny.api.ratelimit.RatelimitBackend]
+        :param http_url: The URL HTTP requests are sent to instead of the API, i.e. a :class:`bunny.proxy.HTTPProxy`. Defaults to ``None``.
+        :type http_url: typing.Optional[str]
         :return: None
         """
         if isinstance(intents, list):
@@ -51,10 +85,21 @@ class Client:
             self.intents = intents
 
         self.loop = get_event_loop()
-        self.http = HTTPClient(token)
-        self.websocket = WebSocket(intents=self.intents)
+        self.http = HTTPClient(token, ratelimiter=ratelimiter, base_url=http_url)
+        self.websocket = WebSocket(
+            intents=self.intents,
+            compress=compress,
+            dispatch=Listener(dispatch_queue),
+            lazy=lazy,
+            encoding=encoding,
+            offload_threshold=offload_threshold,
+            http=self.http,
+        )
+        if monitor is not None:
+            monitor.attach(self.websocket.dispatch)
         self.me = None
         self.token = token
+        self.gateway_url = gateway_url
         cache.token = token
         # TODO: Code an internal ready state check for caching reasons.
 
@@ -62,8 +107,8 @@ class Client:
             data = self.loop.run_until_complete(self.http.get_self())
             self.me = Application(**data)
 
-        self.websocket.dispatch.register(self.raw_socket_create)
         self.websocket.dispatch.register(self.raw_guild_create, "on_guild_create")
+        self.websocket.dispatch.register(self.raw_guild_members_chunk, "on_guild_members_chunk")
 
     async def login(self, token: str) -> None:
         """
@@ -73,8 +118,7 @@ class Client:
         :type token: str
         :return: None
         """
-        while not self.websocket.closed:
-            await self.websocket.connect(token)
+        await self.websocket.run(token, self.gateway_url)
 
     def start(self) -> None:
         """Starts the client session."""
@@ -105,15 +149,52 @@ class Client:
             )
             cache.bunny.add(Item(command["id"], ApplicationCommand(**command)))
 
-    def event(self, coro: Coroutine) -> Callable[..., Any]:
+    async def wait_for(
+        self,
+        event: str,
+        check: Optional[Callable[..., bool]] = None,
+        timeout: Optional[float] = None,
+        **keys: Any,
+    ) -> Any:
+        r"""
+        Waits for an event to be dispatched from the gateway.
+
+        i.e. : ctx = await client.wait_for("interaction_create", custom_id="confirm", timeout=60)
+
+        :param event: The name of the event, with or without the ``on_`` prefix.
+        :type event: str
+        :param check: The predicate the event has to pass. Defaults to ``None``.
+        :type check: typing.Optional[typing.Callable[..., bool]]
+        :param timeout: The time in seconds to wait before raising :class:`asyncio.TimeoutError`. Defaults to ``None``.
+        :type timeout: typing.Optional[float]
+        :param \**keys: The values the keys of the event have to be equal to, i.e. ``custom_id``, ``message_id`` or ``user_id``.
+        :type \**keys: typing.Any
+        :return: typing.Any
+        """
+        return await self.websocket.dispatch.wait_for(
+            event if event.startswith("on_") else f"on_{event}", check, timeout, **keys
+        )
+
+    def event(
+        self, coro: Optional[Coroutine] = None, *, executor: Optional[str] = None
+    ) -> Callable[..., Any]:
         """
         A decorator for listening to dispatched events from the
         gateway.
 
+        i.e. : @client.event(executor="process") runs the handler in a process pool.
+
+        :param executor: The pool to run the handler in, ``"thread"`` or ``"process"``, if it is a plain function rather than a coroutine function. Defaults to the event loop.
+        :type executor: typing.Optional[str]
         :return: typing.Callable[..., typing.Any]
         """
+        if coro is None:
+            return lambda _coro: self.event(_coro, executor=executor)
+
         self.websocket.dispatch.register(
-            coro, name=coro.__name__ if coro.__name__.startswith("on") else "on_interaction_create"
+            coro,
+            name=coro.__name__ if coro.__name__.startswith("on") else "on_interaction_create",
+            executor=executor,
         )
         return coro
 
@@ -211,3 +292,174 @@ class Client:
         :return: None.
         """
         cache.guilds.add(Item(id=guild.id, value=guild))
+
+    async def raw_guild_members_chunk(self, chunk: dict) -> None:
+        """
+        This is an internal function that caches the members of streamed member chunks.
+        :param chunk: The data of the chunk, with its members already built.
+        :return: None.
+        """
+        for member in chunk["members"]:
+            cache.members.add(Item(id=f"{chunk['guild_id']}:{member.user['id']}", value=member))
+
+
+class AutoShardedClient(Client):
+    """
+    A class representing a client connection split across multiple gateway shards
+    running on the same event loop.
+
+    :ivar typing.Optional[int] shard_count: The total amount of shards of the application.
+    :ivar typing.Optional[typing.List[int]] shard_ids: The IDs of the shards this client connects.
+    :ivar typing.Dict[int, bunny.api.gateway.WebSocket] shards: The connected shards by their ID.
+    :ivar typing.Optional[str] compress: The gateway transport compression used by every shard.
+    :ivar typing.Optional[bunny.api.identify.IdentifyScheduler] identify_scheduler: The scheduler pacing ``IDENTIFY`` packets of every shard.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        intents: Optional[Union[Intents, List[Intents]]] = Intents.DEFAULT,
+        compress: Optional[str] = None,
+        shard_count: Optional[int] = None,
+        shard_ids: Optional[List[int]] = None,
+        identify_scheduler: Optional[IdentifyScheduler] = None,
+        lazy: bool = False,
+        dispatch_queue: Optional[DispatchQueue] = None,
+        monitor: Optional[LoopMonitor] = None,
+        gateway_url: Optional[str] = None,
+        encoding: str = "json",
+        offload_threshold: Optional[int] = 256 * 1024,
+        ratelimiter: Optional[RatelimitBackend] = None,
+        http_url: Optional[str] = None,
+    ) -> None:
+        """
+        :param token: The token of the application for authentication and connection.
+        :type token: str
+        :param intents: The intents you wish to pass through the client. Defaults to :meth:`bunny.api.models.Intents.DEFAULT` or ``513``.
+        :type intents: typing.Optional[typing.Union[bunny.api.models.Intents, typing.List[Intents]]]
+        :param compress: The gateway transport compression to use, i.e. ``"zlib-stream"``. Defaults to ``None``.
+        :type compress: typing.Optional[str]
+        :param shard_count: The total amount of shards. Defaults to the amount recommended by ``/gateway/bot``.
+        :type shard_count: typing.Optional[int]
+        :param shard_ids: The IDs of the shards to connect. Defaults to every shard.
+        :type shard_ids: typing.Optional[typing.List[int]]
+        :param identify_scheduler: The scheduler pacing ``IDENTIFY`` packets. Defaults to one following ``/gateway/bot``.
+        :type identify_scheduler: typing.Optional[bunny.api.identify.IdentifyScheduler]
+        :param lazy: Whether event models are decoded lazily on attribute access. Defaults to ``False``.
+        :type lazy: bool
+        :param dispatch_queue: The queue bounding how many event handlers of every shard run at once. Defaults to a new one.
+        :type dispatch_queue: typing.Optional[bunny.api.dispatch.DispatchQueue]
+        :param monitor: The monitor of the event loop's lag and of slow handlers of every shard. Defaults to ``None``.
+        :type monitor: typing.Optional[bunny.api.monitor.LoopMonitor]
+        :param gateway_url: The gateway URL every shard connects to instead of the one of the API. Defaults to ``None``.
+        :type gateway_url: typing.Optional[str]
+        :param encoding: The gateway payload encoding every shard uses, either ``"json"`` or ``"etf"``. Defaults to ``"json"``.
+        :type encoding: str
+        :param offload_threshold: The size in bytes from which frames of every shard are decoded and their models built in a worker thread. Defaults to ``256 * 1024``, ``None`` to never offload.
+        :type offload_threshold: typing.Optional[int]
+        :param ratelimiter: The backend keeping the HTTP rate limits of every shard. Defaults to one of this process.
+        :type ratelimiter: typing.Optional[bunny.api.ratelimit.RatelimitBackend]
+        :param http_url: The URL HTTP requests are sent to instead of the API, i.e. a :class:`bunny.proxy.HTTPProxy`. Defaults to ``None``.
+        :type http_url: typing.Optional[str]
+        :return: None
+        """
+        super().__init__(
+            token,
+            intents=intents,
+            compress=compress,
+            lazy=lazy,
+            dispatch_queue=dispatch_queue,
+            monitor=monitor,
+            gateway_url=gateway_url,
+            encoding=encoding,
+            offload_threshold=offload_threshold,
+            ratelimiter=ratelimiter,
+            http_url=http_url,
+        )
+        self.compress = compress
+        self.shard_count = shard_count
+        self.shard_ids = shard_ids
+        self.shards: Dict[int, WebSocket] = {}
+        self.identify_scheduler = identify_scheduler
+
+    @property
+    def latency(self) -> float:
+        """
+        Returns the average heartbeat latency of every shard in seconds.
+
+        :return: float
+        """
+        if not self.shards:
+            return float("inf")
+        return sum(shard.latency for shard in self.shards.values()) / len(self.shards)
+
+    @property
+    def latencies(self) -> List[Tuple[int, float]]:
+        """
+        Returns the heartbeat latency of each shard in seconds.
+
+        :return: typing.List[typing.Tuple[int, float]]
+        """
+        return [(shard_id, shard.latency) for shard_id, shard in self.shards.items()]
+
+    async def login(self, token: str) -> None:
+        """
+        Makes a login with the senpai API, connecting every shard.
+
+        :param token: The application token needed for authorization.
+        :type token: str
+        :return: None
+        """
+        gateway_url: Optional[str] = self.gateway_url
+        if self.shard_count is None or self.identify_scheduler is None or gateway_url is None:
+            data: dict = await self.http.get_bot_gateway_data()
+
+            # Resolved once, rather than by every shard calling ``/gateway``.
+            if gateway_url is None:
+                gateway_url = data["url"]
+
+            if self.shard_count is None:
+                self.shard_count = data["shards"]
+            if self.identify_scheduler is None:
+                self.identify_scheduler = IdentifyScheduler(
+                    data["session_start_limit"]["max_concurrency"]
+                )
+
+        shard_ids: List[int] = (
+            list(range(self.shard_count)) if self.shard_ids is None else self.shard_ids
+        )
+
+        for shard_id in shard_ids:
+            # Every shard shares the listener of the client, so events
+            # registered before logging in are dispatched from any shard.
+            self.shards[shard_id] = WebSocket(
+                intents=self.intents,
+                compress=self.compress,
+                lazy=self.websocket.lazy,
+                encoding=self.websocket.encoding,
+                offload_threshold=self.websocket.offload_threshold,
+                shard=[shard_id, self.shard_count],
+                dispatch=self.websocket.dispatch,
+                identify_scheduler=self.identify_scheduler,
+                http=self.http,
+            )
+
+        await gather(
+            *(self.launch_shard(shard, token, gateway_url) for shard in self.shards.values())
+        )
+
+    async def launch_shard(
+        self, shard: WebSocket, token: str, gateway_url: Optional[str] = None
+    ) -> None:
+        """
+        Keeps a single shard connected to the gateway.
+
+        :param shard: The shard to connect.
+        :type shard: bunny.api.gateway.WebSocket
+        :param token: The application token needed for authorization.
+        :type token: str
+        :param gateway_url: The gateway URL to connect to. Defaults to the one of the client.
+        :type gateway_url: typing.Optional[str]
+        :return: None
+        """
+        await shard.run(token, gateway_url or self.gateway_url)
@@ -1,12 +1,16 @@
 from asyncio import AbstractEventLoop
-from typing import Any, Callable, Coroutine, List, Optional, Union
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple, Union
 
 from .api.cache import Cache
+from .api.dispatch import DispatchQueue
 from .api.gateway import WebSocket
 from .api.http import HTTPClient
+from .api.identify import IdentifyScheduler
 from .api.models.guild import Guild
 from .api.models.intents import Intents
 from .api.models.user import User
+from .api.monitor import LoopMonitor
+from .api.ratelimit import RatelimitBackend
 from .enums import ApplicationCommandType
 from .models.command import Option
 
@@ -17,12 +21,33 @@ class Client:
     websocket: WebSocket
     me: Optional[User]
     token: str
+    gateway_url: Optional[str]
     def __init__(
-        self, token: str, intents: Optional[Union[Intents, List[Intents]]] = Intents.DEFAULT
+        self,
+        token: str,
+        intents: Optional[Union[Intents, List[Intents]]] = Intents.DEFAULT,
+        compress: Optional[str] = None,
+        lazy: bool = False,
+        dispatch_queue: Optional[DispatchQueue] = None,
+        monitor: Optional[LoopMonitor] = None,
+        gateway_url: Optional[str] = None,
+        encoding: str = "json",
+        offload_threshold: Optional[int] = ...,
+        ratelimiter: Optional[RatelimitBackend] = None,
+        http_url: Optional[str] = None,
     ) -> None: ...
     async def login(self, token: str) -> None: ...
     def start(self) -> None: ...
-    def event(self, coro: Coroutine) -> Callable[..., Any]: ...
+    async def wait_for(
+        self,
+        event: str,
+        check: Optional[Callable[..., bool]] = None,
+        timeout: Optional[float] = None,
+        **keys: Any,
+    ) -> Any: ...
+    def event(
+        self, coro: Optional[Coroutine] = None, *, executor: Optional[str] = None
+    ) -> Callable[..., Any]: ...
     def command(
         self,
         *,
@@ -35,3 +60,36 @@ class Client:
         # permissions: Optional[List[Permission]] = None,
     ) -> Callable[..., Any]: ...
     async def raw_guild_create(self, guild) -> None: ...
+    async def raw_guild_members_chunk(self, chunk: dict) -> None: ...
+
+class AutoShardedClient(Client):
+    compress: Optional[str]
+    shard_count: Optional[int]
+    shard_ids: Optional[List[int]]
+    shards: Dict[int, WebSocket]
+    identify_scheduler: Optional[IdentifyScheduler]
+    def __init__(
+        self,
+        token: str,
+        intents: Optional[Union[Intents, List[Intents]]] = Intents.DEFAULT,
+        compress: Optional[str] = None,
+        shard_count: Optional[int] = None,
+        shard_ids: Optional[List[int]] = None,
+        identify_scheduler: Optional[IdentifyScheduler] = None,
+        lazy: bool = False,
+        dispatch_queue: Optional[DispatchQueue] = None,
+        monitor: Optional[LoopMonitor] = None,
+        gateway_url: Optional[str] = None,
+        encoding: str = "json",
+        offload_threshold: Optional[int] = ...,
+        ratelimiter: Optional[RatelimitBackend] = None,
+        http_url: Optional[str] = None,
+    ) -> None: ...
+    @property
+    def latency(self) -> float: ...
+    @property
+    def latencies(self) -> List[Tuple[int, float]]: ...
+    async def login(self, token: str) -> None: ...
+    async def launch_shard(
+        self, shard: WebSocket, token: str, gateway_url: Optional[str] = None
+    ) -> None: ...
@@ -0,0 +1,466 @@
+from asyncio import new_event_loop, set_event_loop, sleep
+from hashlib import sha256
+from logging import Logger, basicConfig, getLogger
+from multiprocessing import get_context
+from multiprocessing.connection import Connection, wait
+from os import cpu_count
+from time import monotonic
+from typing import Callable, Dict, List, Optional, Union
+
+from .api.enums import WSCloseCodeType
+from .api.error import GatewayException
+from .api.gateway import FATAL_CLOSE_CODES
+from .api.http import HTTPClient
+from .api.identify import IdentifyScheduler, SharedIdentifyScheduler
+from .api.models.intents import Intents
+from .api.ratelimit import SharedRatelimiter
+from .base import Data
+from .client import AutoShardedClient
+
+basicConfig(level=Data.LOGGER)
+log: Logger = getLogger("cluster")
+
+__all__ = ("Cluster", "ClusterLauncher")
+
+# Workers stopped by a fatal close code exit with it minus this offset, to fit in a byte.
+FATAL_EXIT_OFFSET: int = 3900
+
+
+def _close_code(exitcode: Optional[int]) -> Optional[int]:
+    """Returns the fatal close code a worker exited on, if any."""
+    if exitcode is None or exitcode + FATAL_EXIT_OFFSET not in FATAL_CLOSE_CODES:
+        return None
+    return exitcode + FATAL_EXIT_OFFSET
+
+
+def _run_cluster(
+    token: str,
+    intents: Union[Intents, List[Intents]],
+    compress: Optional[str],
+    lazy: bool,
+    shard_count: int,
+    shard_ids: List[int],
+    identify_scheduler: IdentifyScheduler,
+    setup: Callable[[AutoShardedClient], None],
+    health_interval: float,
+    conn: Connection,
+    encoding: str,
+    offload_threshold: Optional[int],
+    ratelimiter_path: Optional[str],
+    gateway_url: Optional[str],
+    http_url: Optional[str],
+) -> None:
+    """The entrypoint of a cluster worker process."""
+    set_event_loop(new_event_loop())
+    # The rate limiter holds a database connection, so each worker opens its own.
+    ratelimiter: Optional[SharedRatelimiter] = None
+    if ratelimiter_path is not None:
+        ratelimiter = SharedRatelimiter(ratelimiter_path, token)
+
+    client = AutoShardedClient(
+        token,
+        intents=intents,
+        compress=compress,
+        lazy=lazy,
+        shard_count=shard_count,
+        shard_ids=shard_ids,
+        identify_scheduler=identify_scheduler,
+        gateway_url=gateway_url,
+        encoding=encoding,
+        offload_threshold=offload_threshold,
+        ratelimiter=ratelimiter,
+        http_url=http_url,
+    )
+    setup(client)
+
+    async def report() -> None:
+        while True:
+            conn.send(
+                {
+                    "latencies": client.latencies,
+                    "ready": [shard_id for shard_id, shard in client.shards.items() if shard.ready],
+                }
+            )
+            await sleep(health_interval)
+
+    client.loop.create_task(report())
+    try:
+        client.start()
+    except GatewayException as exc:
+        if exc.type in FATAL_CLOSE_CODES:
+            # Restarting would fail the same way, which the exit code tells the supervisor.
+            raise SystemExit(int(exc.type) - FATAL_EXIT_OFFSET)
+        raise
+
+
+class Cluster:
+    """
+    A class representing a worker process owning a contiguous range of shards.
+
+    :ivar int id: The ID of the cluster.
+    :ivar typing.List[int] shard_ids: The IDs of the shards the cluster connects.
+    :ivar typing.Any process: The worker process of the cluster.
+    :ivar typing.Optional[multiprocessing.connection.Connection] conn: The parent end of the health pipe.
+    :ivar float last_report: The monotonic time of the last health report.
+    :ivar dict health: The last health report sent by the cluster.
+    :ivar int restarts: The amount of times the cluster has been restarted.
+    :ivar int failures: The amount of consecutive failures since every shard of the cluster was last ready.
+    :ivar typing.Optional[float] restart_at: The monotonic time the cluster is restarted at, if scheduled.
+    :ivar bool stopped: Whether the cluster has stopped for good, and is not restarted anymore.
+    """
+
+    __slots__ = (
+        "id",
+        "shard_ids",
+        "process",
+        "conn",
+        "last_report",
+        "health",
+        "restarts",
+        "failures",
+        "restart_at",
+        "stopped",
+    )
+
+    def __init__(self, id: int, shard_ids: List[int]) -> None:
+        """
+        :param id: The ID of the cluster.
+        :type id: int
+        :param shard_ids: The IDs of the shards the cluster connects.
+        :type shard_ids: typing.List[int]
+        :return: None
+        """
+        self.id = id
+        self.shard_ids = shard_ids
+        self.process = None
+        self.conn = None
+        self.last_report = 0.0
+        self.health = {}
+        self.restarts = 0
+        self.failures = 0
+        self.restart_at = None
+        self.stopped = False
+
+    @property
+    def alive(self) -> bool:
+        """
+        Returns whether the worker process of the cluster is running.
+
+        :return: bool
+        """
+        return self.process is not None and self.process.is_alive()
+
+
+class ClusterLauncher:
+    """
+    A class representing a supervisor spreading shards across multiple
+    worker processes, so that gateway decoding scales across CPU cores.
+
+    .. note::
+        Workers are started with the ``spawn`` method, so ``setup`` must be a
+        picklable, module-level callable. It receives the
+        :class:`bunny.client.AutoShardedClient` of the worker and should
+        register its events and commands on it.
+
+    :ivar str token: The application token.
+    :ivar typing.Callable setup: The callable preparing the client of each worker.
+    :ivar typing.Optional[int] shard_count: The total amount of shards of the application.
+    :ivar typing.Optional[int] max_concurrency: The amount of shards allowed to identify at once.
+    :ivar int cluster_count: The amount of worker processes to spawn.
+    :ivar typing.List[bunny.cluster.Cluster] clusters: The supervised clusters.
+    :ivar float health_interval: The interval in seconds workers report their health at.
+    :ivar float health_timeout: The time in seconds without a report before a worker is restarted.
+    :ivar typing.Optional[int] max_restarts: The amount of consecutive failures after which a worker is not restarted anymore, if any.
+    :ivar float max_backoff: The maximum time in seconds to wait before restarting a worker.
+    :ivar str encoding: The gateway payload encoding of every shard.
+    :ivar typing.Optional[int] offload_threshold: The size in bytes from which frames are decoded in a worker thread.
+    :ivar typing.Optional[str] ratelimiter_path: The database every worker shares its HTTP rate limits through, if any.
+    :ivar typing.Optional[str] gateway_url: The gateway URL every shard connects to, if not the one of the API.
+    :ivar typing.Optional[str] http_url: The URL HTTP requests are sent to, if not the API.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        setup: Callable[[AutoShardedClient], None],
+        intents: Optional[Union[Intents, List[Intents]]] = Intents.DEFAULT,
+        compress: Optional[str] = None,
+        lazy: bool = False,
+        shard_count: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        cluster_count: Optional[int] = None,
+        health_interval: float = 15.0,
+        health_timeout: float = 60.0,
+        max_restarts: Optional[int] = 5,
+        max_backoff: float = 60.0,
+        encoding: str = "json",
+        offload_threshold: Optional[int] = 256 * 1024,
+        ratelimiter_path: Optional[str] = None,
+        gateway_url: Optional[str] = None,
+        http_url: Optional[str] = None,
+    ) -> None:
+        """
+        :param token: The token of the application for authentication and connection.
+        :type token: str
+        :param setup: The callable preparing the client of each worker.
+        :type setup: typing.Callable[[bunny.client.AutoShardedClient], None]
+        :param intents: The intents you wish to pass through the clients. Defaults to :meth:`bunny.api.models.Intents.DEFAULT` or ``513``.
+        :type intents: typing.Optional[typing.Union[bunny.api.models.Intents, typing.List[Intents]]]
+        :param compress: The gateway transport compression to use, i.e. ``"zlib-stream"``. Defaults to ``None``.
+        :type compress: typing.Optional[str]
+        :param lazy: Whether event models are decoded lazily on attribute access. Defaults to ``False``.
+        :type lazy: bool
+        :param shard_count: The total amount of shards. Defaults to the amount recommended by ``/gateway/bot``.
+        :type shard_count: typing.Optional[int]
+        :param max_concurrency: The amount of shards allowed to identify at once. Defaults to the limit of ``/gateway/bot``.
+        :type max_concurrency: typing.Optional[int]
+        :param cluster_count: The amount of worker processes. Defaults to the amount of CPU cores.
+        :type cluster_count: typing.Optional[int]
+        :param health_interval: The interval in seconds workers report their health at. Defaults to ``15``.
+        :type health_interval: float
+        :param health_timeout: The time in seconds without a report before a worker is restarted. Defaults to ``60``.
+        :type health_timeout: float
+        :param max_restarts: The amount of consecutive failures after which a worker is not restarted anymore, ``None`` to always restart it. Defaults to ``5``.
+        :type max_restarts: typing.Optional[int]
+        :param max_backoff: The maximum time in seconds to wait before restarting a worker. Defaults to ``60``.
+        :type max_backoff: float
+        :param encoding: The gateway payload encoding every shard uses, either ``"json"`` or ``"etf"``. Defaults to ``"json"``.
+        :type encoding: str
+        :param offload_threshold: The size in bytes from which frames are decoded and their models built in a worker thread. Defaults to ``256 * 1024``, ``None`` to never offload.
+        :type offload_threshold: typing.Optional[int]
+        :param ratelimiter_path: The database every worker keeps its HTTP rate limits in with a :class:`bunny.api.ratelimit.SharedRatelimiter`, so that they never collectively exceed them. Defaults to ``None``, each worker keeping its own.
+        :type ratelimiter_path: typing.Optional[str]
+        :param gateway_url: The gateway URL every shard connects to instead of the one of the API. Defaults to ``None``.
+        :type gateway_url: typing.Optional[str]
+        :param http_url: The URL HTTP requests are sent to instead of the API, i.e. a :class:`bunny.proxy.HTTPProxy`. Defaults to ``None``.
+        :type http_url: typing.Optional[str]
+        :return: None
+        """
+        self.token = token
+        self.setup = setup
+        self.intents = intents
+        self.compress = compress
+        self.lazy = lazy
+        self.shard_count = shard_count
+        self.max_concurrency = max_concurrency
+        self.cluster_count = cluster_count or cpu_count() or 1
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self.max_restarts = max_restarts
+        self.max_backoff = max_backoff
+        self.encoding = encoding
+        self.offload_threshold = offload_threshold
+        self.ratelimiter_path = ratelimiter_path
+        self.gateway_url = gateway_url
+        self.http_url = http_url
+        self.clusters: List[Cluster] = []
+        self._context = get_context("spawn")
+        self._closed = False
+        self._identify_scheduler = None
+
+    async def _fetch_gateway_data(self) -> dict:
+        http = HTTPClient(self.token, base_url=self.http_url)
+        try:
+            return await http.get_bot_gateway_data()
+        finally:
+            await http.req.close()
+
+    def partition(self) -> List[Cluster]:
+        """
+        Splits the shards into contiguous ranges, one per cluster.
+
+        :return: typing.List[bunny.cluster.Cluster]
+        """
+        count: int = min(self.cluster_count, self.shard_count)
+        size, extra = divmod(self.shard_count, count)
+        clusters: List[Cluster] = []
+        start: int = 0
+
+        for cluster_id in range(count):
+            end: int = start + size + (1 if cluster_id < extra else 0)
+            clusters.append(Cluster(cluster_id, list(range(start, end))))
+            start = end
+
+        return clusters
+
+    def launch(self, cluster: Cluster) -> None:
+        """
+        Spawns the worker process of a cluster.
+
+        :param cluster: The cluster to spawn.
+        :type cluster: bunny.cluster.Cluster
+        :return: None
+        """
+        parent, child = self._context.Pipe(duplex=False)
+        cluster.conn = parent
+        cluster.last_report = monotonic()
+        cluster.process = self._context.Process(
+            target=_run_cluster,
+            args=(
+                self.token,
+                self.intents,
+                self.compress,
+                self.lazy,
+                self.shard_count,
+                cluster.shard_ids,
+                self._identify_scheduler,
+                self.setup,
+                self.health_interval,
+                child,
+                self.encoding,
+                self.offload_threshold,
+                self.ratelimiter_path,
+                self.gateway_url,
+                self.http_url,
+            ),
+            name=f"bunny-cluster-{cluster.id}",
+            daemon=True,
+        )
+        cluster.process.start()
+        child.close()
+        log.info(f"Launched cluster {cluster.id} (shards {cluster.shard_ids}).")
+
+    def restart(self, cluster: Cluster) -> None:
+        """
+        Terminates the worker process of a cluster if needed and spawns a new one.
+
+        :param cluster: The cluster to restart.
+        :type cluster: bunny.cluster.Cluster
+        :return: None
+        """
+        if cluster.alive:
+            cluster.process.terminate()
+        cluster.process.join()
+        cluster.conn.close()
+        cluster.restarts += 1
+        cluster.restart_at = None
+        cluster.health = {}
+        log.warning(f"Restarting cluster {cluster.id} (restart #{cluster.restarts}).")
+        self.launch(cluster)
+
+    def fail(self, cluster: Cluster) -> None:
+        """
+        Stops a crashed or unresponsive cluster, and schedules its restart after
+        an exponential backoff, unless it failed too many times in a row.
+
+        :param cluster: The cluster which failed.
+        :type cluster: bunny.cluster.Cluster
+        :return: None
+        """
+        if cluster.alive:
+            cluster.process.terminate()
+        cluster.process.join()
+        cluster.conn.close()
+        cluster.failures += 1
+
+        if self.max_restarts is not None and cluster.failures > self.max_restarts:
+            log.error(
+                f"Cluster {cluster.id} failed {cluster.failures} times in a row, stopping it."
+            )
+            cluster.stopped = True
+            return
+
+        # Every restart identifies all the shards of the cluster again, spending the identify quota.
+        delay: float = min(self.max_backoff, 2 ** cluster.failures)
+        cluster.restart_at = monotonic() + delay
+        log.warning(f"Restarting cluster {cluster.id} in {delay:.2f}s.")
+
+    @property
+    def health(self) -> Dict[int, dict]:
+        """
+        Returns the last health report of each cluster.
+
+        :return: typing.Dict[int, dict]
+        """
+        return {cluster.id: cluster.health for cluster in self.clusters}
+
+    def supervise(self) -> None:
+        """Reads health reports and restarts crashed or unresponsive clusters until closed."""
+        while not self._closed:
+            conns: Dict[Connection, Cluster] = {
+                cluster.conn: cluster for cluster in self.clusters if not cluster.conn.closed
+            }
+            timeout: float = self.health_interval
+            for cluster in self.clusters:
+                if cluster.restart_at is not None:
+                    timeout = max(0.0, min(timeout, cluster.restart_at - monotonic()))
+
+            for conn in wait(list(conns), timeout=timeout):
+                cluster = conns[conn]
+                try:
+                    cluster.health = conn.recv()
+                except (EOFError, OSError):
+                    # The pipe is closed once the worker has exited,
+                    # which is caught by the liveness check below.
+                    conn.close()
+                    continue
+                cluster.last_report = monotonic()
+                if len(cluster.health["ready"]) == len(cluster.shard_ids):
+                    cluster.failures = 0
+
+            for cluster in self.clusters:
+                if self._closed:
+                    break
+
+                if cluster.stopped:
+                    continue
+
+                if cluster.restart_at is not None:
+                    if monotonic() >= cluster.restart_at:
+                        self.restart(cluster)
+                elif not cluster.alive:
+                    code: Optional[int] = _close_code(cluster.process.exitcode)
+                    if cluster.process.exitcode == 0:
+                        cluster.stopped = True
+                    elif code is not None:
+                        log.error(
+                            f"Cluster {cluster.id} was closed with {WSCloseCodeType(code).name}, "
+                            "which restarting would not solve."
+                        )
+                        cluster.stopped = True
+                    else:
+                        log.error(
+                            f"Cluster {cluster.id} exited with code {cluster.process.exitcode}."
+                        )
+                        self.fail(cluster)
+                elif monotonic() - cluster.last_report > self.health_timeout:
+                    log.error(f"Cluster {cluster.id} stopped reporting its health.")
+                    self.fail(cluster)
+
+            if all(cluster.stopped for cluster in self.clusters):
+                break
+
+    def start(self) -> None:
+        """Starts every cluster and supervises them, blocking until closed."""
+        if self.shard_count is None or self.max_concurrency is None:
+            loop = new_event_loop()
+            set_event_loop(loop)
+            data: dict = loop.run_until_complete(self._fetch_gateway_data())
+
+            if self.shard_count is None:
+                self.shard_count = data["shards"]
+            if self.max_concurrency is None:
+                self.max_concurrency = data["session_start_limit"]["max_concurrency"]
+
+        # Workers identify through one scheduler shared over the file system,
+        # named after the token so that different applications never share buckets.
+        self._identify_scheduler = SharedIdentifyScheduler(
+            self.max_concurrency, name=f"bunny-{sha256(self.token.encode()).hexdigest()[:16]}"
+        )
+
+        self.clusters = self.partition()
+        for cluster in self.clusters:
+            self.launch(cluster)
+
+        try:
+            self.supervise()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stops every cluster."""
+        self._closed = True
+        for cluster in self.clusters:
+            if cluster.alive:
+                cluster.process.terminate()
+                cluster.process.join()
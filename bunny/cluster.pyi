@@ -0,0 +1,90 @@
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .api.identify import IdentifyScheduler
+from .api.models.intents import Intents
+from .client import AutoShardedClient
+
+FATAL_EXIT_OFFSET: int
+
+def _close_code(exitcode: Optional[int]) -> Optional[int]: ...
+
+class Cluster:
+    __slots__ = (
+        "id",
+        "shard_ids",
+        "process",
+        "conn",
+        "last_report",
+        "health",
+        "restarts",
+        "failures",
+        "restart_at",
+        "stopped",
+    )
+    id: int
+    shard_ids: List[int]
+    process: Optional[Any]
+    conn: Optional[Connection]
+    last_report: float
+    health: dict
+    restarts: int
+    failures: int
+    restart_at: Optional[float]
+    stopped: bool
+    def __init__(self, id: int, shard_ids: List[int]) -> None: ...
+    @property
+    def alive(self) -> bool: ...
+
+class ClusterLauncher:
+    token: str
+    setup: Callable[[AutoShardedClient], None]
+    intents: Optional[Union[Intents, List[Intents]]]
+    compress: Optional[str]
+    lazy: bool
+    shard_count: Optional[int]
+    max_concurrency: Optional[int]
+    cluster_count: int
+    health_interval: float
+    health_timeout: float
+    max_restarts: Optional[int]
+    max_backoff: float
+    encoding: str
+    offload_threshold: Optional[int]
+    ratelimiter_path: Optional[str]
+    gateway_url: Optional[str]
+    http_url: Optional[str]
+    clusters: List[Cluster]
+    _context: Any
+    _closed: bool
+    _identify_scheduler: Optional[IdentifyScheduler]
+    def __init__(
+        self,
+        token: str,
+        setup: Callable[[AutoShardedClient], None],
+        intents: Optional[Union[Intents, List[Intents]]] = Intents.DEFAULT,
+        compress: Optional[str] = None,
+        lazy: bool = False,
+        shard_count: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        cluster_count: Optional[int] = None,
+        health_interval: float = 15.0,
+        health_timeout: float = 60.0,
+        max_restarts: Optional[int] = 5,
+        max_backoff: float = 60.0,
+        encoding: str = "json",
+        offload_threshold: Optional[int] = 256 * 1024,
+        ratelimiter_path: Optional[str] = None,
+        gateway_url: Optional[str] = None,
+        http_url: Optional[str] = None,
+    ) -> None: ...
+    async def _fetch_gateway_data(self) -> dict: ...
+    def partition(self) -> List[Cluster]: ...
+    def launch(self, cluster: Cluster) -> None: ...
+    def restart(self, cluster: Cluster) -> None: ...
+    def fail(self, cluster: Cluster) -> None: ...
+    @property
+    def health(self) -> Dict[int, dict]: ...
+    def supervise(self) -> None: ...
+    def start(self) -> None: ...
+    def close(self) -> None: ...
@@ -4,9 +4,14 @@ from typing import List, Optional, Union
 import bunny.client
 
 from .api.http import HTTPClient
+from .api.models.channel import Channel
+from .api.models.member import Member
 from .api.models.message import Embed, Message, MessageInteraction, MessageReference
 from .api.models.misc import DictSerializerMixin
+from .api.models.user import User
+from .enums import InteractionType
 from .models.component import Component
+from .models.misc import InteractionData
 
 
 class Context(DictSerializerMixin):
@@ -44,6 +49,17 @@ class InteractionContext(Context):
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
+        self.message = Message(**self._json["message"]) if self._json.get("message") else None
+        self.author = Member(**self._json["member"]) if self._json.get("member") else None
+        self.user = User(**self._json["user"]) if self._json.get("user") else None
+        self.channel = Channel(**self._json["channel"]) if self._json.get("channel") else None
+        self.id = self._json.get("id")
+        self.application_id = self._json.get("application_id")
+        self.type = InteractionType(int(self._json["type"])) if self._json.get("type") else None
+        self.data = InteractionData(**self._json["data"]) if self._json.get("data") else None
+        self.guild_id = self._json.get("guild_id")
+        self.channel_id = self._json.get("channel_id")
+        self.token = self._json.get("token")
 
     async def send(
         self,
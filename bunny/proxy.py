@@ -0,0 +1,260 @@
+from argparse import ArgumentParser
+from asyncio import get_event_loop
+from logging import Logger, basicConfig, getLogger
+from typing import Dict, Mapping, Optional
+
+from aiohttp import ClientError, ClientSession, TCPConnector
+from aiohttp.web import Application, AppRunner
+from aiohttp.web import Request as WebRequest
+from aiohttp.web import Response, TCPSite
+
+from .api.http import Request, Route
+from .api.ratelimit import SharedRatelimiter
+from .base import Data
+
+basicConfig(level=Data.LOGGER)
+log: Logger = getLogger("proxy")
+
+__all__ = ("route_of", "HTTPProxy")
+
+UPSTREAM: str = "https://discord.com"
+
+# Resources whose ID is a major parameter, splitting the buckets of a same route.
+MAJOR_PARAMETERS: Dict[str, str] = {
+    "channels": "channel_id",
+    "guilds": "guild_id",
+    "webhooks": "webhook_id",
+    "interactions": "webhook_id",
+}
+
+# Headers which only concern the connection they were received on.
+HOP_HEADERS: frozenset = frozenset(
+    (
+        "connection",
+        "content-encoding",
+        "content-length",
+        "host",
+        "keep-alive",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+    )
+)
+
+
+def _forwarded(headers: Mapping[str, str]) -> Dict[str, str]:
+    return {key: value for key, value in headers.items() if key.lower() not in HOP_HEADERS}
+
+
+def route_of(method: str, path: str) -> Route:
+    """
+    Builds the route of a raw request path, replacing its IDs, webhook tokens
+    and emojis with parameters, so that every message of a channel i.e. shares
+    the bucket of the channel.
+
+    :param method: The HTTP method of the request.
+    :type method: str
+    :param path: The raw path of the request, i.e. ``/api/v9/channels/1/messages/2``.
+    :type path: str
+    :return: bunny.api.http.Route
+    """
+    segments = path.split("/")
+    template = []
+    kwargs: Dict[str, str] = {}
+
+    for index, segment in enumerate(segments):
+        previous: str = segments[index - 1] if index else ""
+        name: Optional[str] = None
+
+        if previous in MAJOR_PARAMETERS and segment.isdigit():
+            name = MAJOR_PARAMETERS[previous]
+        elif index >= 2 and segments[index - 2] in ("webhooks", "interactions") and segment:
+            name = "webhook_token"
+        elif previous == "reactions" or segment.isdigit():
+            name = f"id{index}"
+
+        if name is None or name in kwargs:
+            template.append(segment.replace("{", "{{").replace("}", "}}"))
+        else:
+            kwargs[name] = segment
+            template.append(f"{{{name}}}")
+
+    return Route(method, "/".join(template), **kwargs)
+
+
+class HTTPProxy:
+    """
+    A class representing an HTTP proxy forwarding the REST requests of many
+    stateless workers to the API, keeping their rate limits in one place.
+
+    Requests are forwarded as they are, with the token of their ``Authorization``
+    header, once the buckets and the global limit of that token allow them.
+    Every token sends its requests through the same pool of upstream connections.
+
+    i.e. : ``python -m bunny.proxy --port 8080``, then
+    ``HTTPClient(token, base_url="http://localhost:8080/api/v9")`` in every worker.
+
+    :ivar str upstream: The URL of the API requests are forwarded to.
+    :ivar int global_limit: The amount of requests allowed per second for every token.
+    :ivar typing.Optional[str] path: The database several proxies share their rate limits through, if any.
+    :ivar int connections: The maximum amount of upstream connections.
+    :ivar typing.Dict[str, bunny.api.http.Request] requests: The requests of every ``Authorization`` header seen.
+    :ivar int forwarded: The amount of requests forwarded.
+    :ivar typing.Optional[aiohttp.ClientSession] session: The session of the upstream connections.
+    """
+
+    __slots__ = (
+        "upstream",
+        "global_limit",
+        "path",
+        "connections",
+        "requests",
+        "forwarded",
+        "session",
+        "_runner",
+    )
+
+    def __init__(
+        self,
+        upstream: str = UPSTREAM,
+        global_limit: int = 50,
+        path: Optional[str] = None,
+        connections: int = 100,
+    ) -> None:
+        """
+        :param upstream: The URL of the API to forward requests to. Defaults to ``"https://discord.com"``.
+        :type upstream: str
+        :param global_limit: The amount of requests allowed per second for every token. Defaults to ``50``.
+        :type global_limit: int
+        :param path: The database to keep the rate limits in with a :class:`bunny.api.ratelimit.SharedRatelimiter`, so that several proxies share them. Defaults to ``None``, in memory.
+        :type path: typing.Optional[str]
+        :param connections: The maximum amount of upstream connections. Defaults to ``100``.
+        :type connections: int
+        :return: None
+        """
+        self.upstream = upstream
+        self.global_limit = global_limit
+        self.path = path
+        self.connections = connections
+        self.requests: Dict[str, Request] = {}
+        self.forwarded = 0
+        self.session: Optional[ClientSession] = None
+        self._runner: Optional[AppRunner] = None
+
+    def request_of(self, authorization: str) -> Request:
+        """
+        Returns the requests of an ``Authorization`` header, keeping the rate limits of its token.
+
+        :param authorization: The ``Authorization`` header, i.e. ``"Bot <token>"``.
+        :type authorization: str
+        :return: bunny.api.http.Request
+        """
+        request: Optional[Request] = self.requests.get(authorization)
+        if request is None:
+            token: str = authorization.split(" ", 1)[-1]
+            ratelimiter: Optional[SharedRatelimiter] = None
+            if self.path is not None:
+                ratelimiter = SharedRatelimiter(self.path, token, self.global_limit)
+            request = self.requests[authorization] = Request(
+                token,
+                self.global_limit,
+                ratelimiter,
+                base_url=self.upstream,
+                session=self.session,
+            )
+        return request
+
+    async def handle(self, request: WebRequest) -> Response:
+        """
+        Forwards a request once its rate limits allow it, and answers with the response of the API.
+
+        :param request: The request of a worker.
+        :type request: aiohttp.web.Request
+        :return: aiohttp.web.Response
+        """
+        route: Route = route_of(request.method, request.rel_url.raw_path)
+        body: bytes = await request.read()
+
+        try:
+            status, headers, data = await self.request_of(
+                request.headers.get("Authorization", "")
+            ).send(
+                route,
+                headers=_forwarded(request.headers),
+                params=request.rel_url.query,
+                data=body or None,
+            )
+        except ClientError as exc:
+            log.error(f"Could not forward {route.method} {route.path}: {exc!r}")
+            return Response(status=502)
+
+        self.forwarded += 1
+        return Response(status=status, body=data, headers=_forwarded(headers))
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        """
+        Starts listening for requests.
+
+        :param host: The host to listen on. Defaults to ``"127.0.0.1"``.
+        :type host: str
+        :param port: The port to listen on. Defaults to ``8080``.
+        :type port: int
+        :return: None
+        """
+        self.session = ClientSession(connector=TCPConnector(limit=self.connections))
+        app = Application()
+        app.router.add_route("*", "/{path:.*}", self.handle)
+        self._runner = AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await TCPSite(self._runner, host, port).start()
+        log.info(f"Forwarding requests from {host}:{port} to {self.upstream}.")
+
+    async def close(self) -> None:
+        """Stops listening and closes the upstream connections."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+        if self.session is not None:
+            await self.session.close()
+        for request in self.requests.values():
+            if isinstance(request.ratelimiter, SharedRatelimiter):
+                request.ratelimiter.close()
+
+    def run(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        """
+        Runs the proxy until interrupted.
+
+        :param host: The host to listen on. Defaults to ``"127.0.0.1"``.
+        :type host: str
+        :param port: The port to listen on. Defaults to ``8080``.
+        :type port: int
+        :return: None
+        """
+        loop = get_event_loop()
+        loop.run_until_complete(self.start(host, port))
+        try:
+            loop.run_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            loop.run_until_complete(self.close())
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(
+        description="Forwards REST requests to the API, keeping their rate limits."
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="the host to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="the port to listen on")
+    parser.add_argument("--upstream", default=UPSTREAM, help="the URL of the API")
+    parser.add_argument(
+        "--global-limit", type=int, default=50, help="requests per second per token"
+    )
+    parser.add_argument("--shared", help="a database to share the rate limits of several proxies")
+    parser.add_argument("--connections", type=int, default=100, help="maximum upstream connections")
+    args = parser.parse_args()
+
+    HTTPProxy(args.upstream, args.global_limit, args.shared, args.connections).run(
+        args.host, args.port
+    )
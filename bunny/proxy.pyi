@@ -0,0 +1,47 @@
+from typing import Dict, Mapping, Optional
+
+from aiohttp import ClientSession
+from aiohttp.web import AppRunner
+from aiohttp.web import Request as WebRequest
+from aiohttp.web import Response
+
+from .api.http import Request, Route
+
+UPSTREAM: str
+MAJOR_PARAMETERS: Dict[str, str]
+HOP_HEADERS: frozenset
+
+def _forwarded(headers: Mapping[str, str]) -> Dict[str, str]: ...
+def route_of(method: str, path: str) -> Route: ...
+
+class HTTPProxy:
+    __slots__ = (
+        "upstream",
+        "global_limit",
+        "path",
+        "connections",
+        "requests",
+        "forwarded",
+        "session",
+        "_runner",
+    )
+    upstream: str
+    global_limit: int
+    path: Optional[str]
+    connections: int
+    requests: Dict[str, Request]
+    forwarded: int
+    session: Optional[ClientSession]
+    _runner: Optional[AppRunner]
+    def __init__(
+        self,
+        upstream: str = ...,
+        global_limit: int = 50,
+        path: Optional[str] = None,
+        connections: int = 100,
+    ) -> None: ...
+    def request_of(self, authorization: str) -> Request: ...
+    async def handle(self, request: WebRequest) -> Response: ...
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> None: ...
+    async def close(self) -> None: ...
+    def run(self, host: str = "127.0.0.1", port: int = 8080) -> None: ...